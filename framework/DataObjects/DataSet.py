@@ -488,6 +488,11 @@ class DataSet(DataObject):
       if dataIn.endswith('.csv'):
         dataIn = dataIn[:-4]
       self._fromCSV(dataIn,**kwargs)
+    elif style == 'columnar':
+      # make sure we don't include the "h5"
+      if dataIn.endswith('.h5'):
+        dataIn = dataIn[:-3]
+      self._fromColumnar(dataIn,**kwargs)
     elif style == 'dict':
       self._fromDict(dataIn,**kwargs)
     elif style == 'dataset':
@@ -753,6 +758,12 @@ class DataSet(DataObject):
       # then the metaxml
       if len(self._meta):
         self._toCSVXML(fileName,**kwargs)
+    elif style.lower() == 'columnar':
+      if len(self) == 0:
+        self.raiseAWarning('Nothing to write to columnar file!')
+      else:
+        firstIndex = kwargs.get('firstIndex',0)
+        self._toColumnar(fileName, start=firstIndex, **kwargs)
     # TODO dask?
     else:
       self.raiseAnError(NotImplementedError,'Unrecognized write style: "{}"'.format(style))
@@ -1454,6 +1465,16 @@ class DataSet(DataObject):
     # return
     return metadata
 
+  def _fromColumnar(self,fileName,**kwargs):
+    """
+      Loads a dataset from a single-file columnar (HDF5) storage.
+      Only available for specialized data objects (see HistorySet).
+      @ In, fileName, str, filename to load from (not including .h5)
+      @ In, kwargs, dict, optional arguments
+      @ Out, None
+    """
+    self.raiseAnError(NotImplementedError,'Columnar storage is not available for data objects of type "{}"!'.format(self.type))
+
   def _fromDict(self,source,dims=None,**kwargs):
     """
       Loads data from a dictionary with variables as keys and values as np.arrays of realization values
@@ -1993,6 +2014,17 @@ class DataSet(DataObject):
     ordered += list(m for m in self._metavars if m in keep)
     self._usePandasWriteCSV(filenameLocal,data,ordered,keepSampleTag = self.sampleTag in keep,mode=mode)
 
+  def _toColumnar(self,fileName,start=0,**kwargs):
+    """
+      Writes this data object to a single-file columnar (HDF5) storage.
+      Only available for specialized data objects (see HistorySet).
+      @ In, fileName, str, path/name to write file (not including .h5)
+      @ In, start, int, optional, first realization to start printing from (if > 0, implies append mode)
+      @ In, kwargs, dict, optional, keywords for options
+      @ Out, None
+    """
+    self.raiseAnError(NotImplementedError,'Columnar storage is not available for data objects of type "{}"!'.format(self.type))
+
   def _toCSVCluster(self,fileName,start,clusterLabel,**kwargs):
     """
       Writes this data object as a chain of CSVs, grouped by the cluster
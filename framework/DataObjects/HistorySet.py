@@ -29,6 +29,7 @@ except ImportError:
 import xml.etree.ElementTree as ET
 
 import abc
+import h5py
 import numpy as np
 import pandas as pd
 import xarray as xr
@@ -132,6 +133,60 @@ class HistorySet(DataSet):
 
 
   ### INTERNAL USE FUNCTIONS ###
+  def _fromColumnar(self,fileName,**kwargs):
+    """
+      Loads a dataset from the single-file columnar storage written by _toColumnar.
+      All the realizations of each variable are read at once; histories are then recovered
+      by splitting the flat output columns at the stored offsets.
+      @ In, fileName, str, filename to load from (not including .h5)
+      @ In, kwargs, dict, optional arguments
+      @ Out, None
+    """
+    self.raiseADebug('Reading columnar data from "{}"'.format(fileName+'.h5'))
+    with h5py.File(fileName+'.h5','r') as h5:
+      attrs = dict((key,self._readColumnarAttr(val)) for key,val in h5.attrs.items())
+      offsets = h5['RAVEN_offsets'][()]
+      columns = dict((var,self._readColumnarData(h5[var])) for var in h5.keys() if var != 'RAVEN_offsets')
+    pivot = attrs['pivotParameter']
+    if pivot not in self.indexes:
+      self.raiseAnError(IOError,'Importing HistorySet from columnar file: the pivot parameter "{}" stored in "{}.h5" '.format(pivot,fileName) +
+                                'does not match the pivot parameter "{}" of DataObject "{}"!'.format(', '.join(self.indexes),self.name))
+    inputMeta = list(var for var in attrs['inputMeta'].split(',') if var)
+    outputMeta = list(var for var in attrs['outputMeta'].split(',') if var)
+    # add metadata, so we get probability weights and etc
+    self.addExpectedMeta(inputMeta)
+    self.addExpectedMeta(outputMeta,dict((var,[pivot]) for var in outputMeta))
+    # check provided match needed
+    needed = set(self._orderedVars)
+    missing = needed - set(columns.keys())
+    if len(missing) > 0:
+      extra = set(columns.keys()) - needed
+      self.raiseAnError(IOError, f'Not all variables requested for data object "{self.name}" were found in "{fileName}.h5"!' +
+                        f'\nNeeded: {needed}; \nUnused: {extra}; \nMissing: {missing}')
+    for key in attrs.keys():
+      if key.startswith('RAVEN_meta_'):
+        self._meta[key[len('RAVEN_meta_'):]] = xmlUtils.staticFromString(attrs[key])
+    inputs = self._inputs + self._inputMetaVars
+    outputs = self._outputs + self._outputMetaVars
+    nSamples = len(offsets) - 1
+    lengths = np.diff(offsets)
+    # fast path: if every history shares the same pivot values, the columns are just the flattened 2D arrays
+    if self.isEmpty and nSamples > 0 and lengths[0] > 0 and (lengths == lengths[0]).all():
+      pivotValues = columns[pivot].reshape(nSamples,-1)
+      if (pivotValues == pivotValues[0]).all():
+        arrays = dict((var,([self.sampleTag],columns[var])) for var in inputs)
+        arrays.update(dict((var,([self.sampleTag,pivot],columns[var].reshape(nSamples,-1))) for var in outputs))
+        coords = {self.sampleTag:np.arange(nSamples),pivot:pivotValues[0]}
+        self.load(xr.Dataset(arrays,coords=coords),style='dataset')
+        return
+    # otherwise, split the ragged columns into one history per realization
+    data = dict((var,columns[var]) for var in inputs)
+    for var in outputs + [pivot]:
+      data[var] = np.zeros(nSamples,dtype=object)
+      for i,history in enumerate(np.split(columns[var],offsets[1:-1])):
+        data[var][i] = history
+    self.load(data,style='dict',dims=self.getDimensions())
+
   def _fromCSV(self,fileName,**kwargs):
     """
       Loads a dataset from custom RAVEN history csv.
@@ -327,6 +382,99 @@ class HistorySet(DataSet):
     else:
       self.raiseAWarning('No output space variables have been requested for DataObject "{}"! No history files will be printed!'.format(self.name))
 
+  def _toColumnar(self,fileName,start=0,**kwargs):
+    """
+      Writes this data object to a single columnar (HDF5) file.
+      Each scalar variable is stored as one column with an entry per realization; each history variable
+      (and the pivot parameter) is stored as one flat column holding all the histories end to end, and
+      "RAVEN_offsets" marks where each realization starts in the flat columns.
+      If "start" > 0, the new realizations are appended to the existing columns instead of rewriting the file.
+      @ In, fileName, str, path/name to write file (not including .h5)
+      @ In, start, int, optional, starting realization to print
+      @ In, kwargs, dict, optional, keywords for options
+      @ Out, None
+    """
+    if not self.hierarchical and 'RAVEN_isEnding' in self.getVars():
+      self.raiseAnError(NotImplementedError,'Columnar storage does not support reconstructing hierarchical histories! ' +
+                                            'Use CSV printing for DataObject "{}".'.format(self.name))
+    keep = self._getRequestedElements(kwargs)
+    pivot = self.indexes[0]
+    fileName += '.h5'
+    mode = 'a' if start > 0 and os.path.isfile(fileName) else 'w'
+    data = self._data.isel(**{self.sampleTag:slice(start,None,None)}) if mode == 'a' else self._data
+    self.raiseADebug('Printing data to columnar file: "{}"'.format(fileName))
+    inputs = list(i for i in itertools.chain(self._inputs,self._inputMetaVars) if i in keep)
+    outputs = list(o for o in itertools.chain(self._outputs,self._outputMetaVars) if o in keep)
+    columns = dict((var,data[var].values) for var in inputs)
+    columns[self.sampleTag] = data[self.sampleTag].values
+    # histories are stored in the synchronized (sample, pivot) arrays padded with NaN;
+    # mask out the padding to obtain every history end to end at once
+    if len(outputs):
+      values = dict((out,data[out].transpose(self.sampleTag,pivot).values) for out in outputs)
+      mask = np.logical_or.reduce(list(pd.notnull(val) for val in values.values()))
+      lengths = mask.sum(axis=1)
+      columns[pivot] = np.broadcast_to(data[pivot].values,mask.shape)[mask]
+      columns.update(dict((out,val[mask]) for out,val in values.items()))
+    else:
+      self.raiseAWarning('No output space variables have been requested for DataObject "{}"! No histories will be printed!'.format(self.name))
+      lengths = np.zeros(len(columns[self.sampleTag]),dtype=int)
+    with h5py.File(fileName,mode) as h5:
+      if mode == 'w':
+        h5.attrs['pivotParameter'] = pivot
+        h5.attrs['inputMeta'] = ','.join(var for var in self._inputMetaVars if var in keep)
+        h5.attrs['outputMeta'] = ','.join(var for var in self._outputMetaVars if var in keep)
+        for name,xml in self._meta.items():
+          h5.attrs['RAVEN_meta_'+name] = xmlUtils.prettify(xml.getRoot())
+        h5.create_dataset('RAVEN_offsets',data=np.zeros(1,dtype=int),maxshape=(None,),chunks=True)
+      offsets = h5['RAVEN_offsets']
+      self._appendColumnarData(h5,'RAVEN_offsets',offsets[-1]+np.cumsum(lengths))
+      for var,col in columns.items():
+        self._appendColumnarData(h5,var,col)
+
+  @staticmethod
+  def _appendColumnarData(h5,var,values):
+    """
+      Appends values to a (resizable) column of a columnar file, creating it if not present.
+      @ In, h5, h5py.File, open file to write into
+      @ In, var, str, name of the column
+      @ In, values, np.array, 1D values to append
+      @ Out, None
+    """
+    values = np.asarray(values)
+    if values.dtype.kind in ['O','U','S']:
+      values = values.astype(str).astype(object)
+      dtype = h5py.string_dtype()
+    else:
+      dtype = values.dtype
+    if var not in h5:
+      h5.create_dataset(var,data=values,dtype=dtype,maxshape=(None,),chunks=True)
+    else:
+      dset = h5[var]
+      size = dset.shape[0]
+      dset.resize((size+len(values),))
+      dset[size:] = values
+
+  @staticmethod
+  def _readColumnarAttr(val):
+    """
+      Converts an attribute of a columnar file into a native string.
+      @ In, val, str or bytes, attribute as read from file
+      @ Out, val, str, attribute as string
+    """
+    return val.decode() if isinstance(val,bytes) else val
+
+  @staticmethod
+  def _readColumnarData(dset):
+    """
+      Reads a full column of a columnar file.
+      @ In, dset, h5py.Dataset, column to read
+      @ Out, values, np.array, 1D values of the column
+    """
+    values = dset[()]
+    if h5py.check_string_dtype(dset.dtype) is not None:
+      values = np.array(list(v.decode() if isinstance(v,bytes) else v for v in values),dtype=object)
+    return values
+
   def addExpectedMeta(self,keys, params={}, overwrite=False):
     """
       Registers meta to look for in realizations.
@@ -356,6 +356,58 @@ class JobHandler(BaseType):
     # add the runner in the Queue
     self.reAddJob(internalJob)
 
+  def runJobs(self, argsList, functionToRun, prefix, uniqueHandler):
+    """
+      Runs a set of independent jobs (e.g. the sub-ROMs of a ROM to be trained) and waits for all of them.
+      The jobs are submitted as spots become available and their evaluations are collected by job index,
+      so that they do not depend on the order in which the jobs complete. If any job fails, the jobs
+      still pending are terminated and an error is raised.
+      If the jobs could not start (see canStartJobs), they are run here one after the other instead.
+      @ In, argsList, list(tuple), the arguments of functionToRun for each job
+      @ In, functionToRun, function, the function to run (decorated with Parallel)
+      @ In, prefix, string, prefix of the job identifiers (each job is identified by prefix+index)
+      @ In, uniqueHandler, string, the unique handler of the jobs, so that no one else collects them
+      @ Out, evaluations, list, the evaluation of each job, in the order of argsList
+    """
+    if not self.canStartJobs():
+      self.raiseADebug('No running spot available for jobs "{}", running them serially ...'.format(prefix))
+      return [functionToRun.original_function(*args) for args in argsList]
+    numJobs = len(argsList)
+    evaluations = [None] * numJobs
+    collected = [False] * numJobs
+    submitted = 0
+    while not all(collected):
+      for job in self.getFinished(jobIdentifier=prefix, uniqueHandler=uniqueHandler):
+        index = int(job.identifier[len(prefix):])
+        if job.getReturnCode() != 0:
+          self.terminateJobs([prefix + str(i) for i in range(submitted) if not collected[i] and i != index])
+          # drop the jobs that completed in the meanwhile
+          self.getFinished(jobIdentifier=prefix, uniqueHandler=uniqueHandler)
+          self.raiseAnError(RuntimeError, 'Job "{}" failed!'.format(job.identifier))
+        evaluations[index] = job.getEvaluation()
+        collected[index] = True
+      for _ in range(min(numJobs - submitted, self.availability())):
+        self.addJob(argsList[submitted], functionToRun, prefix + str(submitted), uniqueHandler=uniqueHandler)
+        submitted += 1
+      time.sleep(self.sleepTime)
+    return evaluations
+
+  def canStartJobs(self):
+    """
+      Checks if jobs added now could start running: a running spot must be free, and the caller
+      must not be a running job itself. A running job waiting for other jobs keeps its own spot,
+      so with batchSize=1 the jobs it adds would never start.
+      @ In, None
+      @ Out, canStart, bool, True if the jobs can start
+    """
+    current = threading.current_thread()
+    with self.__queueLock:
+      running = [run for run in self.__running + self.__clientRunning if run is not None]
+      freeSpots = self.__running.count(None)
+    if any(getattr(run, 'thread', None) is current for run in running):
+      return False
+    return freeSpots > 0
+
   def reAddJob(self, runner):
     """
       Method to add a runner object in the queue
@@ -122,6 +122,7 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType), MessageUse
     elif self.estimator.type in ['CDFAreaDifference', 'PDFCommonArea']:
       featVals = np.asarray(feat[0])
       targVals = np.asarray(targ[0])
+      pairs = []
       for hist in range(featVals.shape[1]):
         if feat[1] is not None:
           featIn = (featVals[:,hist], feat[1])
@@ -132,8 +133,8 @@ class MetricDistributor(utils.metaclass_insert(abc.ABCMeta,BaseType), MessageUse
           targIn = (targVals[:,hist], targ[1])
         else:
           targIn = targVals[:,hist]
-        out = self.estimator.evaluate(featIn, targIn)
-        dynamicOutput.append(out)
+        pairs.append((featIn, targIn))
+      dynamicOutput = list(self.estimator.evaluatePairs(pairs))
     else:
       featVals = np.asarray(feat[0])
       targVals = np.asarray(targ[0])
@@ -23,6 +23,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 #Internal Modules------------------------------------------------------------------------------------
 from .Metric import Metric
 import Metrics.MetricUtilities
+from utils import InputData, InputTypes
 #Internal Modules End--------------------------------------------------------------------------------
 
 class CDFAreaDifference(Metric):
@@ -40,6 +41,7 @@ class CDFAreaDifference(Metric):
         specifying input of cls.
     """
     inputSpecification = super(CDFAreaDifference, cls).getInputSpecification()
+    inputSpecification.addSub(InputData.parameterInputFactory("exactIntegration",contentType=InputTypes.BoolType),quantity=InputData.Quantity.zero_to_one)
 
     return inputSpecification
 
@@ -54,6 +56,8 @@ class CDFAreaDifference(Metric):
     self.acceptsProbability = True
     # If True the metric needs to be able to handle a passed in Distribution
     self.acceptsDistribution = True
+    # If True the areas between data (not distributions) are integrated exactly instead of by quadrature
+    self.exactIntegration = False
 
   def _localReadMoreXML(self,xmlNode):
     """
@@ -62,7 +66,11 @@ class CDFAreaDifference(Metric):
       @ In, xmlNode, xml.etree.Element, Xml element node
       @ Out, None
     """
-    pass
+    paramInput = CDFAreaDifference.getInputSpecification()()
+    paramInput.parseNode(xmlNode)
+    for child in paramInput.subparts:
+      if child.getName() == "exactIntegration":
+        self.exactIntegration = child.value
 
   def __evaluateLocal__(self, x, y, weights = None, axis = 0, **kwargs):
     """
@@ -76,5 +84,13 @@ class CDFAreaDifference(Metric):
       @ In, kwargs,dict, dictionary of parameters characteristic of each metric
       @ Out, value, float, metric result, CDF area difference
     """
-    value = Metrics.MetricUtilities._getCDFAreaDifference(x,y)
+    value = Metrics.MetricUtilities._getCDFAreaDifference(x,y,exact=self.exactIntegration)
     return float(value)
+
+  def evaluatePairs(self, pairs):
+    """
+      This method computes the metric for several pairs of inputs, one pair after the other
+      @ In, pairs, list, list of (x, y) pairs, see __evaluateLocal__
+      @ Out, values, numpy.array, metric results, CDF area difference of each pair
+    """
+    return Metrics.MetricUtilities._getCDFAreaDifferences(pairs,exact=self.exactIntegration)
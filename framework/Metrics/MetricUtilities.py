@@ -42,18 +42,11 @@ def _countWeightInBins(sortedData, binBoundaries):
     @ In, binBoundaries, list or np.array, the bin boundaries
     @ Out, ret, list, the list containing the number of bins
   """
-  value = 0 #Read only
-  weight = 1 #Read only
-  binIndex = 0
-  sortedIndex = 0
-  ret = [0]*(len(binBoundaries)+1)
-  while sortedIndex < len(sortedData):
-    while not binIndex >= len(binBoundaries) and \
-          sortedData[sortedIndex][value] > binBoundaries[binIndex]:
-      binIndex += 1
-    ret[binIndex] += sortedData[sortedIndex][weight]
-    sortedIndex += 1
-  return ret
+  sortedData = np.asarray(sortedData, dtype=float).reshape(-1, 2)
+  # bin of each point: number of boundaries strictly lower than the point
+  binIndexes = np.searchsorted(np.asarray(binBoundaries, dtype=float), sortedData[:, 0], side='left')
+  ret = np.bincount(binIndexes, weights=sortedData[:, 1], minlength=len(binBoundaries)+1)
+  return ret.tolist()
 
 
 def _getPDFandCDFfromWeightedData(data, weights, numBins, uniformBins, interpolation):
@@ -67,78 +60,58 @@ def _getPDFandCDFfromWeightedData(data, weights, numBins, uniformBins, interpola
     @ In, interpolation, str, "linear" or "quadratic", depending on which interpolation is used
     @ Out, (dataStats, cdfFunc, pdfFunc), tuple, dataStats is dictionary with things like "mean" and "stdev", cdfFunction is a function that returns the CDF value and pdfFunc is a function that returns the PDF value.
   """
-  # Sort the data
-  sortedData = list(zip(data, weights))
-  sortedData.sort() #Sort the data.
+  # Sort the data (by value, then by weight)
+  values = np.asarray(data, dtype=float)
+  weights = np.asarray(weights, dtype=float)
+  order = np.lexsort((weights, values))
+  sortedValues, sortedWeights = values[order], weights[order]
   weightSum = sum(weights)
-  value = 0 #Read only
-  weight = 1 #Read only
   # Find data range
-  low = sortedData[0][value]
-  high = sortedData[-1][value]
+  low = sortedValues[0]
+  high = sortedValues[-1]
   dataRange = high - low
   #Find the values to use between the histogram bins
   if uniformBins:
     minBinSize = dataRange/numBins
-    bins = [low + x * minBinSize for x in range(1, numBins)]
+    bins = low + np.arange(1, numBins) * minBinSize
   else:
     #Equal probability bins
     probPerBin = weightSum/numBins
-    probSum = 0.0
-    bins = [None]*(numBins-1)
-    searchIndex = 0
-    #Look thru the array, and find the next place where probSum > nextProb
-    for i in range(numBins-1):
-      nextProb = (i + 1) * probPerBin
-      while probSum + sortedData[searchIndex][weight] < nextProb:
-        probSum += sortedData[searchIndex][weight]
-        searchIndex += 1
-      bins[i] = sortedData[searchIndex][value]
+    #find the first place where the cumulative probability reaches each bin probability
+    nextProbs = np.arange(1, numBins) * probPerBin
+    searchIndexes = np.searchsorted(np.cumsum(sortedWeights), nextProbs, side='left')
+    bins = sortedValues[np.minimum(searchIndexes, len(sortedValues) - 1)]
     #Remove duplicates
-    for i in reversed(range(len(bins))):
-      if i > 1 and bins[i-1] == bins[i]:
-        bins.pop(i)
+    keep = np.ones(len(bins), dtype=bool)
+    keep[2:] = bins[2:] != bins[1:-1]
+    bins = bins[keep]
     if len(bins) > 1:
-      minBinSize = min(map(lambda x, y: x - y, bins[1:], bins[:-1]))
+      minBinSize = np.diff(bins).min()
     else:
       minBinSize = dataRange
   #Count the amount of weight in each bin
-  counts = _countWeightInBins(sortedData, bins)
-  binBoundaries = [low] + bins + [high]
+  counts = np.asarray(_countWeightInBins(np.column_stack((sortedValues, sortedWeights)), bins))
+  binBoundaries = np.concatenate(([low], bins, [high]))
   countSum = sum(counts)
   assert -1e-4 < countSum - weightSum < 1e-4
   # Create CDF
-  cdf = [0.0] * len(counts)
-  midpoints = [0.0] * len(counts)
-  cdfSum = 0.0
-  for i in range(len(counts)):
-    f0 = counts[i] / countSum
-    cdfSum += f0
-    cdf[i] = cdfSum
-    midpoints[i] = (binBoundaries[i] + binBoundaries[i + 1]) / 2.0
+  cdf = np.cumsum(counts / countSum)
+  midpoints = (binBoundaries[:-1] + binBoundaries[1:]) / 2.0
   cdfFunc = mathUtils.createInterp(midpoints, cdf, 0.0, 1.0, interpolation)
   #Create PDF
-  fPrimeData = [0.0] * len(counts)
-  for i in range(len(counts)):
-    h = binBoundaries[i + 1] - binBoundaries[i]
-    nCount = counts[i] / countSum  # normalized count
-    f0 = cdf[i]
-    if i + 1 < len(counts):
-      f1 = cdf[i + 1]
-    else:
-      f1 = 1.0
-    if i + 2 < len(counts):
-      f2 = cdf[i + 2]
-    else:
-      f2 = 1.0
-    if interpolation == 'linear':
-      fPrime = (f1 - f0) / h
-    else:
-      fPrime = (-1.5 * f0 + 2.0 * f1 + -0.5 * f2) / h
-    fPrimeData[i] = fPrime
+  h = np.diff(binBoundaries)
+  f0 = cdf
+  f1 = np.append(cdf[1:], 1.0)
+  f2 = np.append(cdf[2:], [1.0, 1.0])[:len(cdf)]
+  if interpolation == 'linear':
+    fPrimeData = (f1 - f0) / h
+  else:
+    fPrimeData = (-1.5 * f0 + 2.0 * f1 + -0.5 * f2) / h
   pdfFunc = mathUtils.createInterp(midpoints, fPrimeData, 0.0, 0.0, interpolation)
   mean = np.average(data, weights = weights)
-  dataStats = {"mean":mean,"minBinSize":minBinSize,"low":low,"high":high}
+  dataStats = {"mean":mean,"minBinSize":minBinSize,"low":low,"high":high,
+               # interpolation points of the CDF and PDF, for the (linear) area integrals
+               "midpoints":midpoints,"cdf":cdf,"pdf":fPrimeData}
   return dataStats, cdfFunc, pdfFunc
 
 
@@ -200,14 +173,80 @@ def _getBounds(stats1, stats2):
   high = max(getHighBound(stats1), getHighBound(stats2))
   return (low,high)
 
-def _getCDFAreaDifference(data1, data2):
+def _piecewiseLinearLimits(knots, values, lowFill, highFill, edges):
+  """
+    Evaluates a linear interpolant (with constant fill values outside of its knots) at both ends of each
+    interval between consecutive edges, as limits from within the interval (the interpolant is linear
+    within each interval, provided the edges include all of its knots).
+    @ In, knots, np.array, sorted interpolation points
+    @ In, values, np.array, values at the interpolation points
+    @ In, lowFill, float, value below the first knot
+    @ In, highFill, float, value above the last knot
+    @ In, edges, np.array, sorted interval edges
+    @ Out, (left, right), tuple(np.array, np.array), values at the left and right end of each interval
+  """
+  mids = 0.5 * (edges[:-1] + edges[1:])
+  seg = np.searchsorted(knots, mids)
+  left = np.where(seg == 0, lowFill, highFill).astype(float)
+  right = left.copy()
+  inside = (seg > 0) & (seg < len(knots))
+  seg = seg[inside]
+  slope = (values[seg] - values[seg-1]) / (knots[seg] - knots[seg-1])
+  left[inside] = values[seg-1] + slope * (edges[:-1][inside] - knots[seg-1])
+  right[inside] = values[seg-1] + slope * (edges[1:][inside] - knots[seg-1])
+  return left, right
+
+def _absLinearIntegral(left, right, widths):
+  """
+    Integrates exactly the absolute value of functions that are linear within each interval.
+    @ In, left, np.array, values at the left end of each interval
+    @ In, right, np.array, values at the right end of each interval
+    @ In, widths, np.array, the width of each interval
+    @ Out, integral, float, the integral of the absolute value over all the intervals
+  """
+  absLeft, absRight = np.abs(left), np.abs(right)
+  total = absLeft + absRight
+  # if the function changes sign, the areas of the two triangles at each side of the root
+  area = np.where(left * right >= 0, 0.5 * total,
+                  0.5 * np.divide(absLeft**2 + absRight**2, total, out=np.zeros_like(total), where=total > 0))
+  return np.sum(area * widths)
+
+def _getLinearAreas(data1, data2):
+  """
+    Gets exactly the CDF area difference and the PDF common area of two sets of data, whose CDFs and PDFs
+    are linear interpolants (see _convertToCommonFormat).
+    @ In, data1, varies, The first data to use (not a distribution), see _convertToCommonFormat
+    @ In, data2, varies, The second data to use (not a distribution), see _convertToCommonFormat
+    @ Out, (cdfAreaDifference, pdfCommonArea), (float, float), the area difference between the CDFs and the common area between the PDFs.
+  """
+  stats1 = _convertToCommonFormat(data1)[0]
+  stats2 = _convertToCommonFormat(data2)[0]
+  low, high = _getBounds(stats1, stats2)
+  edges = np.concatenate(([low, high], stats1["midpoints"], stats2["midpoints"]))
+  edges = np.unique(edges[(edges >= low) & (edges <= high)])
+  widths = np.diff(edges)
+  cdfLeft1, cdfRight1 = _piecewiseLinearLimits(stats1["midpoints"], stats1["cdf"], 0.0, 1.0, edges)
+  cdfLeft2, cdfRight2 = _piecewiseLinearLimits(stats2["midpoints"], stats2["cdf"], 0.0, 1.0, edges)
+  cdfAreaDifference = _absLinearIntegral(cdfLeft1 - cdfLeft2, cdfRight1 - cdfRight2, widths)
+  pdfLeft1, pdfRight1 = _piecewiseLinearLimits(stats1["midpoints"], stats1["pdf"], 0.0, 0.0, edges)
+  pdfLeft2, pdfRight2 = _piecewiseLinearLimits(stats2["midpoints"], stats2["pdf"], 0.0, 0.0, edges)
+  # min(f, g) = (f + g - |f - g|) / 2
+  pdfCommonArea = 0.25 * np.sum((pdfLeft1 + pdfRight1 + pdfLeft2 + pdfRight2) * widths) \
+                  - 0.5 * _absLinearIntegral(pdfLeft1 - pdfLeft2, pdfRight1 - pdfRight2, widths)
+  return cdfAreaDifference, pdfCommonArea
+
+def _getCDFAreaDifference(data1, data2, exact=False):
   """
     Gets the area between the two CDFs in data1 and data2.
     The greater the area, the more different data1 and data2 are.
     @ In, data1, varies, The first data to use, see _convertToCommonFormat
     @ In, data2, varies, The second data to use, see _convertToCommonFormat
+    @ In, exact, bool, optional, if True the area between the CDFs of data (not distributions) is computed
+      exactly instead of by quadrature
     @ Out, cdfAreaDifference, float, the area difference between the CDFs.
   """
+  if exact and not isinstance(data1, Distributions.Distribution) and not isinstance(data2, Distributions.Distribution):
+    return _getLinearAreas(data1, data2)[0]
   stats1, cdf1, pdf1 =_convertToCommonFormat(data1)
   stats2, cdf2, pdf2 =_convertToCommonFormat(data2)
   low, high = _getBounds(stats1, stats2)
@@ -215,14 +254,18 @@ def _getCDFAreaDifference(data1, data2):
   #return mathUtils.simpson(lambda x:abs(cdf1(x)-cdf2(x)),low,high,100000)
   return scipy.integrate.quad(lambda x:abs(cdf1(x)-cdf2(x)),low,high,limit=1000)[0]
 
-def _getPDFCommonArea(data1, data2):
+def _getPDFCommonArea(data1, data2, exact=False):
   """
     Gets the area that the PDFs overlap in data1 and data2.
     The greater the area, the more similar data1 and data2 are.
     @ In, data1, varies, The first data to use, see _convertToCommonFormat
     @ In, data2, varies, The second data to use, see _convertToCommonFormat
+    @ In, exact, bool, optional, if True the common area of the PDFs of data (not distributions) is computed
+      exactly instead of by quadrature
     @ Out, pdfCommonArea, float, the common area between the PDFs.
   """
+  if exact and not isinstance(data1, Distributions.Distribution) and not isinstance(data2, Distributions.Distribution):
+    return _getLinearAreas(data1, data2)[1]
   stats1, cdf1, pdf1 =_convertToCommonFormat(data1)
   stats2, cdf2, pdf2 =_convertToCommonFormat(data2)
   low, high = _getBounds(stats1, stats2)
@@ -230,3 +273,24 @@ def _getPDFCommonArea(data1, data2):
   #return mathUtils.simpson(lambda x:min(pdf1(x),pdf2(x)),low,high,100000)
   return scipy.integrate.quad(lambda x:min(pdf1(x),pdf2(x)),low,high,limit=1000)[0]
 
+def _getCDFAreaDifferences(pairs, exact=False):
+  """
+    Gets the area between the two CDFs of each pair of data.
+    This is a loop over the pairs (each pair has its own CDFs and integration bounds); it only saves
+    the callers the per-pair dispatch.
+    @ In, pairs, list, list of (data1, data2) pairs, see _getCDFAreaDifference
+    @ In, exact, bool, optional, if True the areas between the CDFs of data are computed exactly
+    @ Out, cdfAreaDifferences, np.array, the area difference between the CDFs of each pair.
+  """
+  return np.array([_getCDFAreaDifference(data1, data2, exact=exact) for data1, data2 in pairs])
+
+def _getPDFCommonAreas(pairs, exact=False):
+  """
+    Gets the area that the two PDFs of each pair of data overlap.
+    This is a loop over the pairs (each pair has its own PDFs and integration bounds); it only saves
+    the callers the per-pair dispatch.
+    @ In, pairs, list, list of (data1, data2) pairs, see _getPDFCommonArea
+    @ In, exact, bool, optional, if True the common areas of the PDFs of data are computed exactly
+    @ Out, pdfCommonAreas, np.array, the common area between the PDFs of each pair.
+  """
+  return np.array([_getPDFCommonArea(data1, data2, exact=exact) for data1, data2 in pairs])
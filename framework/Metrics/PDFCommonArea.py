@@ -23,6 +23,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 #Internal Modules------------------------------------------------------------------------------------
 from .Metric import Metric
 import Metrics.MetricUtilities
+from utils import InputData, InputTypes
 #Internal Modules End--------------------------------------------------------------------------------
 
 class PDFCommonArea(Metric):
@@ -40,6 +41,7 @@ class PDFCommonArea(Metric):
         specifying input of cls.
     """
     inputSpecification = super(PDFCommonArea, cls).getInputSpecification()
+    inputSpecification.addSub(InputData.parameterInputFactory("exactIntegration",contentType=InputTypes.BoolType),quantity=InputData.Quantity.zero_to_one)
 
     return inputSpecification
 
@@ -54,6 +56,8 @@ class PDFCommonArea(Metric):
     self.acceptsProbability = True
     # If True the metric needs to be able to handle a passed in Distribution
     self.acceptsDistribution = True
+    # If True the areas between data (not distributions) are integrated exactly instead of by quadrature
+    self.exactIntegration = False
 
   def _localReadMoreXML(self,xmlNode):
     """
@@ -62,7 +66,11 @@ class PDFCommonArea(Metric):
       @ In, xmlNode, xml.etree.Element, Xml element node
       @ Out, None
     """
-    pass
+    paramInput = PDFCommonArea.getInputSpecification()()
+    paramInput.parseNode(xmlNode)
+    for child in paramInput.subparts:
+      if child.getName() == "exactIntegration":
+        self.exactIntegration = child.value
 
   def __evaluateLocal__(self, x, y, weights = None, axis = 0, **kwargs):
     """
@@ -76,5 +84,13 @@ class PDFCommonArea(Metric):
       @ In, kwargs, dict, dictionary of parameters characteristic of each metric
       @ Out, value, float, metric result, PDF common area
     """
-    value = Metrics.MetricUtilities._getPDFCommonArea(x,y)
+    value = Metrics.MetricUtilities._getPDFCommonArea(x,y,exact=self.exactIntegration)
     return float(value)
+
+  def evaluatePairs(self, pairs):
+    """
+      This method computes the metric for several pairs of inputs, one pair after the other
+      @ In, pairs, list, list of (x, y) pairs, see __evaluateLocal__
+      @ Out, values, numpy.array, metric results, PDF common area of each pair
+    """
+    return Metrics.MetricUtilities._getPDFCommonAreas(pairs,exact=self.exactIntegration)
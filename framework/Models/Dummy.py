@@ -92,6 +92,17 @@ class Dummy(Model):
         if dataIN.type == 'PointSet':
           for entries in dataIN.getVars('input')+dataIN.getVars('output'):
             localInput[entries] = copy.copy(dataSet[entries].values)
+        elif dataIN.type == 'HistorySet':
+          # dense path: each variable is pulled out of the xarray storage at once (instead of
+          # selecting one history at a time), and each history is a view on the resulting array
+          pivotParameter = dataIN.indexes[0]
+          pivotValues = dataSet[pivotParameter].values
+          sizeIndex = len(pivotValues)
+          localInput[pivotParameter] = list(np.tile(pivotValues, (len(dataIN), 1)))
+          for entries in dataIN.getVars('output'):
+            localInput[entries] = list(dataSet[entries].transpose(dataIN.sampleTag, pivotParameter).values)
+          for entries in dataIN.getVars('input'):
+            localInput[entries] = list(np.repeat(dataSet[entries].values[:, np.newaxis], sizeIndex, axis=1))
         else:
           sizeIndex = 0
           for hist in range(len(dataIN)):
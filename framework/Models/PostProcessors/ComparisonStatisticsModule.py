@@ -21,6 +21,7 @@ from __future__ import division, print_function , unicode_literals, absolute_imp
 import numpy as np
 import math
 import copy
+from scipy import integrate
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -40,6 +41,7 @@ def _getGraphs(functions, fZStats = False):
   """
     Returns the graphs of the functions.
     The functions are a list of (dataStats, cdf_function, pdf_function,name)
+    The cdf and pdf functions are evaluated over arrays of coordinates.
     It returns a dictionary with the graphs and other statistics calculated.
     @ In, functions, list, list of functions (data_stats_dict, cdf_function, pdf_function,name)
     @ In, fZStats, bool, optional, true if the F(z) (cdf) needs to be computed
@@ -47,57 +49,40 @@ def _getGraphs(functions, fZStats = False):
   """
   retDict = {}
   dataStats = [x[0] for x in functions]
-  means = [x["mean"] for x in dataStats]
-  stdDevs = [x["stdev"] for x in dataStats]
+  means = np.asarray([x["mean"] for x in dataStats])
+  stdDevs = np.asarray([x["stdev"] for x in dataStats])
   cdfs = [x[1] for x in functions]
   pdfs = [x[2] for x in functions]
   names = [x[3] for x in functions]
-  low = min([m - 3.0*s for m,s in zip(means,stdDevs)])
-  high = max([m + 3.0*s for m,s in zip(means,stdDevs)])
-  lowLow = min([m - 5.0*s for m,s in zip(means,stdDevs)])
-  highHigh = max([m + 5.0*s for m,s in zip(means,stdDevs)])
+  low = np.min(means - 3.0*stdDevs)
+  high = np.max(means + 3.0*stdDevs)
+  lowLow = np.min(means - 5.0*stdDevs)
+  highHigh = np.max(means + 5.0*stdDevs)
   minBinSize = min([x["minBinSize"] for x in dataStats])
   n = int(math.ceil((high-low)/minBinSize))
   interval = (high - low)/n
 
   #Print the cdfs and pdfs of the data to be compared.
-  origCdfAndPdfArray = []
-  origCdfAndPdfArray.append(["x"])
-  for name in names:
-    origCdfAndPdfArray.append([name+'_cdf'])
-    origCdfAndPdfArray.append([name+'_pdf'])
-
-  for i in range(n):
-    x = low+interval*i
-    origCdfAndPdfArray[0].append(x)
-    k = 1
-    for stats, cdf, pdf, name in functions:
-      origCdfAndPdfArray[k].append(cdf(x))
-      origCdfAndPdfArray[k+1].append(pdf(x))
-      k += 2
+  xValues = low + interval*np.arange(n)
+  origCdfAndPdfArray = [["x"] + xValues.tolist()]
+  for cdf, pdf, name in zip(cdfs, pdfs, names):
+    origCdfAndPdfArray.append([name+'_cdf'] + np.ravel(cdf(xValues)).tolist())
+    origCdfAndPdfArray.append([name+'_pdf'] + np.ravel(pdf(xValues)).tolist())
   retDict["cdf_and_pdf_arrays"] = origCdfAndPdfArray
 
   if len(means) < 2:
     return
 
-  cdfAreaDifference = mathUtils.simpson(lambda x:abs(cdfs[1](x)-cdfs[0](x)),lowLow,highHigh,integrationSegments)
-
-  def firstMomentSimpson(f, a, b, n):
-    """
-      Compute the first simpson method
-      @ In, f, method, the function f(x)
-      @ In, a, float, lower bound
-      @ In, b, float, upper bound
-      @ In, n, int, the number of discretizations
-      @ Out, firstMomentSimpson, float, the moment
-    """
-    return mathUtils.simpson(lambda x:x*f(x), a, b, n)
+  # all the functions are evaluated once on the integration grid
+  grid = _integrationGrid(lowLow, highHigh, integrationSegments)
+  cdfValues = [np.ravel(cdf(grid)) for cdf in cdfs]
+  pdfValues = [np.ravel(pdf(grid)) for pdf in pdfs]
+  cdfAreaDifference = integrate.simps(np.abs(cdfValues[1]-cdfValues[0]), grid)
 
   #print a bunch of comparison statistics
-  pdfCommonArea = mathUtils.simpson(lambda x:min(pdfs[0](x),pdfs[1](x)),
-                            lowLow,highHigh,integrationSegments)
+  pdfCommonArea = integrate.simps(np.minimum(pdfValues[0],pdfValues[1]), grid)
   for i in range(len(pdfs)):
-    pdfArea = mathUtils.simpson(pdfs[i],lowLow,highHigh,integrationSegments)
+    pdfArea = integrate.simps(pdfValues[i], grid)
     retDict['pdf_area_'+names[i]] = pdfArea
     dataStats[i]["pdf_area"] = pdfArea
   retDict['cdf_area_difference'] = cdfAreaDifference
@@ -105,34 +90,46 @@ def _getGraphs(functions, fZStats = False):
   dataStats[0]["cdf_area_difference"] = cdfAreaDifference
   dataStats[0]["pdf_common_area"] = pdfCommonArea
   if fZStats:
+    xGrid = _integrationGrid(lowLow, highHigh, 1000)
+    pdfX = np.ravel(pdfs[0](xGrid))
     def fZ(z):
       """
-        Compute f(z) with a simpson rule
-        @ In, z, float, the coordinate
-        @ Out, fZ, the f(z)
+        Compute f(z) with a simpson rule, for all the requested z at once
+        @ In, z, np.array, the coordinates
+        @ Out, fZ, np.array, the f(z)
       """
-      return mathUtils.simpson(lambda x: pdfs[0](x)*pdfs[1](x-z), lowLow, highHigh, 1000)
+      shifted = np.ravel(pdfs[1]((xGrid[np.newaxis,:] - z[:,np.newaxis]).ravel())).reshape(len(z), len(xGrid))
+      return integrate.simps(pdfX*shifted, xGrid, axis=1)
 
     midZ = means[0]-means[1]
     lowZ = midZ - 3.0*max(stdDevs[0],stdDevs[1])
     highZ = midZ + 3.0*max(stdDevs[0],stdDevs[1])
     #print the difference function table.
-    fZTable = [["z"],["f_z(z)"]]
     zN = 20
     intervalZ = (highZ - lowZ)/zN
-    for i in range(zN):
-      z = lowZ + intervalZ*i
-      fZTable[0].append(z)
-      fZTable[1].append(fZ(z))
-    retDict["f_z_table"] = fZTable
-    sumFunctionDiff = mathUtils.simpson(fZ, lowZ, highZ, 1000)
-    firstMomentFunctionDiff = firstMomentSimpson(fZ, lowZ,highZ, 1000)
-    varianceFunctionDiff = mathUtils.simpson(lambda x:((x-firstMomentFunctionDiff)**2)*fZ(x),lowZ,highZ, 1000)
+    zValues = lowZ + intervalZ*np.arange(zN)
+    retDict["f_z_table"] = [["z"] + zValues.tolist(), ["f_z(z)"] + fZ(zValues).tolist()]
+    zGrid = _integrationGrid(lowZ, highZ, 1000)
+    fZValues = fZ(zGrid)
+    sumFunctionDiff = integrate.simps(fZValues, zGrid)
+    firstMomentFunctionDiff = integrate.simps(zGrid*fZValues, zGrid)
+    varianceFunctionDiff = integrate.simps(((zGrid-firstMomentFunctionDiff)**2)*fZValues, zGrid)
     retDict['sum_function_diff'] = sumFunctionDiff
     retDict['first_moment_function_diff'] = firstMomentFunctionDiff
     retDict['variance_function_diff'] = varianceFunctionDiff
   return retDict
 
+def _integrationGrid(a, b, n):
+  """
+    Returns the evaluation points of the simpson rule (see mathUtils.simpson)
+    @ In, a, float, lower bound
+    @ In, b, float, upper bound
+    @ In, n, int, the number of discretizations
+    @ Out, grid, np.array, the n+1 evaluation points
+  """
+  h = (b - a) / float(n)
+  return a + np.arange(n+1)*h
+
 def __processData(data, methodInfo):
   """
     Method to process the computed data
@@ -141,13 +138,9 @@ def __processData(data, methodInfo):
     @ Out, ret, dict, the processed data including the counts of the bins
   """
   ret = {}
-  if hasattr(data,'tolist'):
-    sortedData = data.tolist()
-  else:
-    sortedData = list(data)
-  sortedData.sort()
-  low = sortedData[0]
-  high = sortedData[-1]
+  sortedData = np.sort(np.asarray(data, dtype=float))
+  low = float(sortedData[0])
+  high = float(sortedData[-1])
   dataRange = high - low
   ret['low'] = low
   ret['high'] = high
@@ -166,13 +159,13 @@ def __processData(data, methodInfo):
   ret['numBins'] = numBins
   kind = methodInfo.get("kind", "uniformBins")
   if kind == "uniformBins":
-    bins = [low + x * dataRange / numBins for x in range(1, numBins)]
+    bins = (low + np.arange(1, numBins) * dataRange / numBins).tolist()
     ret['minBinSize'] = dataRange / numBins
   elif kind == "equalProbability":
     stride = len(sortedData) // numBins
-    bins = [sortedData[x] for x in range(stride - 1, len(sortedData) - stride + 1, stride)]
+    bins = sortedData[stride - 1:len(sortedData) - stride + 1:stride].tolist()
     if len(bins) > 1:
-      ret['minBinSize'] = min(map(lambda x, y: x - y, bins[1:], bins[:-1]))
+      ret['minBinSize'] = np.min(np.diff(bins))
     else:
       ret['minBinSize'] = dataRange
   counts = mathUtils.countBins(sortedData, bins)
@@ -221,35 +214,22 @@ def _getPDFandCDFfromData(dataName, data, csv, methodInfo, interpolation,
     utils.printCsv(csv, '"' + dataName + '"')
     utils.printCsv(csv, '"numBins"', dataStats['numBins'])
     utils.printCsv(csv, '"binBoundary"', '"binMidpoint"', '"binCount"', '"normalizedBinCount"', '"f_prime"', '"cdf"')
-  cdf = [0.0] * len(counts)
-  midpoints = [0.0] * len(counts)
-  cdfSum = 0.0
-  for i in range(len(counts)):
-    f0 = counts[i] / countSum
-    cdfSum += f0
-    cdf[i] = cdfSum
-    midpoints[i] = (binBoundaries[i] + binBoundaries[i + 1]) / 2.0
+  binBoundaries = np.asarray(binBoundaries)
+  normalizedCounts = np.asarray(counts) / countSum
+  cdf = np.cumsum(normalizedCounts)
+  midpoints = (binBoundaries[:-1] + binBoundaries[1:]) / 2.0
   cdfFunc = mathUtils.createInterp(midpoints, cdf, 0.0, 1.0, interpolation)
-  fPrimeData = [0.0] * len(counts)
-  for i in range(len(counts)):
-    h = binBoundaries[i + 1] - binBoundaries[i]
-    nCount = counts[i] / countSum  # normalized count
-    f0 = cdf[i]
-    if i + 1 < len(counts):
-      f1 = cdf[i + 1]
-    else:
-      f1 = 1.0
-    if i + 2 < len(counts):
-      f2 = cdf[i + 2]
-    else:
-      f2 = 1.0
-    if interpolation == 'linear':
-      fPrime = (f1 - f0) / h
-    else:
-      fPrime = (-1.5 * f0 + 2.0 * f1 + -0.5 * f2) / h
-    fPrimeData[i] = fPrime
-    if generateCSV:
-      utils.printCsv(csv, binBoundaries[i + 1], midpoints[i], counts[i], nCount, fPrime, cdf[i])
+  h = binBoundaries[1:] - binBoundaries[:-1]
+  f0 = cdf
+  f1 = np.append(cdf[1:], 1.0)
+  f2 = np.append(cdf[2:], [1.0] * min(2, len(cdf)))
+  if interpolation == 'linear':
+    fPrimeData = (f1 - f0) / h
+  else:
+    fPrimeData = (-1.5 * f0 + 2.0 * f1 + -0.5 * f2) / h
+  if generateCSV:
+    for i in range(len(counts)):
+      utils.printCsv(csv, binBoundaries[i + 1], midpoints[i], counts[i], normalizedCounts[i], fPrimeData[i], cdf[i])
   pdfFunc = mathUtils.createInterp(midpoints, fPrimeData, 0.0, 0.0, interpolation)
   dataKeys -= set({'numBins', 'counts', 'bins'})
   if generateCSV:
@@ -445,8 +425,8 @@ class ComparisonStatistics(PostProcessor):
         refDataStats = {"mean":distribution.untruncatedMean(),
                         "stdev":distribution.untruncatedStdDev()}
         refDataStats["minBinSize"] = refDataStats["stdev"] / 2.0
-        refPdf = lambda x:distribution.pdf(x)
-        refCdf = lambda x:distribution.cdf(x)
+        refPdf = np.vectorize(distribution.pdf, otypes=[float])
+        refCdf = np.vectorize(distribution.cdf, otypes=[float])
         graphData.append((refDataStats, refCdf, refPdf, "ref_" + distributionName))
       for dataPull, data in zip(dataPulls, datas):
         dataStats, cdfFunc, pdfFunc = _getPDFandCDFfromData(str(dataPull),
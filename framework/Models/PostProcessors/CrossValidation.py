@@ -29,6 +29,7 @@ import copy
 from .PostProcessor import PostProcessor
 from utils import utils
 from utils import InputData, InputTypes
+from Decorators.Parallelization import Parallel
 import Files
 import Models
 import CrossValidations
@@ -91,6 +92,7 @@ class CrossValidation(PostProcessor):
     self.metricsDict    = {}    # dictionary of metrics that are going to be assembled
     self.pivotParameter = None
     self.cvScore        = None
+    self.jobHandler     = None  # job handler pointer, used to run the folds in parallel
     # assembler objects to be requested
     self.addAssemblerObject('Metric', InputData.Quantity.one_to_infinity)
     #self.validMetrics = ['mean_absolute_error', 'explained_variance_score', 'r2_score', 'mean_squared_error', 'median_absolute_error']
@@ -101,6 +103,24 @@ class CrossValidation(PostProcessor):
     self.invalidRom = ['GaussPolynomialRom', 'HDMRRom']
     self.cvID = 'RAVEN_CV_ID'
 
+  def _localWhatDoINeed(self):
+    """
+      This method is a local mirror of the general whatDoINeed method.
+      The JobHandler is requested to train and evaluate the folds in parallel.
+      @ In, None
+      @ Out, needDict, dict, list of objects needed
+    """
+    needDict = {'internal':[(None,'jobHandler')]}
+    return needDict
+
+  def _localGenerateAssembler(self, initDict):
+    """
+      Generates the assembler.
+      @ In, initDict, dict, dict of init objects
+      @ Out, None
+    """
+    self.jobHandler = initDict['internal']['jobHandler']
+
   def initialize(self, runInfo, inputs, initDict=None) :
     """
       Method to initialize the pp.
@@ -295,12 +315,12 @@ class CrossValidation(PostProcessor):
     # SciKit-Learn supervised learning problems, and 'groups' become additional option to specify the group
     # labels that can be used while splitting the dataset into train/test set. For our purpose, only one
     # label option is needed. ~ wangc
+    foldData = []
     for trainIndex, testIndex in cvEngine.generateTrainTestIndices(list(inputDict.values())[0], y=groups, groups=groups):
-      trainDict, testDict = self.__generateTrainTestInputs(inputDict, trainIndex, testIndex)
-      ## Train the rom
-      cvEstimator.train(trainDict)
-      ## evaluate the rom
-      outputEvaluation = cvEstimator.evaluate(testDict)
+      foldData.append(self.__generateTrainTestInputs(inputDict, trainIndex, testIndex))
+    ## Train and evaluate the rom for each fold
+    evaluations = self._trainAndEvaluateFolds(cvEstimator, foldData)
+    for (_, testDict), outputEvaluation in zip(foldData, evaluations):
       ## Compute the distance between ROM and given data using Metric system
       for targetName, targetValue in outputEvaluation.items():
         for metricInstance in self.metricsDict.values():
@@ -329,6 +349,32 @@ class CrossValidation(PostProcessor):
           scoreDict[varName] = np.atleast_1d(np.mean(np.atleast_1d(metricValues)))
       return scoreDict
 
+  def _trainAndEvaluateFolds(self, cvEstimator, foldData):
+    """
+      Trains the estimator and evaluates it on the test set of each fold.
+      If the fold jobs can start (see JobHandler.canStartJobs), the folds are run in parallel, each one on its own copy
+      of the estimator. Otherwise (e.g. with batchSize=1, where this post-processor takes the only running spot) they
+      are run one after the other on the estimator itself.
+      @ In, cvEstimator, Models.ROM, the (untrained) estimator
+      @ In, foldData, list(tuple), (dictionary of train set, dictionary of test set) for each fold
+      @ Out, evaluations, list(dict), evaluation of the test set for each fold, in fold order
+    """
+    numFolds = len(foldData)
+    if self.jobHandler is None or numFolds < 2 or not self.jobHandler.canStartJobs():
+      evaluations = []
+      for trainDict, testDict in foldData:
+        ## Train the rom
+        cvEstimator.train(trainDict)
+        ## evaluate the rom
+        evaluations.append(cvEstimator.evaluate(testDict))
+      return evaluations
+    self.raiseADebug('Training and evaluating {} folds through the JobHandler ...'.format(numFolds))
+    # each fold is run on its own copy of the estimator
+    argsList = [(copy.deepcopy(cvEstimator), trainDict, testDict) for trainDict, testDict in foldData]
+    evaluations = self.jobHandler.runJobs(argsList, trainAndEvaluateFold, '{}_fold_'.format(self.name),
+                                          '{}_folds'.format(self.name))
+    return evaluations
+
   def collectOutput(self,finishedJob, output):
     """
       Function to place all of the computed data into the output object, i.e. Files
@@ -344,3 +390,16 @@ class CrossValidation(PostProcessor):
       cvIDs = {self.cvID: np.atleast_1d(range(len(utils.first(outputDict.values()))))}
       outputDict.update(cvIDs)
       output.load(outputDict, style='dict')
+
+@Parallel()
+def trainAndEvaluateFold(estimator, trainDict, testDict):
+  """
+    Trains an estimator on the train set of a fold and evaluates it on the test set.
+    Module-level so it can be dispatched through the JobHandler.
+    @ In, estimator, Models.ROM, untrained estimator (a copy owned by this fold)
+    @ In, trainDict, dict, train set
+    @ In, testDict, dict, test set
+    @ Out, evaluation, dict, evaluation of the test set
+  """
+  estimator.train(trainDict)
+  return estimator.evaluate(testDict)
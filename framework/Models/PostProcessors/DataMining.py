@@ -156,7 +156,8 @@ class DataMining(PostProcessor):
                             ("leafCounts",InputTypes.StringType),
                             ("showContracted",InputTypes.StringType),
                             ("annotatedAbove",InputTypes.FloatType),
-                            ("dendFileID",InputTypes.StringType)]:
+                            ("dendFileID",InputTypes.StringType),
+                            ("warmStart",InputTypes.BoolType)]:
       dataType = InputData.parameterInputFactory(name, contentType=inputType)
       kddInput.addSub(dataType)
 
@@ -220,10 +221,7 @@ class DataMining(PostProcessor):
       if not currentInput.checkIndexAlignment(indexesToCheck=self.pivotParameter):
         self.raiseAnError(IOError, "The data provided by the DataObject ", currentInput.name, " is not synchronized!")
       # for testing time dependent data mining - time dependent clustering
-      self.pivotVariable = np.asarray([dataSet.isel(**{currentInput.sampleTag:i}).dropna(self.pivotParameter)[self.pivotParameter].values for i in range(len(currentInput))])
-      historyKey          = dataSet[self.pivotParameter].values
-      numberOfSample      = len(dataSet['RAVEN_sample_ID'].values)
-      numberOfHistoryStep = len(dataSet[self.pivotParameter].values)
+      self.pivotVariable = self._getPivotValues(dataSet, currentInput.sampleTag)
 
       if self.initializationOptionDict['KDD']['Features'] == 'input':
         self.raiseAnError(ValueError, 'To perform data mining over input please use SciKitLearn library')
@@ -232,33 +230,54 @@ class DataMining(PostProcessor):
       else:
         features = [elem.strip() for elem in self.initializationOptionDict['KDD']['Features'].split(',')]
 
+      # the histories are synchronized, so the features are the (sample, pivot) arrays themselves
       for param in features:
-        inputDict['Features'][param] = np.zeros(shape=(numberOfSample,numberOfHistoryStep))
-        # FIXME: Slow loop in case of many samples, improve performance
-        for cnt in range(numberOfSample):
-          inputDict['Features'][param][cnt,:] = currentInput.realization(index=cnt)[param]
+        inputDict['Features'][param] = np.array(dataSet[param].transpose(currentInput.sampleTag, self.pivotParameter).values, dtype=float)
 
     elif self.metric is not None:
       if self.initializationOptionDict['KDD']['Features'] == 'input':
         self.raiseAnError(ValueError, 'KDD Post-processor for time dependent data with metric provided allows only output variables (time-dependent)')
       elif self.initializationOptionDict['KDD']['Features'] == 'output':
         numberOfSample = currentInput.size
-        self.pivotVariable = np.asarray([dataSet.isel(**{currentInput.sampleTag:i}).dropna(self.pivotParameter)[self.pivotParameter].values for i in range(len(currentInput))])
+        self.pivotVariable = self._getPivotValues(dataSet, currentInput.sampleTag)
+        outputs = dict((var, dataSet[var].transpose(currentInput.sampleTag, self.pivotParameter).values) for var in currentInput.getVars('output'))
         for i in range(numberOfSample):
-          rlz = currentInput.realization(index=i)
           inputDict['Features'][i] = {}
-          for var in currentInput.getVars('output'):
-            inputDict['Features'][i][var] = rlz[var]
+          for var, values in outputs.items():
+            inputDict['Features'][i][var] = values[i][np.logical_not(np.isnan(values[i]))]
           inputDict['Features'][i][self.pivotParameter] = self.pivotVariable[i]
 
     elif self.PreProcessor is not None:
       self.pivotParameter = currentInput.indexes[-1]
-      self.pivotVariable = np.asarray([dataSet.isel(RAVEN_sample_ID=i).dropna(self.pivotParameter)[self.pivotParameter].values for i in range(len(currentInput))])
+      self.pivotVariable = self._getPivotValues(dataSet, currentInput.sampleTag)
       return self.inputToInternalForPreProcessor(currentInput)
 
     inputDict['metadata'] = currentInput.getMeta(pointwise=True,general=True)
     return inputDict
 
+  def _getPivotValues(self, dataSet, sampleTag):
+    """
+      Function to get the pivot values of each history of a history set, that is
+      the pivot values at which the history holds data (all the time-dependent variables not NaN)
+      @ In, dataSet, xr.Dataset, the history set data
+      @ In, sampleTag, str, name of the sample dimension
+      @ Out, pivotValues, np.array, the pivot values as (sample, pivot) if all the histories
+        share them, otherwise the array of the pivot values of each history
+    """
+    pivot = dataSet[self.pivotParameter].values
+    nSamples = dataSet.sizes[sampleTag]
+    valid = np.ones((nSamples, len(pivot)), dtype=bool)
+    for var in dataSet.data_vars:
+      if self.pivotParameter in dataSet[var].dims:
+        valid &= dataSet[var].notnull().transpose(sampleTag, self.pivotParameter).values
+    if valid.all():
+      # fast path: all the histories share the pivot values
+      return np.tile(pivot, (nSamples, 1))
+    pivotValues = np.empty(nSamples, dtype=object)
+    for i in range(nSamples):
+      pivotValues[i] = pivot[valid[i]]
+    return pivotValues
+
   def inputToInternalForPointSet(self,currentInput):
     """
       Function to convert the input point set into a format that this
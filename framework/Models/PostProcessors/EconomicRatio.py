@@ -296,21 +296,98 @@ class EconomicRatio(BasicStatistics):
       result = sortedWeightsAndPoints[indexL,1]
     return result
 
-  def _computeSortedWeightsAndPoints(self,arrayIn,pbWeight,percent):
+  def _sortSamples(self, arrayIn, pbWeight):
     """
-      Method to compute the sorted weights and points
-      @ In, arrayIn, list/numpy.array, the array of values from which the percentile needs to be estimated
-      @ In, pbWeight, list/numpy.array, the reliability weights that correspond to the values in 'array'
+      Method to sort the samples of a target once, so that all the percentile-based metrics can reuse them.
+      Time-dependent targets are sorted for all the pivot values at once.
+      @ In, arrayIn, numpy.array, the samples, shape (nSamples,) or (nSamples, nPivot)
+      @ In, pbWeight, numpy.array, the reliability weights that correspond to the samples, shape (nSamples,)
+      @ Out, sortedPoints, numpy.array, the samples sorted along the first axis, with the smallest sample
+                           repeated on top (see _computeWeightedPercentile)
+      @ Out, weightsCDF, numpy.array, the cumulative sum of the sorted weights, starting from 0.0
+      @ Out, partialE, numpy.array, the cumulative sum of the sorted weights times the sorted samples, starting from 0.0
+    """
+    arrayIn = np.asarray(arrayIn, dtype=float)
+    idxs = np.argsort(arrayIn, axis=0)
+    points = np.take_along_axis(arrayIn, idxs, axis=0)
+    weights = np.asarray(pbWeight, dtype=float)[idxs]
+    zeros = np.zeros((1,) + points.shape[1:])
+    sortedPoints = np.concatenate((points[:1], points), axis=0)
+    weightsCDF = np.concatenate((zeros, np.cumsum(weights, axis=0)), axis=0)
+    partialE = np.concatenate((zeros, np.cumsum(weights*points, axis=0)), axis=0)
+    return sortedPoints, weightsCDF, partialE
+
+  def _computeSortedPercentile(self, sortedPoints, weightsCDF, percent):
+    """
+      Method to compute the weighted percentile from samples sorted by _sortSamples.
+      It is equivalent to _computeWeightedPercentile, for all the pivot values at once
+      @ In, sortedPoints, numpy.array, the sorted samples, as returned by _sortSamples
+      @ In, weightsCDF, numpy.array, the cumulative sum of the sorted weights, as returned by _sortSamples
       @ In, percent, float, the percentile that needs to be computed (between 0.01 and 1.0)
-      @ Out, sortedWeightsAndPoints, list/numpy.array, with [:,0] as the value of the probability density function at the bin, normalized, and [:,1] is the coresonding edge of the probability density function.
-      @ Out, indexL, index of the lower quantile
+      @ Out, result, float or numpy.array, the percentile (for each pivot value)
     """
-
-    idxs                   = np.argsort(np.asarray(list(zip(pbWeight,arrayIn)))[:,1])
-    sortedWeightsAndPoints = np.asarray(list(zip(pbWeight[idxs],arrayIn[idxs])))
-    weightsCDF             = np.cumsum(sortedWeightsAndPoints[:,0])
-    indexL = utils.first(np.asarray(weightsCDF >= percent).nonzero())[0]
-    return sortedWeightsAndPoints, indexL
+    reached = weightsCDF >= percent
+    # if no CDF value reaches the percentile (e.g. weights summing to slightly less than 1), take the maximum
+    indexL = np.where(reached.any(axis=0), np.argmax(reached, axis=0), len(weightsCDF) - 1)
+    higher = weightsCDF > percent
+    indexH = np.where(higher.any(axis=0), np.argmax(higher, axis=0), indexL)
+    # if indexH exists, the desired percentile lies between the two data points: take the midpoint
+    lower = np.take_along_axis(sortedPoints, np.expand_dims(indexL, 0), axis=0)[0]
+    upper = np.take_along_axis(sortedPoints, np.expand_dims(indexH, 0), axis=0)[0]
+    return 0.5*(lower + upper)
+
+  def _computeSortedExpectedShortfall(self, sortedPoints, weightsCDF, partialE, percent):
+    """
+      Method to compute the expected shortfall from samples sorted by _sortSamples, for all the pivot values at once
+      @ In, sortedPoints, numpy.array, the sorted samples, as returned by _sortSamples
+      @ In, weightsCDF, numpy.array, the cumulative sum of the sorted weights, as returned by _sortSamples
+      @ In, partialE, numpy.array, the cumulative sum of weights times samples, as returned by _sortSamples
+      @ In, percent, float, the percentile that needs to be computed (between 0.01 and 1.0)
+      @ Out, result, float or numpy.array, the expected shortfall (for each pivot value)
+    """
+    quantile = self._computeSortedPercentile(sortedPoints, weightsCDF, percent)
+    # index of the lower quantile among the samples (the leading 0.0 of the CDF excluded)
+    reached = weightsCDF[1:] >= percent
+    indexL = np.expand_dims(np.where(reached.any(axis=0), np.argmax(reached, axis=0), len(weightsCDF) - 2), 0)
+    lowerPartialE = np.take_along_axis(partialE, indexL, axis=0)[0]
+    lowerPartialP = np.take_along_axis(weightsCDF, indexL, axis=0)[0]
+    Es = lowerPartialE + quantile*(percent - lowerPartialP)
+    return -Es/percent
+
+  def _sortTargets(self, dataSet, pbWeights, targets, sortedTargets):
+    """
+      Method to sort the samples of the requested targets, reusing the ones sorted already
+      @ In, dataSet, xarray.Dataset, the input data set
+      @ In, pbWeights, xarray.Dataset, the probability weights of the targets (None if not present)
+      @ In, targets, list, the targets to sort
+      @ In, sortedTargets, dict, {target: (sortedPoints, weightsCDF, partialE)} (see _sortSamples), the
+            targets sorted already
+      @ Out, sortedTargets, dict, the same dictionary, updated with the requested targets
+    """
+    for target in targets:
+      if target in sortedTargets:
+        continue
+      targDa = dataSet[target]
+      if self.pivotParameter in targDa.sizes.keys():
+        targDa = targDa.transpose(self.sampleTag, self.pivotParameter)
+      nSamples = targDa.sizes[self.sampleTag]
+      targWeight = pbWeights[target].values if self.pbPresent else np.full(nSamples, 1.0/nSamples)
+      sortedTargets[target] = self._sortSamples(targDa.values, targWeight)
+    return sortedTargets
+
+  def _buildThresholdArray(self, values, threshold, targDa):
+    """
+      Method to pack a metric evaluated for each threshold into a DataArray
+      @ In, values, list, the metric for each threshold (float or numpy.array over the pivot values)
+      @ In, threshold, list, the thresholds
+      @ In, targDa, xarray.DataArray, the target data (used to check the time dependency)
+      @ Out, da, xarray.DataArray, the metric with dims ('threshold') or ('threshold', pivotParameter)
+    """
+    if self.pivotParameter in targDa.sizes.keys():
+      da = xr.DataArray(values,dims=('threshold',self.pivotParameter),coords={'threshold':threshold,self.pivotParameter:self.pivotValue})
+    else:
+      da = xr.DataArray(values,dims=('threshold'),coords={'threshold':threshold})
+    return da
 
   def __runLocal(self, inputData):
     """
@@ -394,28 +471,18 @@ class EconomicRatio(BasicStatistics):
     #
     # ValueAtRisk
     #
+    # the samples of each target are sorted once and shared by all the thresholds of all the percentile-based metrics
+    sortedTargets = {}
     metric = 'valueAtRisk'
     if len(needed[metric]['targets'])>0:
       self.raiseADebug('Starting "'+metric+'"...')
-      dataSet = inputDataset[list(needed[metric]['targets'])]
       threshold = needed[metric]['threshold']
+      sortedTargets = self._sortTargets(inputDataset, pbWeights, needed[metric]['targets'], sortedTargets)
       VaRSet = xr.Dataset()
-      relWeight = pbWeights[list(needed[metric]['targets'])]
       for target in needed[metric]['targets']:
-        targWeight = relWeight[target].values
-        targDa = dataSet[target]
-        VaRList = []
-        for thd in threshold:
-          if self.pivotParameter in targDa.sizes.keys():
-            VaR = [self._computeWeightedPercentile(group.values,targWeight,percent=thd) for label,group in targDa.groupby(self.pivotParameter)]
-          else:
-            VaR = self._computeWeightedPercentile(targDa.values,targWeight,percent=thd)
-          VaRList.append(abs(VaR))
-        if self.pivotParameter in targDa.sizes.keys():
-          da = xr.DataArray(VaRList,dims=('threshold',self.pivotParameter),coords={'threshold':threshold,self.pivotParameter:self.pivotValue})
-        else:
-          da = xr.DataArray(VaRList,dims=('threshold'),coords={'threshold':threshold})
-        VaRSet[target] = da
+        sortedPoints, weightsCDF, _ = sortedTargets[target]
+        VaRList = [abs(self._computeSortedPercentile(sortedPoints, weightsCDF, thd)) for thd in threshold]
+        VaRSet[target] = self._buildThresholdArray(VaRList, threshold, inputDataset[target])
       calculations[metric] = VaRSet
     #
     # ExpectedShortfall
@@ -423,31 +490,13 @@ class EconomicRatio(BasicStatistics):
     metric = 'expectedShortfall'
     if len(needed[metric]['targets'])>0:
       self.raiseADebug('Starting "'+metric+'"...')
-      dataSet = inputDataset[list(needed[metric]['targets'])]
       threshold = needed[metric]['threshold']
+      sortedTargets = self._sortTargets(inputDataset, pbWeights, needed[metric]['targets'], sortedTargets)
       CVaRSet = xr.Dataset()
-      relWeight = pbWeights[list(needed[metric]['targets'])]
       for target in needed[metric]['targets']:
-        targWeight = relWeight[target].values
-        targDa = dataSet[target]
-        CVaRList = []
-        for thd in threshold:
-          if self.pivotParameter in targDa.sizes.keys():
-            sortedWeightsAndPoints, indexL = [self._computeSortedWeightsAndPoints(group.values,targWeight,thd) for label,group in targDa.groupby(self.pivotParameter)]
-            quantile = [self._computeWeightedPercentile(group.values,targWeight,percent=thd) for label,group in targDa.groupby(self.pivotParameter)]
-          else:
-            sortedWeightsAndPoints, indexL = self._computeSortedWeightsAndPoints(targDa.values,targWeight,thd)
-          quantile = self._computeWeightedPercentile(targDa.values,targWeight,percent=thd)
-          lowerPartialE = np.sum(sortedWeightsAndPoints[:indexL,0]*sortedWeightsAndPoints[:indexL,1])
-          lowerPartialP = np.sum(sortedWeightsAndPoints[:indexL,0])
-          Es = lowerPartialE + quantile*(thd -lowerPartialP)
-          CVaRList.append(-Es/(thd))
-
-        if self.pivotParameter in targDa.sizes.keys():
-          da = xr.DataArray(CVaRList,dims=('threshold',self.pivotParameter),coords={'threshold':threshold,self.pivotParameter:self.pivotValue})
-        else:
-          da = xr.DataArray(CVaRList,dims=('threshold'),coords={'threshold':threshold})
-        CVaRSet[target] = da
+        sortedPoints, weightsCDF, partialE = sortedTargets[target]
+        CVaRList = [self._computeSortedExpectedShortfall(sortedPoints, weightsCDF, partialE, thd) for thd in threshold]
+        CVaRSet[target] = self._buildThresholdArray(CVaRList, threshold, inputDataset[target])
       calculations[metric] = CVaRSet
     #
     # sortinoRatio
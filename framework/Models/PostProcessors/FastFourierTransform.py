@@ -20,6 +20,7 @@ from __future__ import division, print_function , unicode_literals, absolute_imp
 
 #External Modules---------------------------------------------------------------
 import numpy as np
+import xarray as xr
 #External Modules End-----------------------------------------------------------
 
 #Internal Modules---------------------------------------------------------------
@@ -105,39 +106,47 @@ class FastFourierTransform(PostProcessor):
     """
       This method executes the postprocessor action.
       @ In, inputIn, object, object contained the data to process. (inputToInternal output)
-      @ Out, realizations, list, list of realizations obtained
+      @ Out, results, xr.Dataset, transforms of all the realizations, indexed by sample and frequency
     """
     # do checking and isolate input
     inData = self.inputToInternal(inputIn)
+    dataset = inData.asDataset()
+    results = xr.Dataset()
+    # separate curve for each target, all the realizations are transformed at once
+    for target in self.targets:
+      index = inData.getDimensions(var=target)[target][0]
+      histories = dataset[target].transpose(inData.sampleTag, index).values
+      results = results.merge(self._transformHistories(target, histories, inData.sampleTag))
+    return results
 
-    # storage for each realization
-    realizations = []
-    # loop over realizations and perform fft
-    ## TODO can the loop be avoided?
-    for s in range(len(inData)):
-      # obtain relevant sample
-      sample = inData.realization(index=s)
-      # solutions for each realization are stored in this dict
-      rlz = {}
-      # separate curve for each target
-      for target in self.targets:
-        # get complex ndarray (real and imaginary parts)
-        data = sample[target].values
-        N = len(data)
-        mixed = np.fft.fft(data)
-        freq = np.fft.fftfreq(N)
-        # select positive values
-        freq = freq[:int(N/2)]
-        mixed = mixed[:int(N/2)].real
-        #data = zip(freq,1.0/freq,mixed.real)
-        #data.sort(key=lambda x:abs(x[2]), reverse=True)
-        #freq,period,amp = zip(*data)
-        # TODO change frequencies based on delta index? Example: time
-        rlz[target+'_fft_frequency'] = freq
-        rlz[target+'_fft_period'] = 1.0/freq
-        rlz[target+'_fft_amplitude'] = mixed
-      realizations.append(rlz)
-    return realizations
+  def _transformHistories(self, target, histories, sampleTag):
+    """
+      Performs the fft of all the histories of a target.
+      @ In, target, str, name of the target
+      @ In, histories, np.array, histories of the target as (realization, index), NaN-padded where
+        the histories do not share the same index values
+      @ In, sampleTag, str, name of the realization dimension
+      @ Out, results, xr.Dataset, frequency, period and amplitude of the target
+    """
+    freqName = target+'_fft_frequency'
+    valid = np.logical_not(np.isnan(histories))
+    lengths = valid.sum(axis=1)
+    transforms = []
+    # histories sharing the same length are transformed together
+    for N in np.unique(lengths):
+      rows = np.where(lengths == N)[0]
+      data = histories[rows][valid[rows]].reshape(len(rows), N)
+      # select positive values
+      freq = np.fft.fftfreq(N)[:int(N/2)]
+      mixed = np.fft.rfft(data, axis=1)[:, :int(N/2)].real
+      # TODO change frequencies based on delta index? Example: time
+      transforms.append(xr.Dataset({target+'_fft_period': ((sampleTag, freqName), np.tile(1.0/freq, (len(rows), 1))),
+                                    target+'_fft_amplitude': ((sampleTag, freqName), mixed)},
+                                   coords={sampleTag: rows, freqName: freq}))
+    if len(transforms) == 1:
+      return transforms[0]
+    # histories with different lengths get NaN-padded over the union of the frequencies
+    return xr.concat(transforms, dim=sampleTag).sortby(sampleTag)
 
   def collectOutput(self, finishedJob, output):
     """
@@ -147,6 +156,17 @@ class FastFourierTransform(PostProcessor):
       @ Out, None
     """
     evaluation = finishedJob.getEvaluation()
-    realizations = evaluation[1]
-    for rlz in realizations:
+    results = evaluation[1]
+    sampleTag = output.sampleTag
+    if output.isEmpty and set(output.indexes).issubset(results.dims):
+      # fast path: the results are already in the data object format
+      output.load(results, style='dataset')
+      return
+    # otherwise, append the realizations one at a time (NaN padding removed)
+    for s in range(results.sizes[sampleTag]):
+      rlz = {}
+      for var, values in results.isel({sampleTag:s}).data_vars.items():
+        values = values.dropna(values.dims[0])
+        rlz[values.dims[0]] = values[values.dims[0]].values
+        rlz[var] = values.values
       output.addRealization(rlz)
@@ -264,15 +264,15 @@ class ImportanceRank(PostProcessor):
       if not currentInput.checkIndexAlignment(indexesToCheck=self.pivotParameter):
         self.raiseAnError(IOError, "In data object ", currentInput.name, ", the realization' pivot parameters have unsynchronized pivot values!"
                 + "Please use the internal postprocessor 'HistorySetSync' to synchronize the data.")
-      slices = currentInput.sliceByIndex(self.pivotParameter)
-      metadata = currentInput.getMeta(pointwise=True)
-      inputList = []
-      for sliceData in slices:
-        inputDict = {}
-        inputDict['metadata'] = metadata
-        inputDict['targets'] = dict((target, sliceData[target].values) for target in self.targets)
-        inputDict['features'] = dict((feature, sliceData[feature].values) for feature in self.features)
-        inputList.append(inputDict)
+      # all the pivot values are ranked at once: time-dependent variables are stored as (sample, pivot) arrays
+      sampleTag = currentInput.sampleTag
+      inputDict = {'targets':{}, 'features':{}, 'metadata':currentInput.getMeta(pointwise=True)}
+      for var in self.targets + self.features:
+        values = dataSet[var]
+        if self.pivotParameter in values.dims:
+          values = values.transpose(sampleTag, self.pivotParameter)
+        inputDict['targets' if var in self.targets else 'features'][var] = values.values
+      inputList = [inputDict]
     # get input from HDF5 Database
     if inType == 'HDF5':
       pass  # to be implemented
@@ -286,83 +286,87 @@ class ImportanceRank(PostProcessor):
       @ Out, outputDict, dict, Dictionary containing the results
     """
     inputList = self.inputToInternal(inputIn)
-    if not self.dynamic:
-      outputDict = self.__runLocal(inputList[0])
-    else:
-      outputList = []
-      for inputDict in inputList:
-        outputList.append(self.__runLocal(inputDict))
-      outputDict = dict((var, list()) for var in outputList[0].keys())
-      for output in outputList:
-        for var, value in output.items():
-          outputDict[var] = np.append(outputDict[var], value)
+    outputDict = self.__runLocal(inputList[0])
+    if self.dynamic:
       # add the pivot parameter and its values
       outputDict[self.pivotParameter] = np.atleast_1d(self.pivotValue)
 
     return outputDict
 
+  def _linearSensitivities(self, featureMatrix, targetMatrix):
+    """
+      Computes the coefficients of the linear regressions of all the targets (and pivot values)
+      on the features, reusing the same least-squares factorization of the feature matrix
+      @ In, featureMatrix, np.array, the sampled features, as (sample, feature), or as
+        (pivot, sample, feature) if any feature is time-dependent
+      @ In, targetMatrix, np.array, the sampled targets, as (sample, target, pivot)
+      @ Out, coefficients, np.array, the regression coefficients, as (feature, target, pivot)
+    """
+    nSamples, nTargets, nPivot = targetMatrix.shape
+    # the regressions have an intercept, so both the features and the targets are centered
+    centeredTargets = targetMatrix - targetMatrix.mean(axis=0)
+    if featureMatrix.ndim == 2:
+      centeredFeatures = featureMatrix - featureMatrix.mean(axis=0)
+      coefficients = np.linalg.lstsq(centeredFeatures, centeredTargets.reshape(nSamples, -1), rcond=None)[0]
+      return coefficients.reshape(-1, nTargets, nPivot)
+    # time-dependent features, one pseudo-inverse for each pivot value (computed as a stack)
+    centeredFeatures = featureMatrix - featureMatrix.mean(axis=1, keepdims=True)
+    return np.einsum('pfs,stp->ftp', np.linalg.pinv(centeredFeatures), centeredTargets)
+
   def __runLocal(self, inputDict):
     """
       This method executes the postprocessor action.
       @ In, inputDict, object, object contained the data to process. (inputToInternal output)
       @ Out, outputDict, dict, dictionary containing the evaluated data
     """
-    from sklearn.linear_model import LinearRegression
-
     outputDict = {}
-    senCoeffDict = {}
-    senWeightDict = {}
     # compute sensitivities of targets with respect to features
-    featValues = []
     # compute importance rank
     if self.latentSen:
-      for feat in self.latent:
-        featValues.append(inputDict['features'][feat])
       feats = self.latent
       self.dimensions = self.latentDim
     else:
-      for feat in self.manifest:
-        featValues.append(inputDict['features'][feat])
       feats = self.manifest
       self.dimensions = self.manifestDim
-    sampledFeatMatrix = np.atleast_2d(np.asarray(featValues)).T
-    for target in self.targets:
-      featCoeffs = LinearRegression().fit(sampledFeatMatrix, inputDict['targets'][target]).coef_
-      featWeights = abs(featCoeffs)/np.sum(abs(featCoeffs))
-      senWeightDict[target] = featWeights
-      senCoeffDict[target] = featCoeffs
+    # all the targets (and all the pivot values, for time-dependent data) are regressed at once
+    targetValues = [np.atleast_1d(inputDict['targets'][target]) for target in self.targets]
+    featValues = [np.atleast_1d(inputDict['features'][feat]) for feat in feats]
+    # number of pivot values of each time-dependent variable (scalars are the same for all the pivot values)
+    pivotLengths = dict((var, values.reshape(len(values), -1).shape[1])
+                        for var, values in zip(list(self.targets) + list(feats), targetValues + featValues))
+    nPivots = set(length for length in pivotLengths.values() if length > 1)
+    if len(nPivots) > 1:
+      self.raiseAnError(IOError, 'The targets and features must have the same number of pivot values, but got:',
+                        ', '.join('"{}": {}'.format(var, length) for var, length in pivotLengths.items()))
+    nPivot = nPivots.pop() if nPivots else 1
+    targetMatrix = np.stack([np.broadcast_to(values.reshape(len(values), -1), (len(values), nPivot)) for values in targetValues], axis=1)
+    if any(values.ndim > 1 for values in featValues):
+      featValues = [np.broadcast_to(values.reshape(len(values), -1), (len(values), nPivot)) for values in featValues]
+      sampledFeatMatrix = np.stack(featValues, axis=-1).transpose(1, 0, 2)
+    else:
+      sampledFeatMatrix = np.atleast_2d(np.asarray(featValues)).T
+    senCoeffs = self._linearSensitivities(sampledFeatMatrix, targetMatrix)
+    senWeights = abs(senCoeffs)/np.sum(abs(senCoeffs), axis=0)
     for what in self.what:
       if what.lower() == 'sensitivityindex':
         what = 'sensitivityIndex'
-        for target in self.targets:
-          for i, feat in enumerate(feats):
-            varName = '_'.join([what, target, feat])
-            outputDict[varName] = np.atleast_1d(senWeightDict[target][i])
+        self._storeIndices(outputDict, what, senWeights, feats)
       if what.lower() == 'importanceindex':
         what = 'importanceIndex'
-        for target in self.targets:
-          featCoeffs = senCoeffDict[target]
-          featWeights = []
-          if not self.latentSen:
-            for index,feat in enumerate(feats):
-              totDim = self.mvnDistribution.dimension
-              covIndex = totDim * (self.dimensions[index] - 1) + self.dimensions[index] - 1
-              if self.mvnDistribution.covarianceType == 'abs':
-                covTarget = featCoeffs[index] * self.mvnDistribution.covariance[covIndex] * featCoeffs[index]
-              else:
-                covFeature = self.mvnDistribution.covariance[covIndex]*self.mvnDistribution.mu[self.dimensions[index]-1]**2
-                covTarget = featCoeffs[index] * covFeature * featCoeffs[index]
-              featWeights.append(covTarget)
-            featWeights = featWeights/np.sum(featWeights)
-            for i, feat in enumerate(feats):
-              varName = '_'.join([what, target, feat])
-              outputDict[varName] = np.atleast_1d(featWeights[i])
-          # if the features type is 'latent', since latentVariables are used to compute the sensitivities
-          # the covariance for latentVariances are identity matrix
-          else:
-            for i, feat in enumerate(feats):
-              varName = '_'.join([what, target, feat])
-              outputDict[varName] = np.atleast_1d(senWeightDict[target][i])
+        if not self.latentSen:
+          totDim = self.mvnDistribution.dimension
+          dims = np.asarray(self.dimensions)
+          covIndex = totDim * (dims - 1) + dims - 1
+          covFeature = np.asarray(self.mvnDistribution.covariance)[covIndex]
+          if self.mvnDistribution.covarianceType != 'abs':
+            covFeature = covFeature*np.asarray(self.mvnDistribution.mu)[dims-1]**2
+          covTarget = senCoeffs * covFeature[:, np.newaxis, np.newaxis] * senCoeffs
+          featWeights = covTarget/np.sum(covTarget, axis=0)
+          self._storeIndices(outputDict, what, featWeights, feats)
+        # if the features type is 'latent', since latentVariables are used to compute the sensitivities
+        # the covariance for latentVariances are identity matrix
+        else:
+          self._storeIndices(outputDict, what, senWeights, feats)
       if what.lower() == 'manifestsensitivity':
         if self.reconstructSen:
           what = 'manifestSensitivity'
@@ -372,15 +376,10 @@ class ImportanceRank(PostProcessor):
           inverseTransformationMatrix = self.mvnDistribution.inverseTransformationMatrix(manifestIndex)
           inverseTransformationMatrix = inverseTransformationMatrix[index]
           # recompute the sensitivities for manifest variables
-          for target in self.targets:
-            latentSen = np.asarray(senCoeffDict[target])
-            if self.mvnDistribution.covarianceType == 'abs':
-              manifestSen = list(np.dot(latentSen,inverseTransformationMatrix))
-            else:
-              manifestSen = list(np.dot(latentSen,inverseTransformationMatrix)/inputDict['targets'][target])
-            for i, feat in enumerate(self.manifest):
-              varName = '_'.join([what, target, feat])
-              outputDict[varName] = np.atleast_1d(manifestSen[i])
+          manifestSen = np.einsum('ltp,lm->mtp', senCoeffs, inverseTransformationMatrix)
+          if self.mvnDistribution.covarianceType != 'abs':
+            manifestSen = manifestSen/targetMatrix
+          self._storeIndices(outputDict, what, manifestSen, self.manifest)
         elif self.latentSen:
           self.raiseAnError(IOError, 'Unable to reconstruct the sensitivities for manifest variables, this is because no manifest variable is provided in',self.printTag)
         else:
@@ -396,7 +395,7 @@ class ImportanceRank(PostProcessor):
           singularValues = list(singularValues/np.sum(singularValues))
           for i, feat in enumerate(feats):
             varName = '_'.join([what, feat])
-            outputDict[varName] = np.atleast_1d(singularValues[i])
+            outputDict[varName] = np.full(nPivot, singularValues[i])
       if what.lower() == 'transformation':
         if self.transformation:
           what = 'transformation'
@@ -406,7 +405,7 @@ class ImportanceRank(PostProcessor):
           for ind,var in enumerate(self.manifest):
             for i, feat in enumerate(feats):
               varName = '_'.join([what, var, feat])
-              outputDict[varName] = np.atleast_1d(transformMatrix[manifestIndex[ind]][i])
+              outputDict[varName] = np.full(nPivot, transformMatrix[manifestIndex[ind]][i])
         else:
           self.raiseAnError(IOError,'Unable to output the transformation matrix, please provide both "manifest" and "latent" variables in XML node "features" in',self.printTag)
       if what.lower() == 'inversetransformation':
@@ -419,7 +418,7 @@ class ImportanceRank(PostProcessor):
             for i, mVar in enumerate(self.manifest):
               varName = what + '_' + var + '_' + mVar
               varName = '_'.join([what, var, mVar])
-              outputDict[varName] = np.atleast_1d(inverseTransformationMatrix[index[ind]][i])
+              outputDict[varName] = np.full(nPivot, inverseTransformationMatrix[index[ind]][i])
         else:
           self.raiseAnError(IOError,'Unable to output the inverse transformation matrix, please provide both "manifest" and "latent" variables in XML node "features" in', self.printTag)
 
@@ -430,3 +429,17 @@ class ImportanceRank(PostProcessor):
       #  self.raiseAnError(NotImplementedError,'CumulativeImportanceIndex is not yet implemented for ' + self.printTag)
 
     return outputDict
+
+  def _storeIndices(self, outputDict, what, indices, feats):
+    """
+      Stores the indices computed for all the targets in the output dictionary
+      @ In, outputDict, dict, the output dictionary
+      @ In, what, str, name of the index
+      @ In, indices, np.array, the indices, as (feature, target, pivot)
+      @ In, feats, list, the features
+      @ Out, None
+    """
+    for t, target in enumerate(self.targets):
+      for i, feat in enumerate(feats):
+        varName = '_'.join([what, target, feat])
+        outputDict[varName] = np.atleast_1d(indices[i, t])
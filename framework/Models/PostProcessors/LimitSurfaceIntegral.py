@@ -19,9 +19,10 @@ Created on July 10, 2013
 import numpy as np
 import xarray
 import math
+from scipy import stats
 
 from .PostProcessor import PostProcessor
-from utils import InputData, InputTypes
+from utils import utils, InputData, InputTypes
 import LearningGate
 
 
@@ -72,6 +73,15 @@ class LimitSurfaceIntegral(PostProcessor):
     LSIOutputNameInput = InputData.parameterInputFactory("computeBounds", contentType=InputTypes.BoolType)
     inputSpecification.addSub(LSIOutputNameInput)
 
+    LSIBatchSizeInput = InputData.parameterInputFactory("batchSize", contentType=InputTypes.IntegerType)
+    inputSpecification.addSub(LSIBatchSizeInput)
+
+    LSIConfidenceInput = InputData.parameterInputFactory("confidence", contentType=InputTypes.FloatType)
+    inputSpecification.addSub(LSIConfidenceInput)
+
+    LSIImportanceSamplingInput = InputData.parameterInputFactory("importanceSampling", contentType=InputTypes.BoolType)
+    inputSpecification.addSub(LSIImportanceSamplingInput)
+
     return inputSpecification
 
   def __init__(self):
@@ -93,6 +103,10 @@ class LimitSurfaceIntegral(PostProcessor):
     self.functionS = None # evaluation classifier for the integration
     self.errorModel = None # classifier used for the error estimation
     self.computationPrefix = None # output prefix for the storage of the probability and, if requested, bounding error
+    self.batchSize = None # number of Monte Carlo samples evaluated at once (None means all of them)
+    self.confidence = None # if set, confidence level at which the sampling stops once the tolerance is reached
+    self.importanceSampling = False # sample around the limit surface instead of the whole domain?
+    self.defensiveFraction = 0.1 # fraction of the importance samples taken uniformly over the whole domain
     self.stat = modelsFactory.returnInstance('BasicStatistics')  # instantiation of the 'BasicStatistics' processor, which is used to compute the pb given montecarlo evaluations
     self.stat.what = ['expectedValue'] # expected value calculation
     self.addAssemblerObject('distribution', InputData.Quantity.zero_to_infinity) # distributions are optional
@@ -148,6 +162,16 @@ class LimitSurfaceIntegral(PostProcessor):
         self.computationPrefix = child.value
       elif child.getName() == 'computeBounds':
         self.computeErrrorBounds = child.value
+      elif child.getName() == 'batchSize':
+        if child.value < 1:
+          self.raiseAnError(IOError, 'batchSize must be a positive integer! Got: ' + str(child.value))
+        self.batchSize = child.value
+      elif child.getName() == 'confidence':
+        if not 0. < child.value < 1.:
+          self.raiseAnError(IOError, 'confidence must be in (0, 1)! Got: ' + str(child.value))
+        self.confidence = child.value
+      elif child.getName() == 'importanceSampling':
+        self.importanceSampling = child.value
       else:
         self.raiseAnError(NameError, 'invalid or missing labels after the variables call. Only "variable" is accepted.tag: ' + child.getName())
       # if no distribution, we look for the integration domain in the input
@@ -159,7 +183,9 @@ class LimitSurfaceIntegral(PostProcessor):
       self.raiseAnError(IOError,'The required XML node <outputName> has not been inputted!!!')
     if self.target is None:
       self.raiseAWarning('integral target has not been provided. The postprocessor is going to take the last output it finds in the provided limitsurface!!!')
-    True
+    if (self.confidence is not None or self.importanceSampling) and self.batchSize is None:
+      # the estimate needs to be checked while sampling; default to chunks of reasonable size
+      self.batchSize = 10000
 
   def initialize(self, runInfo, inputs, initDict):
     """
@@ -241,22 +267,142 @@ class LimitSurfaceIntegral(PostProcessor):
     """
     pb, boundError = None, None
     if self.integralType == 'montecarlo':
-      tempDict = {}
-      randomMatrix = np.random.rand(int(math.ceil(1.0 / self.tolerance**2)), len(self.variableDist.keys()))
-      for index, varName in enumerate(self.variableDist.keys()):
-        if self.variableDist[varName] == None:
-          randomMatrix[:, index] = randomMatrix[:, index] * (self.lowerUpperDict[varName]['upperBound'] - self.lowerUpperDict[varName]['lowerBound']) + self.lowerUpperDict[varName]['lowerBound']
+      nVars = len(self.variableDist.keys())
+      maxSamples = int(math.ceil(1.0 / self.tolerance**2))
+      batchSize = maxSamples if self.batchSize is None else min(self.batchSize, maxSamples)
+      zScore = None if self.confidence is None else stats.norm.ppf(0.5 + self.confidence / 2.)
+      proposal = self.__buildProposal__() if self.importanceSampling else None
+      nSamples = 0
+      pb, pbSquared, pbError = 0., 0., 0.
+      # stream the samples in chunks, keeping running means of the estimator (and of its square)
+      while nSamples < maxSamples:
+        size = min(batchSize, maxSamples - nSamples)
+        nSamples += size
+        if proposal is None:
+          unitMatrix, weights = np.random.rand(size, nVars), None
         else:
-          f = np.vectorize(self.variableDist[varName].ppf, otypes=[np.float])
-          randomMatrix[:, index] = f(randomMatrix[:, index])
-        tempDict[varName] = randomMatrix[:, index]
-      pb = self.stat.run({'targets':{self.target:xarray.DataArray(self.functionS.evaluate(tempDict)[self.target])}})[self.computationPrefix +"_"+self.target]
+          unitMatrix, weights = self.__sampleProposal__(proposal, size)
+        tempDict = self.__mapFromUnitHypercube__(unitMatrix)
+        estimates = self.__estimates__(self.functionS, tempDict, weights)
+        pb += (self.__mean__(estimates, weights) - pb) * (size / nSamples)
+        pbSquared += (np.mean(estimates**2) - pbSquared) * (size / nSamples)
+        if self.errorModel:
+          errorEstimates = self.__estimates__(self.errorModel, tempDict, weights)
+          pbError += (self.__mean__(errorEstimates, weights) - pbError) * (size / nSamples)
+        if zScore is not None:
+          variance = pbSquared - pb**2
+          halfWidth = zScore * math.sqrt(max(variance, 0.) / nSamples)
+          self.raiseADebug('Samples: {}, probability: {:1.6e}, confidence half-width: {:1.3e}'.format(nSamples, pb, halfWidth))
+          # do not trust a null variance (e.g. no event found yet)
+          if variance > 0. and halfWidth <= self.tolerance:
+            break
+      self.raiseADebug('Limit surface integrated with {} samples'.format(nSamples))
       if self.errorModel:
-        boundError = abs(pb-self.stat.run({'targets':{self.target:xarray.DataArray(self.errorModel.evaluate(tempDict)[self.target])}})[self.computationPrefix +"_"+self.target])
+        boundError = abs(pb - pbError)
     else:
       self.raiseAnError(NotImplemented, "quadrature not yet implemented")
     return pb, boundError
 
+  def __estimates__(self, classifier, tempDict, weights):
+    """
+      Evaluates the classifier on a chunk of samples, returning the Monte Carlo estimator for each sample
+      @ In, classifier, SupervisedGate, the classifier of the limit surface
+      @ In, tempDict, dict, {varName: np.array} samples to evaluate
+      @ In, weights, np.array, importance weights of the samples (None if not importance sampling)
+      @ Out, estimates, np.array, estimator for each sample
+    """
+    estimates = np.asarray(classifier.evaluate(tempDict)[self.target], dtype=float)
+    if weights is not None:
+      estimates = estimates * weights
+    return estimates
+
+  def __mean__(self, estimates, weights):
+    """
+      Mean of the estimator over a chunk of samples
+      @ In, estimates, np.array, estimator for each sample
+      @ In, weights, np.array, importance weights of the samples (None if not importance sampling)
+      @ Out, mean, float, mean of the chunk
+    """
+    if weights is None:
+      return self.stat.run({'targets':{self.target:xarray.DataArray(estimates)}})[self.computationPrefix +"_"+self.target]
+    return np.mean(estimates)
+
+  def __mapFromUnitHypercube__(self, unitMatrix):
+    """
+      Maps samples from the unit hypercube (CDF space) into the variable space
+      @ In, unitMatrix, np.array, samples in the unit hypercube, shape (nSamples, nVars)
+      @ Out, tempDict, dict, {varName: np.array} samples in the variable space
+    """
+    tempDict = {}
+    for index, varName in enumerate(self.variableDist.keys()):
+      dist = self.variableDist[varName]
+      if dist == None:
+        tempDict[varName] = unitMatrix[:, index] * (self.lowerUpperDict[varName]['upperBound'] - self.lowerUpperDict[varName]['lowerBound']) + self.lowerUpperDict[varName]['lowerBound']
+      else:
+        # use the array ppf when the distribution provides one
+        try:
+          values = np.asarray(dist.ppf(unitMatrix[:, index]), dtype=float)
+        except (TypeError, ValueError):
+          values = None
+        if values is None or values.shape != unitMatrix[:, index].shape:
+          values = np.vectorize(dist.ppf, otypes=[float])(unitMatrix[:, index])
+        tempDict[varName] = values
+    return tempDict
+
+  def __mapToUnitHypercube__(self, pointDict):
+    """
+      Maps points from the variable space into the unit hypercube (CDF space)
+      @ In, pointDict, dict, {varName: np.array} points in the variable space
+      @ Out, unitMatrix, np.array, points in the unit hypercube, shape (nPoints, nVars)
+    """
+    unitMatrix = np.zeros((len(pointDict[self.target]), len(self.variableDist.keys())))
+    for index, varName in enumerate(self.variableDist.keys()):
+      dist = self.variableDist[varName]
+      if dist == None:
+        lower = self.lowerUpperDict[varName]['lowerBound']
+        unitMatrix[:, index] = (pointDict[varName] - lower) / (self.lowerUpperDict[varName]['upperBound'] - lower)
+      else:
+        unitMatrix[:, index] = [dist.cdf(value) for value in pointDict[varName]]
+    return unitMatrix
+
+  def __buildProposal__(self):
+    """
+      Builds the importance sampling density in the unit hypercube: a defensive mixture of the uniform
+      density and of Gaussian kernels centered on the limit surface points
+      @ In, None
+      @ Out, proposal, tuple, (centers, bandwidths) of the Gaussian kernels
+    """
+    centers = self.__mapToUnitHypercube__(self.matrixDict)
+    nCenters, nVars = centers.shape
+    # Scott's rule for the kernel bandwidths
+    bandwidths = np.maximum(np.std(centers, axis=0) * nCenters**(-1. / (nVars + 4)), 1e-3)
+    return centers, bandwidths
+
+  def __sampleProposal__(self, proposal, size):
+    """
+      Samples the importance sampling density
+      @ In, proposal, tuple, (centers, bandwidths) of the Gaussian kernels
+      @ In, size, int, number of samples
+      @ Out, unitMatrix, np.array, samples in the unit hypercube, shape (size, nVars)
+      @ Out, weights, np.array, importance weights (ratio of the uniform density to the proposal density)
+    """
+    centers, bandwidths = proposal
+    nCenters, nVars = centers.shape
+    unitMatrix = np.random.rand(size, nVars)
+    fromKernels = np.random.rand(size) >= self.defensiveFraction
+    picked = np.random.randint(nCenters, size=int(fromKernels.sum()))
+    unitMatrix[fromKernels] = centers[picked] + bandwidths * np.random.randn(len(picked), nVars)
+    kernelDensity = np.zeros(size)
+    for center in centers:
+      kernelDensity += np.exp(-0.5 * np.sum(((unitMatrix - center) / bandwidths)**2, axis=1))
+    kernelDensity /= nCenters * (2. * np.pi)**(nVars / 2.) * np.prod(bandwidths)
+    density = self.defensiveFraction + (1. - self.defensiveFraction) * kernelDensity
+    # samples falling outside of the domain do not contribute to the integral
+    inside = np.all((unitMatrix >= 0.) & (unitMatrix < 1.), axis=1)
+    weights = np.where(inside, 1. / density, 0.)
+    unitMatrix[~inside] = 0.5
+    return unitMatrix, weights
+
   def collectOutput(self, finishedJob, output):
     """
       Function to place all of the computed data into the output object
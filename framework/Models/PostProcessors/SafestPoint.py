@@ -282,65 +282,79 @@ class SafestPoint(PostProcessor):
       @ In,  input, object, object contained the data to process. (inputToInternal output)
       @ Out, dataCollector, PointSet, PointSet containing the elaborated data
     """
-    ##TODO: This PP can be LARGELY optimized.
-    nearestPointsInd = []
-    surfTree = spatial.KDTree(copy.copy(self.surfPointsMatrix[:, 0:self.surfPointsMatrix.shape[-1] - 1]))
+    surfCoords = self.surfPointsMatrix[:, 0:self.surfPointsMatrix.shape[-1] - 1]
+    surfTree = spatial.KDTree(copy.copy(surfCoords))
     self.controllableSpace.shape = (np.prod(self.controllableSpace.shape[0:len(self.controllableSpace.shape) - 1]), self.controllableSpace.shape[-1])
     self.nonControllableSpace.shape = (np.prod(self.nonControllableSpace.shape[0:len(self.nonControllableSpace.shape) - 1]), self.nonControllableSpace.shape[-1])
     self.raiseADebug('RESHAPED CONTROLLABLE SPACE:')
     self.raiseADebug(self.controllableSpace)
     self.raiseADebug('RESHAPED NON-CONTROLLABLE SPACE:')
     self.raiseADebug(self.nonControllableSpace)
-    # create space for realization
-    rlz = {key : np.zeros(self.nonControllableSpace.shape[0])  for key in self.controllableOrd+self.nonControllableOrd}
-    rlz[self.outputName] = np.zeros(self.nonControllableSpace.shape[0])
-    rlz['ProbabilityWeight'] = np.zeros(self.nonControllableSpace.shape[0])
-    for ncLine in range(self.nonControllableSpace.shape[0]):
-      queryPointsMatrix = np.append(self.controllableSpace, np.tile(self.nonControllableSpace[ncLine, :], (self.controllableSpace.shape[0], 1)), axis = 1)
-      self.raiseADebug('QUERIED POINTS MATRIX:')
-      self.raiseADebug(queryPointsMatrix)
-      nearestPointsInd = surfTree.query(queryPointsMatrix)[-1]
-      distList = []
-      indexList = []
-      probList = []
-      for index in range(len(nearestPointsInd)):
-        if self.surfPointsMatrix[np.where(np.prod(surfTree.data[nearestPointsInd[index], 0:
-          self.surfPointsMatrix.shape[-1] - 1] == self.surfPointsMatrix[:, 0:self.surfPointsMatrix.shape[-1] - 1], axis = 1))[0][0], -1] == 1:
-          distList.append(np.sqrt(np.sum(np.power(queryPointsMatrix[index, 0:self.controllableSpace.shape[-1]] - surfTree.data[nearestPointsInd[index], 0:self.controllableSpace.shape[-1]], 2))))
-          indexList.append(index)
-      if distList == []:
-        self.raiseAnError(ValueError, 'no safest point found for the current set of non-controllable variables: ' + str(self.nonControllableSpace[ncLine, :]) + '.')
-      else:
-        for cVarIndex in range(len(self.controllableOrd)):
-          rlz[self.controllableOrd[cVarIndex]][ncLine] = copy.copy(queryPointsMatrix[indexList[distList.index(max(distList))], cVarIndex])
-        for ncVarIndex in range(len(self.nonControllableOrd)):
-          rlz[self.nonControllableOrd[ncVarIndex]][ncLine] = queryPointsMatrix[indexList[distList.index(max(distList))], len(self.controllableOrd) + ncVarIndex]
-          if queryPointsMatrix[indexList[distList.index(max(distList))], len(self.controllableOrd) + ncVarIndex] == self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].lowerBound:
-            if self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][0] == 'CDF':
-              prob = self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.
-            else:
-              prob = self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].cdf(self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].lowerBound + self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.)
-          elif queryPointsMatrix[indexList[distList.index(max(distList))], len(self.controllableOrd) + ncVarIndex] == self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].upperBound:
-            if self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][0] == 'CDF':
-              prob = self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.
-            else:
-              prob = 1 - self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].cdf(self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].upperBound - self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.)
-          else:
-            if self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][0] == 'CDF':
-              prob = self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2]
-            else:
-              prob = self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].cdf(queryPointsMatrix[indexList[distList.index(max(distList))],
-                      len(self.controllableOrd) + ncVarIndex] + self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.) - self.nonControllableDist[self.nonControllableOrd[ncVarIndex]].cdf(queryPointsMatrix[indexList[distList.index(max(distList))],
-                      len(self.controllableOrd) + ncVarIndex] - self.nonControllableGrid[self.nonControllableOrd[ncVarIndex]][2] / 2.)
-          probList.append(prob)
-      rlz[self.outputName][ncLine] = np.prod(probList)
-      rlz['ProbabilityWeight'][ncLine] = np.prod(probList)
+    nCtrl, nCtrlVars = self.controllableSpace.shape
+    nNonCtrl = self.nonControllableSpace.shape[0]
+    # query the whole controllable x non-controllable product at once
+    # row "ncLine * nCtrl + cLine" is controllable point cLine with non-controllable point ncLine
+    queryPointsMatrix = np.append(np.tile(self.controllableSpace, (nNonCtrl, 1)),
+                                  np.repeat(self.nonControllableSpace, nCtrl, axis=0), axis=1)
+    self.raiseADebug('QUERIED POINTS MATRIX:')
+    self.raiseADebug(queryPointsMatrix)
+    nearestPointsInd = surfTree.query(queryPointsMatrix)[-1]
+    # label of each surface point, taken from the first surface entry with the same coordinates
+    _, firstEntry, sameCoords = np.unique(surfCoords, axis=0, return_index=True, return_inverse=True)
+    surfLabels = self.surfPointsMatrix[firstEntry[np.ravel(sameCoords)], -1]
+    safe = (surfLabels[nearestPointsInd] == 1).reshape(nNonCtrl, nCtrl)
+    # distance in the controllable space from each query point to its nearest surface point
+    distances = np.sqrt(np.sum(np.power(queryPointsMatrix[:, 0:nCtrlVars] - surfTree.data[nearestPointsInd, 0:nCtrlVars], 2), axis=1))
+    distances = np.where(safe, distances.reshape(nNonCtrl, nCtrl), -np.inf)
+    noSafe = np.where(~safe.any(axis=1))[0]
+    if len(noSafe):
+      self.raiseAnError(ValueError, 'no safest point found for the current set of non-controllable variables: ' + str(self.nonControllableSpace[noSafe[0], :]) + '.')
+    # safest controllable point is the (first) farthest one from the surface
+    safest = np.argmax(distances, axis=1)
+    rlz = {}
+    for cVarIndex, varName in enumerate(self.controllableOrd):
+      rlz[varName] = self.controllableSpace[safest, cVarIndex].copy()
+    probability = np.ones(nNonCtrl)
+    for ncVarIndex, varName in enumerate(self.nonControllableOrd):
+      rlz[varName] = self.nonControllableSpace[:, ncVarIndex].copy()
+      # the grid has only a few distinct values per variable; compute their cell probability once
+      values, position = np.unique(rlz[varName], return_inverse=True)
+      cellProbs = np.array([self.__cellProbability__(varName, value) for value in values])
+      probability *= cellProbs[np.ravel(position)]
+    rlz[self.outputName] = probability
+    rlz['ProbabilityWeight'] = probability.copy()
     metadata = {'ProbabilityWeight':xarray.DataArray(rlz['ProbabilityWeight'])}
     targets = {tar:xarray.DataArray( rlz[tar])  for tar in self.controllableOrd}
     rlz['ExpectedSafestPointCoordinates'] = self.stat.run({'metadata':metadata, 'targets':targets})
     self.raiseADebug(rlz['ExpectedSafestPointCoordinates'])
     return rlz
 
+  def __cellProbability__(self, varName, value):
+    """
+      Computes the probability of the grid cell centered at a value of a non-controllable variable
+      @ In, varName, string, non-controllable variable name
+      @ In, value, float, coordinate of the grid point
+      @ Out, prob, float, probability of the cell
+    """
+    dist = self.nonControllableDist[varName]
+    gridType, _, stepLength = self.nonControllableGrid[varName]
+    if value == dist.lowerBound:
+      if gridType == 'CDF':
+        prob = stepLength / 2.
+      else:
+        prob = dist.cdf(dist.lowerBound + stepLength / 2.)
+    elif value == dist.upperBound:
+      if gridType == 'CDF':
+        prob = stepLength / 2.
+      else:
+        prob = 1 - dist.cdf(dist.upperBound - stepLength / 2.)
+    else:
+      if gridType == 'CDF':
+        prob = stepLength
+      else:
+        prob = dist.cdf(value + stepLength / 2.) - dist.cdf(value - stepLength / 2.)
+    return prob
+
   def collectOutput(self, finishedJob, output):
     """
       Function to place all of the computed data into the output object
@@ -20,6 +20,7 @@ from __future__ import division, print_function , unicode_literals, absolute_imp
 
 #External Modules---------------------------------------------------------------
 import numpy as np
+import xarray as xr
 #External Modules End-----------------------------------------------------------
 
 #Internal Modules---------------------------------------------------------------
@@ -98,35 +99,54 @@ class ValueDuration(PostProcessor):
     """
       This method executes the postprocessor action.
       @ In, inputIn, object, object contained the data to process. (inputToInternal output)
-      @ Out, realizations, list, list of realizations obtained
+      @ Out, results, xr.Dataset, duration curves of all the realizations, indexed by sample and bin
     """
     inData = self.inputToInternal(inputIn)
-    realizations = []
-    # new load duration curve for each sample
-    for s in range(len(inData)):
-      # obtain relevant sample
-      sample = inData.realization(index=s)
-      # solutions for each realization are stored in this dict
-      rlz = {}
-      # separate curve for each target
-      for target in self.targets:
-        data = sample[target]
-        # bin values
-        counts, edges = np.histogram(data,self.numBins)
-        ## reverse order of histogram, edges to get load duration axes
-        counts = counts[::-1]
-        edges = edges[::-1]
-        ## cumulatively stack counts, starting with highest value bin
-        cumulative = np.cumsum(counts)
+    dataset = inData.asDataset()
+    sampleTag = inData.sampleTag
+    pivot = inData.indexes[0]
+    results = xr.Dataset()
+    # separate curve for each target, all the realizations are binned at once
+    for target in self.targets:
+      histories = dataset[target].transpose(sampleTag, pivot).values
+      counts, edges = self._histogram(histories)
+      ## reverse order of histogram, edges to get load duration axes
+      counts = counts[:, ::-1]
+      edges = edges[:, ::-1]
+      ## cumulatively stack counts, starting with highest value bin
+      results['counts_'+target] = ((sampleTag, 'bin'), np.cumsum(counts, axis=1))
+      ## only keep upper value of edges so lengths match
+      results['bins_'+target] = ((sampleTag, 'bin'), edges[:, 1:])
+    return results
 
-        # store results
-        rlz['counts_'+target] = cumulative
-        ## only keep upper value of edges so lengths match
-        rlz['bins_'+target] = edges[1:]
-
-        realizations.append(rlz)
-
-    return realizations
+  def _histogram(self, histories):
+    """
+      Bins each history in self.numBins equal-width bins, as np.histogram would, for all the histories at once.
+      @ In, histories, np.array, histories as (realization, time), NaN-padded where the histories
+        do not share the same time values
+      @ Out, counts, np.array, number of values in each bin, as (realization, bin)
+      @ Out, edges, np.array, edges of the bins, as (realization, bin edge)
+    """
+    nSamples = histories.shape[0]
+    valid = np.logical_not(np.isnan(histories))
+    first = np.nanmin(histories, axis=1)
+    last = np.nanmax(histories, axis=1)
+    # constant histories get a unit-width range around their value
+    same = first == last
+    first = np.where(same, first - 0.5, first)
+    last = np.where(same, last + 0.5, last)
+    edges = np.linspace(first, last, self.numBins + 1, axis=1)
+    # bin of each value; the estimate is corrected against the edges, so that values
+    # falling on an edge are placed in the upper bin (the last bin is closed)
+    rows = np.nonzero(valid)[0]
+    values = histories[valid]
+    indices = ((values - first[rows]) / (last - first)[rows] * self.numBins).astype(int)
+    indices = np.clip(indices, 0, self.numBins - 1)
+    indices[values < edges[rows, indices]] -= 1
+    increment = (values >= edges[rows, indices + 1]) & (indices != self.numBins - 1)
+    indices[increment] += 1
+    counts = np.bincount(rows*self.numBins + indices, minlength=nSamples*self.numBins)
+    return counts.reshape(nSamples, self.numBins), edges
 
   def collectOutput(self, finishedJob, output):
     """
@@ -136,6 +156,7 @@ class ValueDuration(PostProcessor):
       @ Out, None
     """
     evaluation = finishedJob.getEvaluation()
-    realizations = evaluation[1]
-    for rlz in realizations:
-      output.addRealization(rlz)
+    results = evaluation[1]
+    # the bins differ in each realization, so they are loaded as one history per realization
+    data = dict((var, results[var].values) for var in results.data_vars)
+    output.load(data, style='dict', dims=output.getDimensions())
@@ -247,6 +247,7 @@ class ROM(Dummy):
     ### ARMA multicycle
     multiYear = InputData.parameterInputFactory('Multicycle')
     multiYear.addSub(InputData.parameterInputFactory('cycles', contentType=InputTypes.IntegerType))
+    multiYear.addSub(InputData.parameterInputFactory('batch', contentType=InputTypes.BoolType))
     growth = InputData.parameterInputFactory('growth', contentType=InputTypes.FloatType)
     growth.addParam('targets', InputTypes.StringListType, True)
     growth.addParam('start_index', InputTypes.IntegerType)
@@ -283,6 +284,7 @@ class ROM(Dummy):
     inputSpecification.addSub(InputData.parameterInputFactory("polyOrder", contentType=InputTypes.IntegerType))
     coeffRegressorEnumType = InputTypes.makeEnumType("coeffRegressor","coeffRegressorType",["poly","spline","nearest"])
     inputSpecification.addSub(InputData.parameterInputFactory("coeffRegressor", contentType=coeffRegressorEnumType))
+    inputSpecification.addSub(InputData.parameterInputFactory("warmStart", contentType=InputTypes.BoolType))
     # DMD
     inputSpecification.addSub(InputData.parameterInputFactory("rankSVD", contentType=InputTypes.IntegerType))
     inputSpecification.addSub(InputData.parameterInputFactory("energyRankSVD", contentType=InputTypes.FloatType))
@@ -290,6 +292,7 @@ class ROM(Dummy):
     inputSpecification.addSub(InputData.parameterInputFactory("exactModes", contentType=InputTypes.BoolType))
     inputSpecification.addSub(InputData.parameterInputFactory("optimized", contentType=InputTypes.BoolType))
     inputSpecification.addSub(InputData.parameterInputFactory("dmdType", contentType=InputTypes.StringType))
+    inputSpecification.addSub(InputData.parameterInputFactory("randomizedSVD", contentType=InputTypes.BoolType))
 
     # for deep learning neural network
     #inputSpecification.addSub(InputData.parameterInputFactory("DNN", InputTypes.StringType))
@@ -1312,6 +1315,24 @@ class ROM(Dummy):
     # since we pop this out during saving state, initialize it here
     self.assemblerDict = {}
 
+  def _localWhatDoINeed(self):
+    """
+      This method is a local mirror of the general whatDoINeed method.
+      The ROM requests the JobHandler, so that ROM collections can train their sub-ROMs in parallel.
+      @ In, None
+      @ Out, needDict, dict, list of objects needed
+    """
+    needDict = {'internal':[(None,'jobHandler')]}
+    return needDict
+
+  def _localGenerateAssembler(self, initDict):
+    """
+      Stores the objects requested through "whatDoINeed" that are not listed in the ROM input.
+      @ In, initDict, dict, dictionary ({'mainClassName(e.g., Databases):{specializedObjectName(e.g.,DatabaseForSystemCodeNamedWolf):ObjectInstance}'})
+      @ Out, None
+    """
+    self.assemblerDict['jobHandler'] = [[None, 'internal', 'jobHandler', initDict['internal']['jobHandler']]]
+
   def applyRunInfo(self, runInfo):
     """
       Take information from the RunInfo
@@ -1428,10 +1449,13 @@ class ROM(Dummy):
     metaParams.update(params)
     return metaKeys, metaParams
 
-  def train(self,trainingSet):
+  def train(self,trainingSet,trainingCache=None):
     """
       This function train the ROM
       @ In, trainingSet, dict or PointSet or HistorySet, data used to train the ROM; if an HistorySet is provided the a list of ROM is created in order to create a temporal-ROM
+      @ In, trainingCache, dict, optional, if provided, the conversion of the training DataObject into
+        the internal format is stored here and shared by all the ROMs trained with the same cache
+        (e.g. all the ROMs of a RomTrainer step), so that the training data is only extracted once
       @ Out, None
     """
     if type(trainingSet).__name__ == 'ROM':
@@ -1446,11 +1470,35 @@ class ROM(Dummy):
         if not trainingSet.checkIndexAlignment(indexesToCheck=pivotParameterId):
           self.raiseAnError(IOError, "The data provided by the data object", trainingSet.name, "is not synchonized!",
                   "The time-dependent ROM requires all the histories are synchonized!")
-      self.trainingSet = copy.copy(self._inputToInternal(trainingSet))
-      self._replaceVariablesNamesWithAliasSystem(self.trainingSet, 'inout', False)
+      if trainingCache is None or type(trainingSet).__name__ == 'dict':
+        localInput = self._inputToInternal(trainingSet)
+      else:
+        # the cache is keyed on the data object and its size, in case it has been extended in the meantime
+        key = (id(trainingSet), len(trainingSet))
+        if key not in trainingCache:
+          trainingCache[key] = self._inputToInternal(trainingSet)
+        localInput = trainingCache[key]
+      # each ROM gets its own containers, since training may replace their entries (e.g. the ARMA
+      # replaces the histories with the signal without the long Fourier periods); the arrays are shared
+      self.trainingSet = dict((var, list(vals) if isinstance(vals, list) else copy.copy(vals)) for var, vals in localInput.items())
+      # the alias replacement deep copies the whole training set, only do it if there are aliases
+      if self.alias['input'] or self.alias['output']:
+        self._replaceVariablesNamesWithAliasSystem(self.trainingSet, 'inout', False)
       self.supervisedEngine.train(self.trainingSet, self.assemblerDict)
       self.amITrained = self.supervisedEngine.amITrained
 
+  def loadTrained(self, rom):
+    """
+      Takes over the trained state of a ROM that is not used anywhere else (e.g. just loaded from file).
+      Unlike "train", nothing is copied, so that memory-mapped data and lazily loaded sub-ROMs are kept as they are.
+      @ In, rom, ROM, trained ROM
+      @ Out, None
+    """
+    self.initializationOptionDict = rom.initializationOptionDict
+    self.trainingSet              = rom.trainingSet
+    self.amITrained               = rom.amITrained
+    self.supervisedEngine         = rom.supervisedEngine
+
   def confidence(self,request,target = None):
     """
       This is to get a value that is inversely proportional to the confidence that we have
@@ -286,7 +286,11 @@ class RavenSampled(Optimizer):
     # _, full = self._targetEvaluation.realization(matchDict={'prefix': prefix}, asDataSet=False)
     if self._targetEvaluation.isEmpty:
       self.raiseAnError(RuntimeError, f'Expected to find entry with prefix "{prefix}" in TargetEvaluation "{self._targetEvaluation.name}", but it is empty!')
-    _, full = self._targetEvaluation.realization(matchDict={'prefix': prefix})
+    if self.batch == 1:
+      # already found by prefix above, no need to search the target evaluation again
+      full = rlz
+    else:
+      _, full = self._targetEvaluation.realization(matchDict={'prefix': prefix})
     if full is None:
       self.raiseAnError(RuntimeError, f'Expected to find entry with prefix "{prefix}" in TargetEvaluation! Found: {self._targetEvaluation.getVarValues("prefix")}')
     # trim down opt point to the useful parts
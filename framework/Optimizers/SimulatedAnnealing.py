@@ -148,6 +148,16 @@ class SimulatedAnnealing(RavenSampled):
       for par,descr in param.items():
         sch.addSub(InputData.parameterInputFactory(par, contentType = InputTypes.FloatType,descr=descr))
       coolingSchedule.addSub(sch)
+
+    # Population
+    population = InputData.parameterInputFactory('population', contentType=InputTypes.IntegerType,
+        printPriority=110,
+        descr=r"""number of neighbours generated for each trajectory at every iteration. All the neighbours
+              are evaluated together, and the acceptance criterion is applied to all of them at once;
+              among the accepted neighbours, the one with the best objective value becomes the new state
+              of the trajectory. Values larger than 1 allow the Model evaluations of a single trajectory
+              to run in parallel. \default{1}""")
+    specs.addSub(population)
     return specs
 
   @classmethod
@@ -187,6 +197,10 @@ class SimulatedAnnealing(RavenSampled):
     self.T = None                                               # current temperature
     self._coolingMethod = None                                  # initializing cooling method
     self._coolingParameters = {}                                # initializing the cooling schedule parameters
+    self._populationSize = 1                                    # number of neighbours evaluated for each iteration
+    self._candidates = {}                                       # by traj, collected neighbours of the current iteration
+    self._candidateSteps = {}                                   # by traj, {candidate: amp and delta info} of submitted neighbours
+    self._populationDecision = {}                               # by traj, acceptance decided over the whole population
 
   def handleInput(self, paramInput):
     """
@@ -234,6 +248,13 @@ class SimulatedAnnealing(RavenSampled):
       self._coolingParameters['c'] = 1.0
       self._coolingParameters['d'] = 1.0
 
+    # Population
+    populationNode = paramInput.findFirst('population')
+    if populationNode is not None:
+      if populationNode.value < 1:
+        self.raiseAnError(IOError, 'The <population> of SimulatedAnnealing must be at least 1! Got: {}'.format(populationNode.value))
+      self._populationSize = populationNode.value
+
   def initialize(self, externalSeeding=None, solutionExport=None):
     """
       This function should be called every time a clean optimizer is needed. Called before takeAstep in <Step>
@@ -262,6 +283,8 @@ class SimulatedAnnealing(RavenSampled):
     self._convergenceInfo[traj] = {'persistence': 0}
     for criteria in self._convergenceCriteria:
       self._convergenceInfo[traj][criteria] = False
+    self._candidates[traj] = []
+    self._candidateSteps[traj] = {}
     return traj
 
   def _submitRun(self, point, traj, step, moreInfo=None):
@@ -297,6 +320,12 @@ class SimulatedAnnealing(RavenSampled):
       @ Out, None
     """
     traj = info['traj']
+    if 'candidate' in info:
+      # one of a population of neighbours; wait until all of them have been collected
+      self._candidates[traj].append((rlz, info))
+      if len(self._candidates[traj]) < len(self._candidateSteps[traj]):
+        return
+      rlz, info = self._selectCandidate(traj)
     info['optVal'] = rlz[self._objectiveVar]
     self.incrementIteration(traj)
     self._resolveNewOptPoint(traj, rlz, rlz[self._objectiveVar], info)
@@ -311,7 +340,9 @@ class SimulatedAnnealing(RavenSampled):
     currentPoint = self._collectOptPoint(rlz)
     T0 = self._temperature(fraction)
     self.T = self._coolingSchedule(iter,T0)
-    if traj in self._activeTraj:
+    if traj in self._activeTraj and self._populationSize > 1:
+      self._submitPopulation(rlz, traj, currentPoint, fraction)
+    elif traj in self._activeTraj:
       newPoint = self._nextNeighbour(rlz,fraction)
       # check new opt point against constraints
       try:
@@ -324,6 +355,57 @@ class SimulatedAnnealing(RavenSampled):
         return
       self._submitRun(suggested, traj, self.getIteration(traj))
 
+  def _submitPopulation(self, rlz, traj, currentPoint, fraction):
+    """
+      Submits a population of neighbours of the current state of a trajectory
+      @ In, rlz, dict, current state of the trajectory
+      @ In, traj, int, trajectory identifier
+      @ In, currentPoint, dict, current opt point (input space only)
+      @ In, fraction, float, the current iteration divided by the iteration limit
+      @ Out, None
+    """
+    neighbours, steps = self._nextNeighbours(rlz, fraction, size=self._populationSize)
+    self._candidates[traj] = []
+    self._candidateSteps[traj] = {}
+    for c, newPoint in enumerate(neighbours):
+      try:
+        suggested, _ = self._handleExplicitConstraints(newPoint, currentPoint, 'opt')
+      except NoConstraintResolutionFound:
+        continue
+      self._candidateSteps[traj][c] = steps[c]
+      self._submitRun(suggested, traj, self.getIteration(traj), moreInfo={'candidate': c})
+    if not self._candidateSteps[traj]:
+      self.raiseAMessage('Optimizer "{}" trajectory {} was unable to continue due to functional or boundary constraints.'
+                        .format(self.name, traj))
+      self._closeTrajectory(traj, 'converge', 'no constraint resolution', rlz[self._objectiveVar])
+
+  def _selectCandidate(self, traj):
+    """
+      Applies the acceptance criterion to all the collected neighbours of a trajectory at once,
+      and selects the one that will be considered as the new opt point.
+      @ In, traj, int, trajectory identifier
+      @ Out, rlz, dict, realization of the selected neighbour
+      @ Out, info, dict, identifying information of the selected neighbour
+    """
+    candidates = self._candidates[traj]
+    self._candidates[traj] = []
+    old, _ = self._optPointHistory[traj][-1]
+    values = np.array([float(np.ravel(cRlz[self._objectiveVar])[0]) for cRlz, _ in candidates])
+    prob = self._acceptabilityCriterion(old[self._objectiveVar], values)
+    accepted = prob > randomUtils.random(dim=len(candidates), samples=1, keepMatrix=True)[0]
+    if accepted.any():
+      # best among the accepted neighbours
+      best = int(np.argmin(np.where(accepted, values, np.inf)))
+      self._populationDecision[traj] = 'accepted'
+    else:
+      # none accepted: report the best neighbour as the rejected opt point
+      best = int(np.argmin(values))
+      self._populationDecision[traj] = 'rejected'
+    rlz, info = candidates[best]
+    self.info.update(self._candidateSteps[traj][info['candidate']])
+    self.raiseADebug('Trajectory {} selected neighbour {} of {} ({} accepted)'.format(traj, info['candidate'], len(candidates), int(accepted.sum())))
+    return rlz, info
+
   # * * * * * * * * * * * * * * * *
   # Convergence Checks
   convFormat = RavenSampled.convFormat
@@ -424,6 +506,8 @@ class SimulatedAnnealing(RavenSampled):
     """
     # Check acceptability
     # NOTE: if self._optPointHistory[traj]: -> faster to use "try" for all but the first time
+    # acceptance may have already been decided over a whole population of neighbours
+    decision = self._populationDecision.pop(traj, None)
     try:
       old, _ = self._optPointHistory[traj][-1]
       oldVal = old[self._objectiveVar]
@@ -437,6 +521,8 @@ class SimulatedAnnealing(RavenSampled):
       elif all(opt[var] == old[var] for var in self.toBeSampled):
         # this is the classic "same point" trap; we accept the same point, and check convergence later
         acceptable = 'accepted'
+      elif decision is not None:
+        acceptable = decision
       else:
         if self._acceptabilityCriterion(oldVal,opt[self._objectiveVar])>randomUtils.random(dim=1, samples=1): # TODO replace it back
           acceptable = 'accepted'
@@ -454,17 +540,20 @@ class SimulatedAnnealing(RavenSampled):
     """
       Check if new opt point is acceptably better than the old one
       @ In, currentObjective, float, the current value of the objective function (i.e., current energy)
-      @ In, newObjective, float, the value of the objective function at the new candidate
-      @ Out, prob, float, the acceptance probability
+      @ In, newObjective, float or np.array, the value of the objective function at the new candidate(s)
+      @ Out, prob, float or np.array, the acceptance probability
     """
     kB = 1
-
-    if newObjective <= currentObjective:
-      prob = 1
+    newObjective = np.asarray(newObjective)
+    improved = newObjective <= currentObjective
+    if self.T <= 0:
+      # frozen system: only improvements are accepted (also avoids 0/0 for equal objectives)
+      prob = np.where(improved, 1.0, 0.0)
     else:
-      deltaE = newObjective - currentObjective
-      prob = min(1,np.exp(-deltaE/(kB * self.T)))
-    return prob
+      # the energy increase is clipped so that the (discarded) exponential of improvements cannot overflow
+      deltaE = np.maximum(newObjective - currentObjective, 0)
+      prob = np.where(improved, 1.0, np.exp(-deltaE/(kB * self.T)))
+    return prob if prob.ndim else float(prob)
 
   def _updateConvergence(self, traj, new, old, acceptable):
     """
@@ -628,9 +717,23 @@ class SimulatedAnnealing(RavenSampled):
   def _nextNeighbour(self, rlz,fraction=1):
     """
       Perturbs the state to find the next random neighbour based on the cooling schedule
+      (see _nextNeighbours for the perturbation formulas)
       @ In, rlz, dict, current realization
       @ In, fraction, float, optional, the current iteration divided by the iteration limit i.e., $\frac{iter}{Limit}$
       @ Out, nextNeighbour, dict, the next random state
+    """
+    neighbours, steps = self._nextNeighbours(rlz, fraction)
+    self.info.update(steps[0])
+    return neighbours[0]
+
+  def _nextNeighbours(self, rlz, fraction=1, size=1):
+    """
+      Perturbs the state to find several random neighbours at once based on the cooling schedule
+      @ In, rlz, dict, current realization
+      @ In, fraction, float, optional, the current iteration divided by the iteration limit i.e., $\frac{iter}{Limit}$
+      @ In, size, int, optional, number of neighbours to generate
+      @ Out, neighbours, list(dict), the next random states
+      @ Out, steps, list(dict), amplitude and step size of each variable for each neighbour
 
       for exponential cooling:
       .. math::
@@ -670,28 +773,35 @@ class SimulatedAnnealing(RavenSampled):
 
       where :math: `r \\sim \\mathcal{U}(0,1)`
     """
-    nextNeighbour = {}
-    D = len(self.toBeSampled.keys())
+    varNames = list(self.toBeSampled.keys())
+    D = len(varNames)
     alpha = 0.94
+    # one row of perturbations for each neighbour
     if self._coolingMethod in ['exponential', 'geometric']:
       amp = ((fraction)**-1) / 20
-      r = randomUtils.random(dim=D, samples=1)
+      r = randomUtils.random(dim=D, samples=size, keepMatrix=True)
       delta = (-amp/2.)+ amp * r
     elif self._coolingMethod == 'boltzmann':
       amp = min(np.sqrt(self.T), 1/3.0/alpha)
-      delta =  randomUtils.randomNormal(size=D)*alpha*amp
+      delta =  randomUtils.randomNormal(size=(size, D), keepMatrix=True)*alpha*amp
     elif self._coolingMethod == 'veryfast':
-      amp = randomUtils.random(dim=D, samples=1)
+      amp = randomUtils.random(dim=D, samples=size, keepMatrix=True)
       delta = np.sign(amp-0.5)*self.T*((1+1.0/self.T)**abs(2*amp-1)-1.0)
     elif self._coolingMethod == 'cauchy':
-      amp = (np.pi - (-np.pi))*randomUtils.random(dim=D, samples=1)-np.pi
+      amp = (np.pi - (-np.pi))*randomUtils.random(dim=D, samples=size, keepMatrix=True)-np.pi
       delta = alpha*self.T*np.tan(amp)
-    for i,var in enumerate(self.toBeSampled.keys()):
-      nextNeighbour[var] = rlz[var] + delta[i]
-      self.info['amp_'+var] = amp
-      self.info['delta_'+var] = delta[i]
-    self.info['fraction'] = fraction
-    return nextNeighbour
+    current = np.array([rlz[var] for var in varNames], dtype=float).ravel()
+    points = current + delta
+    neighbours = []
+    steps = []
+    for n in range(size):
+      neighbours.append(dict((var, points[n, i]) for i, var in enumerate(varNames)))
+      step = {'fraction': fraction}
+      for i, var in enumerate(varNames):
+        step['amp_'+var] = amp[n] if np.ndim(amp) else amp
+        step['delta_'+var] = delta[n, i]
+      steps.append(step)
+    return neighbours, steps
 
   def _fixFuncConstraintViolations(self,suggested):
     """
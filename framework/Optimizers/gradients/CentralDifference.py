@@ -3,7 +3,8 @@
   Author:--gairabhi
 """
 import copy
-from utils import mathUtils, InputData
+import numpy as np
+from utils import InputData
 
 from .GradientApproximater import GradientApproximater
 
@@ -84,31 +85,20 @@ class CentralDifference(GradientApproximater):
       @ Out, direction, dict, versor (unit vector) for gradient direction
       @ Out, foundInf, bool, if True then infinity calculations were used
     """
-    gradient = {}
-    for v, var in enumerate(self._optVars):
-      # get the positive and negative sides for this var
-      neg = None
-      pos = None
-      # TODO this search could get expensive in high dimensions!
-      for g, grad in enumerate(grads):
-        info = infos[g]
-        if info['optVar'] == var:
-          if info['side'] == 'negative':
-            neg = grad
-          else:
-            pos = grad
-          if neg and pos:
-            break
-      # dh for pos and neg (note we don't assume delta was unchanged, we recalculate it)
-      dhNeg = opt[var] - neg[var]
-      dhPos = pos[var] - opt[var]
-      # 3-point central difference doesn't use opt point, since it cancels out
-      # also the terms are weighted by the dh on each side
-      gradient[var] = 1/(2*dhNeg) * pos[objVar] - 1/(2*dhPos) * neg[objVar]
-
-    magnitude, direction, foundInf = mathUtils.calculateMagnitudeAndVersor(list(gradient.values()))
-    direction = dict((var, float(direction[v])) for v, var in enumerate(gradient.keys()))
-    return magnitude, direction, foundInf
+    # get the positive and negative sides for each var
+    sides = dict(((info['optVar'], info['side']), grad) for grad, info in zip(grads, infos))
+    neg = [sides[(var, 'negative')] for var in self._optVars]
+    pos = [sides[(var, 'positive')] for var in self._optVars]
+    optVals = np.array([opt[var] for var in self._optVars], dtype=float).ravel()
+    # dh for pos and neg (note we don't assume delta was unchanged, we recalculate it)
+    dhNeg = optVals - np.array([pt[var] for pt, var in zip(neg, self._optVars)], dtype=float).ravel()
+    dhPos = np.array([pt[var] for pt, var in zip(pos, self._optVars)], dtype=float).ravel() - optVals
+    # 3-point central difference doesn't use opt point, since it cancels out
+    # also the terms are weighted by the dh on each side
+    posLoss = np.array([pt[objVar] for pt in pos], dtype=float).ravel()
+    negLoss = np.array([pt[objVar] for pt in neg], dtype=float).ravel()
+    gradient = 1/(2*dhNeg) * posLoss - 1/(2*dhPos) * negLoss
+    return self._gradientMagnitudeAndVersor(gradient, self._optVars)
 
   def numGradPoints(self):
     """
@@ -16,7 +16,7 @@
 """
 import copy
 import numpy as np
-from utils import InputData, InputTypes, randomUtils, mathUtils
+from utils import InputData, InputTypes, randomUtils
 from .GradientApproximater import GradientApproximater
 
 class FiniteDifference(GradientApproximater):
@@ -176,18 +176,10 @@ class FiniteDifference(GradientApproximater):
       @ Out, direction, dict, versor (unit vector) for gradient direction
       @ Out, foundInf, bool, if True then infinity calculations were used
     """
-    gradient = {}
-    for g, pt in enumerate(grads):
-      info = infos[g]
-      delta = info['delta']
-      activeVar = info['optVar']
-      lossDiff = np.atleast_1d(mathUtils.diffWithInfinites(pt[objVar], opt[objVar]))
-      grad = lossDiff/delta
-      gradient[activeVar] = grad
+    lossDiffs = self._lossDifferences([pt[objVar] for pt in grads], opt[objVar])
+    deltas = np.array([info['delta'] for info in infos], dtype=float)
     # obtain the magnitude and versor of the gradient to return
-    magnitude, direction, foundInf = mathUtils.calculateMagnitudeAndVersor(list(gradient.values()))
-    direction = dict((var, float(direction[v])) for v, var in enumerate(gradient.keys()))
-    return magnitude, direction, foundInf
+    return self._gradientMagnitudeAndVersor(lossDiffs / deltas, [info['optVar'] for info in infos])
 
 
   def numGradPoints(self):
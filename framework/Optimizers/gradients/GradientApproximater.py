@@ -18,6 +18,7 @@
   @author: talbpaul
 """
 import abc
+import numpy as np
 
 from utils import utils, InputData, InputTypes
 
@@ -141,5 +142,43 @@ class GradientApproximater(utils.metaclass_insert(abc.ABCMeta, object)):
   ###################
   # Utility Methods #
   ###################
+  def _gradientMagnitudeAndVersor(self, gradient, varNames):
+    """
+      Obtains the magnitude and direction of an approximated gradient, treating all components at once.
+      Infinite components are handled as in mathUtils.calculateMagnitudeAndVersor.
+      @ In, gradient, np.array, approximated gradient component for each variable
+      @ In, varNames, list(str), names of the variables, in the same order as "gradient"
+      @ Out, magnitude, float, magnitude of gradient
+      @ Out, direction, dict, versor (unit vector) for gradient direction
+      @ Out, foundInf, bool, if True then infinity calculations were used
+    """
+    gradient = np.asarray(gradient, dtype=float)
+    magnitude = np.linalg.norm(gradient)
+    foundInf = False
+    if magnitude == np.inf:
+      foundInf = True
+      # "divide by infinity": finite components vanish, infinite components keep their sign
+      gradient = np.where(np.isfinite(gradient), 0.0, np.sign(gradient))
+      magnitude = np.linalg.norm(gradient)
+    if magnitude != 0.0:
+      gradient = gradient / magnitude
+    direction = dict((var, float(gradient[v])) for v, var in enumerate(varNames))
+    return magnitude, direction, foundInf
+
+  @staticmethod
+  def _lossDifferences(losses, reference):
+    """
+      Calculates the differences between many objective values and a reference value, where
+      infinites of the same sign are considered equal (see mathUtils.diffWithInfinites).
+      @ In, losses, list, objective values (floats or length-1 arrays)
+      @ In, reference, float, reference objective value (could be a length-1 array)
+      @ Out, diffs, np.array, losses - reference
+    """
+    losses = np.array(losses, dtype=float).ravel()
+    reference = np.atleast_1d(reference).astype(float)[0]
+    with np.errstate(invalid='ignore'):
+      diffs = losses - reference
+    diffs[losses == reference] = 0.0
+    return diffs
 
 
@@ -16,7 +16,7 @@
   Author: gairabhi
 """
 import numpy as np
-from utils import randomUtils, mathUtils, InputData
+from utils import randomUtils, InputData
 from .GradientApproximater import GradientApproximater
 
 class SPSA(GradientApproximater):
@@ -86,15 +86,10 @@ class SPSA(GradientApproximater):
       @ Out, magnitude, float, magnitude of gradient
       @ Out, direction, dict, versor (unit vector) for gradient direction
     """
-    gradient = {}
-    lossDiff = np.atleast_1d(mathUtils.diffWithInfinites(grads[0][objVar], opt[objVar]))
-    for var in self._optVars:
-      # don't assume delta is unchanged; calculate it here
-      delta = grads[0][var] - opt[var]
-      gradient[var] = lossDiff / delta
-    magnitude, direction, foundInf = mathUtils.calculateMagnitudeAndVersor(list(gradient.values()))
-    direction = dict((var, float(direction[v])) for v, var in enumerate(gradient.keys()))
-    return magnitude, direction, foundInf
+    lossDiff = self._lossDifferences([grads[0][objVar]], opt[objVar])
+    # don't assume delta is unchanged; calculate it here
+    deltas = np.array([grads[0][var] - opt[var] for var in self._optVars], dtype=float).ravel()
+    return self._gradientMagnitudeAndVersor(lossDiff / deltas, self._optVars)
 
   def numGradPoints(self):
     """
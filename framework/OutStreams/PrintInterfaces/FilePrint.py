@@ -34,7 +34,7 @@ class FilePrint(PrintInterface):
     """
     spec = super().getInputSpecification()
 
-    types = InputTypes.makeEnumType('FilePrintTypes', 'FilePrintTypes', ['csv', 'xml'])
+    types = InputTypes.makeEnumType('FilePrintTypes', 'FilePrintTypes', ['csv', 'columnar', 'xml'])
     spec.addSub(InputData.parameterInputFactory('type', contentType=types))
     spec.addSub(InputData.parameterInputFactory('source', contentType=InputTypes.StringListType))
     spec.addSub(InputData.parameterInputFactory('what', contentType=InputTypes.StringListType))
@@ -91,7 +91,7 @@ class FilePrint(PrintInterface):
       self.options['clusterLabel'] = cluster.value
 
     # checks
-    if self.options['type'] == 'csv' and self.what is not None:
+    if self.options['type'] in ['csv', 'columnar'] and self.what is not None:
       for target in [x.lower() for x in self.what]:
         if not target.startswith(('input', 'output', 'metadata')):
           self.raiseAnError(IOError, f'<what> requests must start with "input", "output", or "metadata"! See OutStream.Print "{self.name}"')
@@ -148,7 +148,7 @@ class FilePrint(PrintInterface):
         empty = self.sourceData[index].isEmpty
       except AttributeError:
         empty = False
-      if self.options['type'] == 'csv':
+      if self.options['type'] in ['csv', 'columnar']:
         filename = dictOptions['filenameroot']
         rlzIndex = self.indexPrinted.get(filename,0)
         dictOptions['firstIndex'] = rlzIndex
@@ -159,7 +159,7 @@ class FilePrint(PrintInterface):
           else:
             dictOptions['clusterLabel'] = self.options['clusterLabel']
         try:
-          rlzIndex = self.sourceData[index].write(filename,style='CSV',**dictOptions)
+          rlzIndex = self.sourceData[index].write(filename,style=self.options['type'],**dictOptions)
         except AttributeError:
           self.raiseAnError(NotImplementedError, 'No implementation for source type', self.sourceData[index].type, 'and output type "'+str(self.options['type'].strip())+'"!')
         finally:
@@ -118,6 +118,8 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     #convergence parameters
     self.subsetImpact    = {}    #actual impact on variance by subset combo
     self.subsetExpImpact = {}    #estimated impact on variance by subset combo
+    self.subsetVariance  = {}    #variance of the trained subset ROMs by target, subset; updated only on (re)training
+    self.trainedState    = {}    #by subset, the state of the subset sampler when its ROM was last trained
     self.done            = False #boolean to track if we've converged, or gone over limit
     self.distinctPoints  = set() #list of points needed to make this ROM, for counting purposes
     self.numConverged    = 0     #tracking for persistance
@@ -206,6 +208,7 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     SVL = self.readFromROM()
     self.targets = SVL.target
     self.subsetImpact = {key: dict({}) for key in self.targets}
+    self.subsetVariance = {key: dict({}) for key in self.targets}
     #generate quadratures and polynomials
     self._generateQuadsAndPolys(SVL)
     #set up reference case
@@ -256,8 +259,7 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
       for item in self.inTraining:
         sub = item[1]
         #train it
-        self.samplers[sub]._finalizeROM()
-        self.romShell[sub].train(self.samplers[sub].solns)
+        self._trainSubset(sub)
         #update the actual impacts
         for t in self.targets:
           self.subsetImpact[t][sub] = self._calcActualImpact(sub,t)
@@ -426,14 +428,15 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
     #TODO FIXME why is this not working, since I'm using "full" as the index set starter?
     #return sens[subset]
     ### END SAVING
+    #the subset variances are stored on training, so unaffected subsets are not recomputed
     totvar = 0
     for s in self.useSet.keys():
-      totvar += self.ROMs[s].__variance__(target)
+      totvar += self.subsetVariance[target][s]
     #avoid div by 0 error
     if totvar > 0:
-      return self.ROMs[subset].__variance__(target)/totvar
+      return self.subsetVariance[target][subset]/totvar
     else:
-      return self.ROMs[subset].__variance__(target)
+      return self.subsetVariance[target][subset]
 
   def _calcExpImpact(self,subset,target):
     """
@@ -541,12 +544,9 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
                 'polys':self.polyDict,
                 'refs':self.references,
                 'numRuns':len(self.distinctPoints)}
-    #initialize each HDMRRom object in the ROM
-    initDict['ROMs'] = copy.deepcopy(self.ROMs)
-    #remove unfinished subsets
-    for subset in self.ROMs.keys():
-      if subset not in self.useSet.keys() and subset not in include:
-        del initDict['ROMs'][subset]
+    #initialize each HDMRRom object in the ROM, without copying the unfinished subsets
+    initDict['ROMs'] = copy.deepcopy(dict((subset,rom) for subset,rom in self.ROMs.items()
+                                          if subset in self.useSet.keys() or subset in include))
     rom.supervisedEngine.supervisedContainer[0].initialize(initDict)
 
   def _finalizeSubset(self, subset):
@@ -555,14 +555,13 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
       @ In, subset, tuple(str), subset to finalize
       @ Out, None
     """
-    sampler = self.samplers[subset]
-    #add collected points to sampler's data object, just in case one's missing.  Could be optimized.
-    for pt in self.pointsCollected[subset]:
-      self._addPointToDataObject(subset,pt)
-    #finalize the subset ROM
-    sampler._finalizeROM()
-    #train the ROM
-    self.romShell[subset].train(sampler.solns)
+    #if nothing changed since the subset was last trained, its ROM is already final
+    if self.trainedState.get(subset) != self._subsetState(subset):
+      #add collected points to sampler's data object, just in case one's missing.  Could be optimized.
+      for pt in self.pointsCollected[subset]:
+        self._addPointToDataObject(subset,pt)
+      #finalize and train the ROM
+      self._trainSubset(subset)
     #store rom in dedicated use set
     self.useSet[subset] = self.romShell[subset].supervisedEngine.supervisedContainer[0]
 
@@ -909,6 +908,28 @@ class AdaptiveSobol(Sobol, AdaptiveSparseGrid):
       self.sorted.append(inp)
       self.submittedNotCollected.remove(inp)
 
+  def _subsetState(self,subset):
+    """
+      Summarizes the state of a subset sampler that determines the training of its ROM.
+      @ In, subset, tuple(str), the subset
+      @ Out, state, tuple, the collected points, accepted polynomials, sparse grid size, and number of runs
+    """
+    sampler = self.samplers[subset]
+    return (len(self.pointsCollected[subset]), len(sampler.indexSet.points), len(sampler.sparseGrid),
+            len(sampler.pointsNeededToMakeROM)-sampler.unfinished)
+
+  def _trainSubset(self,subset):
+    """
+      Finalizes and trains the ROM of a subset, and stores its variance for the impact estimates.
+      @ In, subset, tuple(str), the subset to train
+      @ Out, None
+    """
+    self.samplers[subset]._finalizeROM()
+    self.romShell[subset].train(self.samplers[subset].solns)
+    self.trainedState[subset] = self._subsetState(subset)
+    for t in self.targets:
+      self.subsetVariance[t][subset] = self.ROMs[subset].__variance__(t)
+
   def _updateSubset(self,subset):
     """
       Updates the index set for the subset, and updates estimated impacts
@@ -131,30 +131,22 @@ class Sobol(SparseGridCollocation):
     self.references={}
     for var in self.features:
       self.references[var]=self.dists[var].untruncatedMean()
-    self.pointsToRun=[]
     #make sure reference case gets in there
-    newpt = np.zeros(len(self.features))
-    for v,var in enumerate(self.features):
-      newpt[v] = self.references[var]
-    self.pointsToRun.append(tuple(newpt))
-    self.distinctPoints.add(tuple(newpt))
-    #now do the rest
+    refPoint = np.array([self.references[var] for var in self.features])
+    allPoints = [refPoint[np.newaxis,:]]
+    #now do the rest, expanding the cut points of each combo all at once
     for combo,rom in sorted(self.ROMs.items()):
       # just for each combo
       SG = rom.sparseGrid #they all should have the same sparseGrid
       SG._remap(combo)
-      for l in range(len(SG)):
-        pt,wt = SG[l]
-        newpt = np.zeros(len(self.features))
-        for v,var in enumerate(self.features):
-          if var in combo:
-            newpt[v] = pt[combo.index(var)]
-          else:
-            newpt[v] = self.references[var]
-        newpt=tuple(newpt)
-        self.distinctPoints.add(newpt)
-        if newpt not in self.pointsToRun:
-          self.pointsToRun.append(newpt)
+      cutPoints = np.tile(refPoint,(len(SG),1))
+      cutPoints[:,[self.features.index(var) for var in combo]] = np.array(SG.points(),dtype=float).reshape(len(SG),len(combo))
+      allPoints.append(cutPoints)
+    allPoints = np.concatenate(allPoints)
+    #remove duplicates, keeping the points in order of first appearance
+    _,firstIndexes = np.unique(allPoints,axis=0,return_index=True)
+    self.pointsToRun = [tuple(pt) for pt in allPoints[np.sort(firstIndexes)]]
+    self.distinctPoints.update(self.pointsToRun)
     self.limit = len(self.pointsToRun)
     self.raiseADebug('Needed points: %i' %self.limit)
     initdict={'ROMs':self.ROMs,
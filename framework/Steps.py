@@ -38,7 +38,10 @@ from BaseClasses import BaseEntity, InputDataUser
 import Files
 from utils import utils
 from utils import InputData, InputTypes
+from utils.evaluationCache import EvaluationCache
+from utils import romStorage
 import Models
+import SupervisedLearning
 from OutStreams import OutStreamEntity
 from DataObjects import DataObject
 from Databases import Database
@@ -123,6 +126,12 @@ class Step(utils.metaclass_insert(abc.ABCMeta, BaseEntity, InputDataUser)):
     inputSpecification.addParam("pauseAtEnd", InputTypes.StringType)
     inputSpecification.addParam("fromDirectory", InputTypes.StringType)
     inputSpecification.addParam("repeatFailureRuns", InputTypes.StringType)
+    inputSpecification.addParam("evaluationCache", InputTypes.StringType,
+        descr=r"""if provided, the path (relative to the WorkingDir) of an on-disk cache of model evaluations.
+              Before a sample is submitted for evaluation, the cache is searched for a previous evaluation
+              of the same Model (in the same state) with the same sampled values; if found, its results are used instead
+              of running the Model again. New evaluations are added to the cache, which persists across
+              steps and runs. Only used by MultiRun steps.""")
     inputSpecification.addParam("clearRunDir", InputTypes.BoolType,
         descr=r"""indicates whether the run directory should be cleared (removed) before beginning
               the Step calculation. The run directory has the same name as the Step and is located
@@ -567,8 +576,22 @@ class MultiRun(SingleRun):
     super().__init__()
     self._samplerInitDict = {} #this is a dictionary that gets sent as key-worded list to the initialization of the sampler
     self.counter          = 0  #just an handy counter of the runs already performed
+    self._cacheFile       = None # path to the on-disk evaluation cache, if requested
+    self._cache           = None # the evaluation cache, while the step is running
+    self._cacheState      = ''   # hash of the state of the model, part of the keys of the cached evaluations
     self.printTag = 'STEP MULTIRUN'
 
+  def takeAstep(self,inDictionary):
+    """
+      Runs the step, making sure the evaluation cache is closed (and then flushed) even if the step fails
+      @ In, inDictionary, dict, contains the list of instances (see Simulation)
+      @ Out, None
+    """
+    try:
+      SingleRun.takeAstep(self,inDictionary)
+    finally:
+      self._closeCache()
+
   def _localInputAndCheckParam(self,paramInput):
     """
       Place here specialized reading, input consistency check and
@@ -579,6 +602,7 @@ class MultiRun(SingleRun):
     SingleRun._localInputAndCheckParam(self,paramInput)
     if self.samplerType not in [item[0] for item in self.parList]:
       self.raiseAnError(IOError,'It is not possible a multi-run without a sampler or optimizer!')
+    self._cacheFile = paramInput.parameterValues.get('evaluationCache', None)
 
   def _initializeSampler(self,inDictionary):
     """
@@ -642,6 +666,7 @@ class MultiRun(SingleRun):
       if not model.amITrained:
         model.raiseAnError(RuntimeError,'ROM model "%s" has not been trained yet, so it cannot be sampled!' %model.name+\
                                         ' Use a RomTrainer step to train it.')
+    self._openCache(model, inDictionary['Input'], inDictionary['jobHandler'])
     for inputIndex in range(inDictionary['jobHandler'].runInfoDict['batchSize']):
       if inDictionary[self.samplerType].amIreadyToProvideAnInput():
         try:
@@ -697,6 +722,8 @@ class MultiRun(SingleRun):
               self.raiseADebug('Just collected job {j:^8} and sent to output "{o}"'
                               .format(j=finishedJob.identifier,
                                       o=inDictionary['Output'][outIndex].name))
+            if self._cache is not None:
+              self._cacheEvaluation(model, finishedJob)
           # pool it if it failed, before we loop back to "while True" we'll check for these again
           else:
             self.raiseADebug('the job "{}" has failed.'.format(finishedJob.identifier))
@@ -763,6 +790,7 @@ class MultiRun(SingleRun):
     # END while loop that runs the step iterations (collection and submission-for-DET)
     # if any collected runs failed, let the sampler treat them appropriately, and any other closing-out actions
     sampler.finalizeSampler(self.failedRuns)
+    self._closeCache()
 
   def _addNewRuns(self, sampler, model, inputs, outputs, jobHandler, inDictionary, verbose=True):
     """
@@ -825,16 +853,119 @@ class MultiRun(SingleRun):
     #The value of "found" determines what the Sampler is ready to provide.
     #  case 0: a new sample has been discovered and can be run, and newInp is a new input list.
     #  case 1: found the input in restart, and newInp is a realization dictionary of data to use
-    found, newInp = sampler.generateInput(model,inputs)
-    if found == 1:
-      kwargs = copy.deepcopy(sampler.inputInfo)
-      # "submit" the finished run
-      jobHandler.addFinishedJob(newInp, metadata=kwargs)
-      return None
-      # NOTE: we return None here only because the Sampler's "counter" is not correctly passed
-      # through if we add several samples at once through the restart. If we actually returned
-      # a Realization object from the Sampler, this would not be a problem. - talbpaul
-    return newInp
+    while True:
+      found, newInp = sampler.generateInput(model,inputs)
+      if found == 1:
+        kwargs = copy.deepcopy(sampler.inputInfo)
+        # "submit" the finished run
+        jobHandler.addFinishedJob(newInp, metadata=kwargs)
+        return None
+        # NOTE: we return None here only because the Sampler's "counter" is not correctly passed
+        # through if we add several samples at once through the restart. If we actually returned
+        # a Realization object from the Sampler, this would not be a problem. - talbpaul
+      if self._cache is None or not self._useCachedEvaluation(model, sampler, jobHandler):
+        return newInp
+      # the sample was in the cache; samplers that do not wait on results can keep going, so that
+      # all the cached samples are returned in bulk without taking any spot in the JobHandler
+      if sampler.onlySampleAfterCollecting or not sampler.amIreadyToProvideAnInput():
+        return None
+
+  def _openCache(self, model, inputs, jobHandler):
+    """
+      Opens the on-disk evaluation cache, if requested.
+      @ In, model, Model, the model in charge of evaluating the samples
+      @ In, inputs, list, the inputs of the step
+      @ In, jobHandler, object, the raven object used to handle jobs
+      @ Out, None
+    """
+    if self._cacheFile is None:
+      return
+    if isinstance(model, Models.EnsembleModel):
+      self.raiseAWarning('The evaluation cache is not available for EnsembleModel "{}"; it will not be used!'.format(model.name))
+      return
+    if self._isStochastic(model):
+      self.raiseAWarning('The evaluations of ROM "{}" are random and are not determined by the sampled variables;'.format(model.name)+
+                         ' the evaluation cache will not be used!')
+      return
+    fileName = os.path.join(jobHandler.runInfoDict['WorkingDir'], os.path.expanduser(self._cacheFile))
+    self._cache = EvaluationCache(fileName)
+    self._cacheState = EvaluationCache.modelFingerprint(model, inputs)
+    self.raiseAMessage('Using evaluation cache "{}" with {} stored evaluations'.format(fileName, len(self._cache)))
+
+  @staticmethod
+  def _isStochastic(model):
+    """
+      Checks if the evaluations of a model are drawn from a random number generator (e.g. ARMA ROMs),
+      whose seed is not among the sampled variables, so that they cannot be reused.
+      @ In, model, Model, the model in charge of evaluating the samples
+      @ Out, isStochastic, bool, True if the evaluations are random
+    """
+    if not isinstance(model, Models.ROM):
+      return False
+    baseReseed = SupervisedLearning.supervisedLearning.reseed
+    engines = list(model.supervisedEngine.supervisedContainer)
+    while engines:
+      engine = engines.pop()
+      if type(engine).reseed is not baseReseed:
+        return True
+      # collections (e.g. segmented ROMs) are as random as the ROMs they are made of
+      if isinstance(engine, SupervisedLearning.Collection):
+        engines.append(engine._templateROM)
+    return False
+
+  def _closeCache(self):
+    """
+      Closes the on-disk evaluation cache, if in use.
+      @ In, None
+      @ Out, None
+    """
+    if self._cache is None:
+      return
+    self.raiseAMessage('Evaluation cache: {} samples taken from the cache, {} new evaluations stored'
+                       .format(self._cache.hits, self._cache.stored))
+    self._cache.close()
+    self._cache = None
+
+  def _useCachedEvaluation(self, model, sampler, jobHandler):
+    """
+      Checks the evaluation cache for the sample just generated by the sampler. If found,
+      the cached realization is added to the JobHandler as an already-finished job.
+      @ In, model, Model, the model in charge of evaluating the sample
+      @ In, sampler, Sampler, the sampler in charge of generating the sample
+      @ In, jobHandler, object, the raven object used to handle jobs
+      @ Out, found, bool, True if the sample was found in the cache
+    """
+    sampledVars = sampler.inputInfo['SampledVars']
+    outputs = self._cache.fetch(EvaluationCache.makeKey(model, sampledVars, self._cacheState))
+    if outputs is None:
+      return False
+    self.raiseADebug('Sample {} found in evaluation cache'.format(sampler.inputInfo.get('prefix', '')))
+    kwargs = copy.deepcopy(sampler.inputInfo)
+    rlz = {'inputs': dict((var, np.atleast_1d(val)) for var, val in sampledVars.items()),
+           'outputs': outputs,
+           'metadata': copy.deepcopy(sampler.inputInfo)}
+    jobHandler.addFinishedJob(rlz, metadata=kwargs)
+    return True
+
+  def _cacheEvaluation(self, model, finishedJob):
+    """
+      Adds a successfully completed evaluation to the evaluation cache.
+      @ In, model, Model, the model that performed the evaluation
+      @ In, finishedJob, Runner, the completed job
+      @ Out, None
+    """
+    # restart points and cached points are already known
+    if type(finishedJob).__name__ == 'PassthroughRunner':
+      return
+    metadata = finishedJob.getMetadata()
+    if not metadata or metadata.get('SampledVars', None) is None:
+      return
+    evaluation = finishedJob.getEvaluation()
+    if not isinstance(evaluation, dict) or evaluation.get('RAVEN_isBatch', False):
+      return
+    sampledVars = metadata['SampledVars']
+    outputs = dict((var, val) for var, val in evaluation.items() if var not in sampledVars and var not in metadata)
+    self._cache.store(EvaluationCache.makeKey(model, sampledVars, self._cacheState), outputs)
 
 #
 #
@@ -905,8 +1036,10 @@ class RomTrainer(Step):
       @ Out, None
     """
     #Train the ROM... It is not needed to add the trainingSet since it's already been added in the initialization method
+    # the training data is extracted from the data object once, and shared by all the ROMs of the step
+    trainingCache = {}
     for ROM in inDictionary['Output']:
-      ROM.train(inDictionary['Input'][0])
+      ROM.train(inDictionary['Input'][0], trainingCache)
 #
 #
 #
@@ -1080,15 +1213,25 @@ class IOStep(Step):
         if not inDictionary['Input'][i].amITrained:
           self.raiseAnError(RuntimeError,'Pickled rom "%s" was not trained!  Train it before pickling and unpickling using a RomTrainer step.' %inDictionary['Input'][i].name)
         fileobj = outputs[i]
-        fileobj.open(mode='wb+')
-        cloudpickle.dump(inDictionary['Input'][i],fileobj)
-        fileobj.flush()
-        fileobj.close()
+        if fileobj.getExt() == romStorage.EXTENSION:
+          # memory-mappable format, with the sub-ROMs (e.g. ROMCollection segments) loaded lazily
+          romStorage.dump(inDictionary['Input'][i], fileobj.getAbsFile(),
+                          (SupervisedLearning.Collection,), (SupervisedLearning.supervisedLearning,))
+        else:
+          fileobj.open(mode='wb+')
+          # a ROM loaded from a memory-mappable file is written with all its sub-ROMs
+          with romStorage.selfContained():
+            cloudpickle.dump(inDictionary['Input'][i],fileobj)
+          fileobj.flush()
+          fileobj.close()
       elif self.actionType[i] == 'FILES-ROM':
         #inDictionary['Input'][i] is a Files, outputs[i] is ROM
         ## unpickle the ROM
         fileobj = inDictionary['Input'][i]
-        unpickledObj = pickle.load(open(fileobj.getAbsFile(),'rb+'))
+        if romStorage.isRomStorage(fileobj.getAbsFile()):
+          unpickledObj = romStorage.load(fileobj.getAbsFile())
+        else:
+          unpickledObj = pickle.load(open(fileobj.getAbsFile(),'rb+'))
         ## DEBUGG
         # the following will iteratively check the size of objects being unpickled
         # this is quite useful for finding memory crashes due to parallelism
@@ -1107,8 +1250,8 @@ class IOStep(Step):
           self.raiseAnError(RuntimeError,'Pickled rom "%s" was not trained!  Train it before pickling and unpickling using a RomTrainer step.' %unpickledObj.name)
         # save reseeding parameters from pickledROM
         loadSettings = outputs[i].initializationOptionDict
-        # train the ROM from the unpickled object
-        outputs[i].train(unpickledObj)
+        # take over the unpickled object (not used anywhere else, so no need to copy it)
+        outputs[i].loadTrained(unpickledObj)
         # reseed as requested
         outputs[i].setAdditionalParams(loadSettings)
 
@@ -1117,7 +1260,9 @@ class IOStep(Step):
         ## load a CSV from file
         infile = inDictionary['Input'][i]
         options = {'fileToLoad':infile}
-        outputs[i].load(inDictionary['Input'][i].getPath(),'csv',**options)
+        # single-file columnar HistorySet storage is written as HDF5
+        style = 'columnar' if infile.getExt() == 'h5' else 'csv'
+        outputs[i].load(inDictionary['Input'][i].getPath(),style,**options)
 
       else:
         # unrecognized, and somehow not caught by the step reader.
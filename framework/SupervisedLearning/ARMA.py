@@ -28,10 +28,9 @@ import collections
 import utils.importerUtils
 statsmodels = utils.importerUtils.importModuleLazy("statsmodels", globals())
 import numpy as np
-import functools
 from scipy.linalg import solve_discrete_lyapunov
 from scipy import stats
-from scipy.signal import find_peaks
+from scipy.signal import find_peaks, lfilter
 from scipy.stats import rv_histogram
 
 #External Modules End--------------------------------------------------------------------------------
@@ -103,6 +102,7 @@ class ARMA(supervisedLearning):
     self.multicycle = False # if True, then multiple cycles per sample are going to be taken
     self.numCycles = None # if self.multicycle, this is the number of cycles per sample
     self.growthFactors = collections.defaultdict(list) # by target, this is how to scale the signal over successive cycles
+    self.batchCycles = False # if True, all cycles of a sample are generated together as a single batch of realizations
 
     multicycleNode = kwargs['paramInput'].findFirst('Multicycle')
     if multicycleNode is not None:
@@ -263,6 +263,8 @@ class ARMA(supervisedLearning):
     """
     rngCounts = d.pop('crow_rng_counts')
     self.__dict__.update(d)
+    # older serializations may predate batched cycle generation
+    self.__dict__.setdefault('batchCycles', False)
     self.setEngine(randomUtils.newRNG(), seed=None, count=rngCounts)
     if self.reseedCopies:
       randd = np.random.randint(1, 2e9)
@@ -280,6 +282,8 @@ class ARMA(supervisedLearning):
     self.growthFactors = collections.defaultdict(list)
     growthNodes = node.findAll('growth')
     numCyclesNode = node.findFirst('cycles')
+    batchNode = node.findFirst('batch')
+    self.batchCycles = batchNode.value if batchNode is not None else False
     # if <cycles> given, then we use that as the baseline default duration range(0, cycles) (not inclusive)
     if numCyclesNode is not None:
       defaultIndices = [0, numCyclesNode.value - 1]
@@ -493,12 +497,19 @@ class ARMA(supervisedLearning):
       for target in (t for t in self.target if t != self.pivotParameterID):
         scaling[target] = self._evaluateScales(self.growthFactors[target], cycles)
       # create synthetic history for each cycle
-      for y in cycles:
-        self.raiseADebug('Evaluating cycle', y)
-        vals = copy.deepcopy(featureVals) # without deepcopy, the vals are modified in-place -> why should this matter?
-        result = self._evaluateCycle(vals)
-        for target, value in ((t, v) for (t, v) in result.items() if t != self.pivotParameterID): #, growthInfos in self.growthFactors.items():
-          finalResult[target][y][:] = value # [:] is a size checker
+      if self.batchCycles:
+        # all cycles at once, as one realization per cycle
+        self.raiseADebug('Evaluating {} cycles as a batch'.format(self.numCycles))
+        result = self._evaluateCycle(copy.deepcopy(featureVals), numRealizations=self.numCycles)
+        for target, value in ((t, v) for (t, v) in result.items() if t != self.pivotParameterID):
+          finalResult[target][:] = value # [:] is a size checker
+      else:
+        for y in cycles:
+          self.raiseADebug('Evaluating cycle', y)
+          vals = copy.deepcopy(featureVals) # without deepcopy, the vals are modified in-place -> why should this matter?
+          result = self._evaluateCycle(vals)
+          for target, value in ((t, v) for (t, v) in result.items() if t != self.pivotParameterID): #, growthInfos in self.growthFactors.items():
+            finalResult[target][y][:] = value # [:] is a size checker
       # apply growth factors
       for target in (t for t in finalResult if t != self.pivotParameterID):
         scaling = self._evaluateScales(self.growthFactors[target], cycles)
@@ -529,10 +540,12 @@ class ARMA(supervisedLearning):
         scales[y] = old
     return scales
 
-  def _evaluateCycle(self, featureVals):
+  def _evaluateCycle(self, featureVals, numRealizations=None):
     """
       @ In, featureVals, float, a scalar feature value is passed as scaling factor
-      @ Out, returnEvaluation, dict, dictionary of values for each target (and pivot parameter)
+      @ In, numRealizations, int, optional, if given then generate this many histories at once
+      @ Out, returnEvaluation, dict, dictionary of values for each target (and pivot parameter);
+                              if numRealizations is given, each target has shape (numRealizations, numPivots)
     """
     if featureVals.size > 1:
       self.raiseAnError(ValueError, 'The input feature for ARMA for evaluation cannot have size greater than 1. ')
@@ -542,6 +555,9 @@ class ARMA(supervisedLearning):
 
     # make sure pivot value is in return object
     returnEvaluation = {self.pivotParameterID:self.pivotParameterValues}
+    signalShape = (len(self.pivotParameterValues),)
+    if numRealizations is not None:
+      signalShape = (numRealizations,) + signalShape
 
     # TODO when we have output printing for ROMs, the distinct signals here could be outputs!
     # leaving "debuggFile" as examples of this, in comments
@@ -564,31 +580,33 @@ class ARMA(supervisedLearning):
             unzeroedSample = self._generateVARMASignal(self.varmaResult[0],
                                                        numSamples=self._masks[target]['notZeroFilterMask'].sum(),
                                                        randEngine=self.normEngine.rvs,
-                                                       rvsIndex=0)
+                                                       rvsIndex=0,
+                                                       numRealizations=numRealizations)
             ## zero sampling is dependent on whether the trained model is a VARMA or ARMA
             if self.varmaNoise[1] is not None:
               zeroedSample = self._generateVARMASignal(self.varmaResult[1],
                                                        numSamples=self._masks[target]['zeroFilterMask'].sum(),
                                                        randEngine=self.normEngine.rvs,
-                                                       rvsIndex=1)
+                                                       rvsIndex=1,
+                                                       numRealizations=numRealizations)
             else:
               result = self.varmaResult[1]
               sample = self._generateARMASignal(result,
                                                 numSamples = self._masks[target]['zeroFilterMask'].sum(),
-                                                randEngine = self.randomEng)
-              zeroedSample = np.zeros((self._masks[target]['zeroFilterMask'].sum(),1))
-              zeroedSample[:, 0] = sample
+                                                randEngine = self.randomEng,
+                                                numRealizations = numRealizations)
+              zeroedSample = sample[..., np.newaxis]
             correlatedSample = True # placeholder, signifies we've sampled the correlated distribution
           # reconstruct base signal from samples
           ## initialize
-          signal = np.zeros(len(self.pivotParameterValues))
+          signal = np.zeros(signalShape)
           ## first the data from the non-zero portions of the original signal
-          signal[self._masks[self.zeroFilterTarget]['notZeroFilterMask']] = unzeroedSample[:,corrIndex]
+          signal[..., self._masks[self.zeroFilterTarget]['notZeroFilterMask']] = unzeroedSample[..., corrIndex]
           ## then the data from the zero portions (if the filter target, don't bother because they're zero anyway)
           if target != self.zeroFilterTarget:
             # fix offset since we didn't include zero-filter target in zeroed correlated arma
             indexOffset = 0 if corrIndex < filterTargetIndex else -1
-            signal[self._masks[self.zeroFilterTarget]['zeroFilterMask']] = zeroedSample[:,corrIndex+indexOffset]
+            signal[..., self._masks[self.zeroFilterTarget]['zeroFilterMask']] = zeroedSample[..., corrIndex+indexOffset]
         # if no zero-filtering (but still correlated):
         else:
           ## check if sample taken yet
@@ -597,9 +615,10 @@ class ARMA(supervisedLearning):
             correlatedSample = self._generateVARMASignal(self.varmaResult[0],
                                                          numSamples = len(self.pivotParameterValues),
                                                          randEngine = self.normEngine.rvs,
-                                                         rvsIndex = 0)
+                                                         rvsIndex = 0,
+                                                         numRealizations = numRealizations)
           # take base signal from sample
-          signal = correlatedSample[:,self.correlations.index(target)]
+          signal = correlatedSample[..., self.correlations.index(target)]
       # if NOT correlated
       else:
         result = self.armaResult[target] # ARMAResults object
@@ -608,16 +627,18 @@ class ARMA(supervisedLearning):
         if target == self.zeroFilterTarget:
           sample = self._generateARMASignal(result,
                                             numSamples = self._masks[target]['notZeroFilterMask'].sum(),
-                                            randEngine = self.randomEng)
+                                            randEngine = self.randomEng,
+                                            numRealizations = numRealizations)
 
           ## if so, then expand result into signal space (functionally, put back in all the zeros)
-          signal = np.zeros(len(self.pivotParameterValues))
-          signal[self._masks[target]['notZeroFilterMask']] = sample
+          signal = np.zeros(signalShape)
+          signal[..., self._masks[target]['notZeroFilterMask']] = sample
         else:
           ## if not, no extra work to be done here!
           sample = self._generateARMASignal(result,
                                             numSamples = len(self.pivotParameterValues),
-                                            randEngine = self.randomEng)
+                                            randEngine = self.randomEng,
+                                            numRealizations = numRealizations)
           signal = sample
       # END creating base signal
       # DEBUG adding arbitrary variables for debugging, TODO find a more elegant way, leaving these here as markers
@@ -634,6 +655,7 @@ class ARMA(supervisedLearning):
         # DEBUG adding arbitrary variables
         #returnEvaluation[target+'_2fourier'] = copy.copy(signal)
         #debuggFile.writelines('signal_fourier,'+','.join(str(x) for x in self.fourierResults[target]['predict'])+'\n')
+      # peaks and input CDF preservation are defined per history, and are applied to each realization (row)
       if target in self.peaks:
         signal = self._transformBackPeaks(signal,windowDict=self.peaks[target])
         #debuggFile.writelines('signal_peak,'+','.join(str(x) for x in signal)+'\n')
@@ -646,7 +668,7 @@ class ARMA(supervisedLearning):
       if target == self.zeroFilterTarget:
         # DEBUG adding arbitrary variables
         #returnEvaluation[target+'_3zerofilter'] = copy.copy(signal)
-        signal[self._masks[target]['zeroFilterMask']] = 0.0
+        signal[..., self._masks[target]['zeroFilterMask']] = 0.0
 
       # Domain limitations
       for domain,requests in self.outTruncation.items():
@@ -665,7 +687,7 @@ class ARMA(supervisedLearning):
       #returnEvaluation[target+'_5scaled'] = copy.copy(signal)
 
       # sanity check on the signal
-      assert(signal.size == returnEvaluation[self.pivotParameterID].size)
+      assert(signal.shape[-1] == returnEvaluation[self.pivotParameterID].size)
       #debuggFile.writelines('final,'+','.join(str(x) for x in signal)+'\n')
       returnEvaluation[target] = signal
     # END for target in targets
@@ -700,32 +722,35 @@ class ARMA(supervisedLearning):
       @ In, params, dict, CDF parameters (as obtained by "generateCDF")
       @ Out, normed, np.array, normalized data
     """
-    denormed = self.normEngine.cdf(data)
+    if data.ndim > 1:
+      # many realizations at once; the distribution engine evaluates point by point, so go straight to scipy
+      denormed = stats.norm.cdf(data)
+    else:
+      denormed = self.normEngine.cdf(data)
     denormed = self._sampleICDF(denormed, params)
     return denormed
 
-  def _generateARMASignal(self, model, numSamples=None,randEngine=None):
+  def _generateARMASignal(self, model, numSamples=None, randEngine=None, numRealizations=None):
     """
       Generates a synthetic history from fitted parameters.
+      The ARMA recursion is applied directly as a linear filter over pre-drawn noise, so that
+      many realizations can be produced at once (one per row).
       @ In, model, statsmodels.tsa.arima_model.ARMAResults, fitted ARMA such as otained from _trainARMA
       @ In, numSamples, int, optional, number of samples to take (default to pivotParameters length)
       @ In, randEngine, instance, optional, method to call to get random samples (for example "randEngine(size=6)")
-      @ Out, hist, np.array(float), synthetic ARMA signal
+      @ In, numRealizations, int, optional, if given then generate this many independent histories at once
+      @ Out, hist, np.array(float), synthetic ARMA signal, shape (numSamples,) or (numRealizations, numSamples)
     """
     if numSamples is None:
       numSamples =  len(self.pivotParameterValues)
     if randEngine is None:
       randEngine=self.randomEng
-    import statsmodels.tsa
-    hist = statsmodels.tsa.arima_process.arma_generate_sample(ar = np.append(1., -model.arparams),
-                                                    ma = np.append(1., model.maparams),
-                                                    nsample = numSamples,
-                                                    distrvs = functools.partial(randomUtils.randomNormal,engine=randEngine),
-                                       # functool.partial provide the random number generator as a function
-                                       # with normal distribution and take engine as the positional arguments keywords.
-                                                    scale = np.sqrt(model.sigma2),
-                                                    burnin = 2*max(self.P,self.Q)) # @alfoa, 2020
-    return hist
+    burnin = 2*max(self.P,self.Q) # @alfoa, 2020
+    size = (numSamples + burnin,) if numRealizations is None else (numRealizations, numSamples + burnin)
+    # same as statsmodels.tsa.arima_process.arma_generate_sample, but for any number of rows
+    noise = np.sqrt(model.sigma2) * randomUtils.randomNormal(size=size, keepMatrix=True, engine=randEngine)
+    hist = lfilter(np.append(1., model.maparams), np.append(1., -model.arparams), noise, axis=-1)
+    return hist[..., burnin:]
 
   def _generateFourierSignal(self, pivots, periods):
     """
@@ -741,14 +766,16 @@ class ARMA(supervisedLearning):
       fourier[:, 2 * p + 1] = np.cos(hist)
     return fourier
 
-  def _generateVARMASignal(self, model, numSamples=None, randEngine=None, rvsIndex=None):
+  def _generateVARMASignal(self, model, numSamples=None, randEngine=None, rvsIndex=None, numRealizations=None):
     """
       Generates a set of correlated synthetic histories from fitted parameters.
       @ In, model, statsmodels.tsa.statespace.VARMAX, fitted VARMA such as otained from _trainVARMA
       @ In, numSamples, int, optional, number of samples to take (default to pivotParameters length)
       @ In, randEngine, instance, optional, method to call to get random samples (for example "randEngine(size=6)")
       @ In, rvsIndex, int, optional, if provided then will take from list of varmaNoise and varmaInit distributions
-      @ Out, hist, np.array(float), synthetic ARMA signal
+      @ In, numRealizations, int, optional, if given then generate this many independent sets of histories at once
+      @ Out, hist, np.array(float), synthetic ARMA signal, shape (numSamples, numVariables) or
+                   (numRealizations, numSamples, numVariables)
     """
     if numSamples is None:
       numSamples = len(self.pivotParameterValues)
@@ -769,6 +796,8 @@ class ARMA(supervisedLearning):
     # with NUMPY:
     mean = noiseDist.mu
     cov = noiseDist.covariance.reshape([len(mean)]*2)
+    if numRealizations is not None:
+      return self._generateVARMABatch(model, numSamples, numRealizations, mean, cov, initDist)
     stateShocks = np.random.multivariate_normal(mean, cov, numSamples)
     # with CROW:
     #stateShocks = np.array([noiseDist.rvs() for _ in range(numSamples)])
@@ -781,6 +810,39 @@ class ARMA(supervisedLearning):
     # add zeros back in for zeroed variable, if necessary? FIXME -> looks like no, this is done later in _evaluateCycle
     return obs
 
+  def _generateVARMABatch(self, model, numSamples, numRealizations, mean, cov, initDist):
+    """
+      Generates many sets of correlated synthetic histories at once by stepping the state space
+      representation of the VARMA for all realizations together.
+      Equivalent to model.ssm.simulate with no measurement shocks, applied to each realization; the random
+      numbers are drawn as by consecutive calls of the single history path.
+      @ In, model, statsmodels.tsa.statespace.VARMAX, fitted VARMA such as otained from _trainVARMA
+      @ In, numSamples, int, number of samples to take per history
+      @ In, numRealizations, int, number of independent realizations to take
+      @ In, mean, np.array, mean of the state shocks
+      @ In, cov, np.array, covariance of the state shocks
+      @ In, initDist, Distribution, multivariate normal distribution of the initial state
+      @ Out, obs, np.array(float), synthetic signals with shape (numRealizations, numSamples, numVariables)
+    """
+    ssm = model.ssm
+    design = ssm['design']
+    obsIntercept = ssm['obs_intercept']
+    transition = ssm['transition']
+    stateIntercept = ssm['state_intercept']
+    selection = ssm['selection']
+    # draw all the noise up front, realization by realization, as consecutive calls of the single history path would
+    stateShocks = np.random.multivariate_normal(mean, cov, (numRealizations, numSamples)).transpose(1, 0, 2)
+    # the initial states come from the trained distribution, as for a single history
+    init = np.array([initDist.rvs() for _ in range(numRealizations)])
+    # project the shocks into the state space in one go, then step all realizations together
+    stateShocks = stateShocks.dot(selection.T) + stateIntercept
+    states = np.empty((numSamples, numRealizations, init.shape[1]))
+    states[0] = init
+    for t in range(1, numSamples):
+      states[t] = states[t-1].dot(transition.T) + stateShocks[t-1]
+    obs = states.dot(design.T) + obsIntercept
+    return np.ascontiguousarray(obs.transpose(1, 0, 2))
+
   def _interpolateDist(self, x, y, Xlow, Xhigh, Ylow, Yhigh, inMask):
     """
       Interplotes values for samples "x" to get dependent values "y" given bins
@@ -1202,15 +1264,19 @@ class ARMA(supervisedLearning):
   def _transformThroughInputCDF(self, signal, originalDist, weights=None):
     """
       Transforms a signal through the original distribution
-      @ In, signal, np.array(float), signal to transform
+      @ In, signal, np.array(float), signal to transform, shape (numPivots,) or (numRealizations, numPivots)
       @ In, originalDist, scipy.stats.rv_histogram, distribution to transform through
       @ In, weights, np.array(float), weighting for samples (assumed uniform if not given)
       @ Out, new, np.array, new signal after transformation
     """
-    # first build a histogram object of the sampled data
-    dist, hist = mathUtils.trainEmpiricalFunction(signal, minBins=self._minBins, weights=weights)
+    # first evaluate the empirical CDF of the sampled data, for each realization
+    if weights is None:
+      cdf = mathUtils.evalEmpiricalCDF(signal, minBins=self._minBins)
+    else:
+      dist, hist = mathUtils.trainEmpiricalFunction(signal, minBins=self._minBins, weights=weights)
+      cdf = dist.cdf(signal)
     # transform data through CDFs
-    new = originalDist[0].ppf(dist.cdf(signal))
+    new = originalDist[0].ppf(cdf)
     return new
 
   def _combineMask(self,masks):
@@ -2212,7 +2278,7 @@ class ARMA(supervisedLearning):
   def _transformBackPeaks(self,signal,windowDict):
     """
       Transforms a signal by regenerate the peaks signal
-      @ In, signal, np.array(float), signal to transform
+      @ In, signal, np.array(float), signal to transform, shape (numPivots,) or (numRealizations, numPivots)
       @ In, windowDict, dict, dictionary for specefic target peaks
       @ Out, signal, np.array(float), new signal after transformation
     """
@@ -2220,6 +2286,9 @@ class ARMA(supervisedLearning):
     windows  = windowDict['windows']
     # rangeWindow = self.rangeWindow(windowDict)
     rangeWindow = windowDict['rangeWindow']
+    numPivots = len(self.pivotParameterValues)
+    # the peaks are generated independently for each realization (row), modified in place
+    histories = signal.reshape(-1, signal.shape[-1])
     for i in range(len(windows)):
       prbExist = len(groupWin[i]['Ind'])/len(rangeWindow[i]['bg'])
       # (amount of peaks that collected in the windows)/(the amount of windows)
@@ -2228,42 +2297,39 @@ class ARMA(supervisedLearning):
       # generate the distribution of the amplitude for this type of peak
       histInd = np.histogram(groupWin[i]['Ind'])
       # generate the distribution of the position( relative index) in the window
+      halfBg = int(np.floor(windows[i]['width']/2))
+      halfEnd = int(np.ceil(windows[i]['width']/2))
+      # position of each point of the peak relative to the peak itself
+      offsets = np.arange(-halfBg, halfEnd+1)
+      beforePeak = offsets < 0
       for j in range(min(len(rangeWindow[i]['bg']),len(rangeWindow[i]['end']))):
         # the length of the starting points and ending points might be different
         bgLocal = rangeWindow[i]['bg'][j]
         # choose the starting index for specific window
-        exist = np.random.choice(2, 1, p=[1-prbExist,prbExist])
-        # generate 1 or 0 base on the prbExist
-        if exist == 1:
-          Amp = rv_histogram(histAmp).rvs()
-          Ind = int(rv_histogram(histInd).rvs())
-          # generate the amplitude and the relative position base on the distribution
-          SigIndOrg = bgLocal+Ind
-          #signalOrg can be longer than the segment length
-          SigInd = int(SigIndOrg%len(self.pivotParameterValues))
-          signal[SigInd] = Amp
-          # replace the signal with peak in this window
-          maskBg = SigInd-int(np.floor(windows[i]['width']/2))
-          ## peaks begin index can be negative end index can be more than the length of the segments
-          maskEnd = SigInd+int(np.ceil(windows[i]['width']/2))
-          bgValue = signal[maskBg-1]
-          endVaue = signal[int((maskEnd+1)%len(self.pivotParameterValues))]
-          # valueBg=np.interp(range(maskBg,SigInd), [maskBg-1,SigInd], [bgValue,  Amp])
-          # valueEnd=np.interp(range(SigInd+1,maskEnd+1), [SigInd,maskEnd+1],   [Amp,endVaue])
-          valuePeak=np.interp(range(maskBg,maskEnd+1), [maskBg-1,SigInd,maskEnd+1],   [bgValue,Amp,endVaue])
-          maskBg=int(maskBg%len(self.pivotParameterValues))
-          maskEnd=int(maskEnd%len(self.pivotParameterValues))
-          # maskbg and end now can be used as index in segment
-          # replace the signal inside the width of this peak by interpolation
-          if maskEnd > maskBg:
-            signal[maskBg:maskEnd+1]=valuePeak
-          else:
-            localTailInd=list(range(maskBg, int(len(self.pivotParameterValues))))
-            localHeadInd=list(range(0, maskEnd+1))
-            actPeakInd=localTailInd+localHeadInd
-            for idd, ind in enumerate(actPeakInd):
-              signal[ind]=valuePeak[idd]
-      return signal
+        exist = np.random.choice(2, len(histories), p=[1-prbExist,prbExist])
+        # generate 1 or 0 base on the prbExist, for each realization
+        rows = np.nonzero(exist == 1)[0]
+        if len(rows) == 0:
+          continue
+        Amp = rv_histogram(histAmp).rvs(size=len(rows))
+        Ind = rv_histogram(histInd).rvs(size=len(rows)).astype(int)
+        # generate the amplitude and the relative position base on the distribution
+        SigIndOrg = bgLocal+Ind
+        #signalOrg can be longer than the segment length
+        SigInd = (SigIndOrg%numPivots).astype(int)
+        histories[rows, SigInd] = Amp
+        # replace the signal with peak in this window
+        ## peaks begin index can be negative end index can be more than the length of the segments
+        bgValue = histories[rows, SigInd-halfBg-1]
+        endVaue = histories[rows, (SigInd+halfEnd+1)%numPivots]
+        # replace the signal inside the width of this peak by linear interpolation
+        # from the value before the peak to the peak, then from the peak to the value after it
+        valuePeak = np.where(beforePeak,
+                             ((Amp-bgValue)/(halfBg+1))[:, np.newaxis]*(offsets+halfBg+1) + bgValue[:, np.newaxis],
+                             ((endVaue-Amp)/(halfEnd+1))[:, np.newaxis]*offsets + Amp[:, np.newaxis])
+        # indices in the segment, wrapping around its end
+        histories[rows[:, np.newaxis], (SigInd[:, np.newaxis]+offsets)%numPivots] = valuePeak
+      return histories.reshape(signal.shape)
 
   ### ESSENTIALLY UNUSED ###
   def _localNormalizeData(self,values,names,feat):
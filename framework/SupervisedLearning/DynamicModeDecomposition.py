@@ -26,7 +26,8 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 #External Modules------------------------------------------------------------------------------------
 import sys
 import numpy as np
-from scipy import spatial
+from scipy import spatial, sparse
+from scipy.sparse import linalg as sparseLinalg
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -60,6 +61,7 @@ class DynamicModeDecomposition(supervisedLearning):
     self.dmdParams['exactModes'    ] = kwargs.get('exactModes',True)        # True if the exact modes need to be computed (eigs and eigvs), otherwise the projected ones (using the left-singular matrix)
     self.dmdParams['optimized'     ] = kwargs.get('optimized',False)        # amplitudes computed minimizing the error between the mods and all the timesteps (True) or 1st timestep only (False)
     self.dmdParams['dmdType'       ] = kwargs.get('dmdType','dmd')          # the dmd type to be applied. Currently we support dmd and hdmd (high order dmd)
+    self.dmdParams['randomizedSVD' ] = kwargs.get('randomizedSVD',False)    # True if a randomized truncated SVD is used, without assembling the time-delay embedded snapshots
     # variables filled up in the training stages
     self._amplitudes                 = {}                                   # {'target1': vector of amplitudes,'target2':vector of amplitudes, etc.}
     self._eigs                       = {}                                   # {'target1': vector of eigenvalues,'target2':vector of eigenvalues, etc.}
@@ -72,6 +74,8 @@ class DynamicModeDecomposition(supervisedLearning):
     # some checks
     if self.dmdParams['rankSVD'] is not None and self.dmdParams['energyRankSVD'] is not None:
       self.raiseAWarning('Both "rankSVD" and "energyRankSVD" have been inputted. "energyRankSVD" is predominant and will be used!')
+    if self.dmdParams['randomizedSVD'] and (self.dmdParams['energyRankSVD'] is not None or self.dmdParams['rankSVD'] is None or self.dmdParams['rankSVD'] < 1):
+      self.raiseAnError(IOError,'"randomizedSVD" requires an explicit truncation rank "rankSVD" >= 1 (and no "energyRankSVD")!')
     if self.dmdParams['dmdType'] not in self.availDmdAlgorithms:
       self.raiseAnError(IOError,'dmdType(s) available are "'+', '.join(self.availDmdAlgorithms)+'"!')
     # check if the pivotParameter is among the targetValues
@@ -144,21 +148,38 @@ class DynamicModeDecomposition(supervisedLearning):
       snaps = targetVals[:,:,targetParamIndex]
       # if number of features (i.e. samples) > number of snapshots, we apply the high order DMD or HODMD has been requested
       imposedHODMD = False
+      v = 1
       if self.dmdParams['dmdType'] == 'hodmd' or snaps.shape[0] < snaps.shape[1]:
         v = max(snaps.shape[1] - snaps.shape[0],2)
         imposedHODMD = True
-        snaps = np.concatenate([snaps[:, i:snaps.shape[1] - v  + i + 1] for i in range(v) ], axis=0)
-      # overlap snaps
-      X, Y = snaps[:, :-1], snaps[:, 1:]
-      if self.dmdParams['rankTLSQ'] is not None:
-        X, Y = mathUtils.computeTruncatedTotalLeastSquare(X, Y, self.dmdParams['rankTLSQ'])
-      rank = self.dmdParams['energyRankSVD'] if self.dmdParams['energyRankSVD'] is not None else (self.dmdParams['rankSVD'] if self.dmdParams['rankSVD'] is not None else -1)
-      U, s, V = mathUtils.computeTruncatedSingularValueDecomposition(X, rank)
-      # lowrank operator from the SVD of matrices X and Y
-      self.__Atilde[target] = U.T.conj().dot(Y).dot(V) * np.reciprocal(s)
-      self._eigs[target], self._modes[target] = mathUtils.computeEigenvaluesAndVectorsFromLowRankOperator(self.__Atilde[target],
-                                                                                                          Y, U, s, V,
-                                                                                                          self.dmdParams['exactModes'])
+      if self.dmdParams['randomizedSVD'] and self.dmdParams['rankTLSQ'] is None:
+        # overlap snaps, only through their products, without assembling the time-delay embedded snapshots
+        X = self._delayEmbeddedSnapshots(snaps, v, 0)
+        Y = self._delayEmbeddedSnapshots(snaps, v, 1)
+        U, s, V = mathUtils.computeRandomizedSingularValueDecomposition(X, self.dmdParams['rankSVD'])
+        YV = Y.matmat(V)
+        # lowrank operator from the SVD of matrices X and Y
+        self.__Atilde[target] = U.T.conj().dot(YV) * np.reciprocal(s)
+        self._eigs[target], self._modes[target] = mathUtils.computeEigenvaluesAndVectorsFromLowRankOperator(self.__Atilde[target],
+                                                                                                            YV, U, s, np.eye(len(s)),
+                                                                                                            self.dmdParams['exactModes'])
+      else:
+        if imposedHODMD:
+          snaps = np.concatenate([snaps[:, i:snaps.shape[1] - v  + i + 1] for i in range(v) ], axis=0)
+        # overlap snaps
+        X, Y = snaps[:, :-1], snaps[:, 1:]
+        if self.dmdParams['rankTLSQ'] is not None:
+          X, Y = mathUtils.computeTruncatedTotalLeastSquare(X, Y, self.dmdParams['rankTLSQ'])
+        if self.dmdParams['randomizedSVD']:
+          U, s, V = mathUtils.computeRandomizedSingularValueDecomposition(X, self.dmdParams['rankSVD'])
+        else:
+          rank = self.dmdParams['energyRankSVD'] if self.dmdParams['energyRankSVD'] is not None else (self.dmdParams['rankSVD'] if self.dmdParams['rankSVD'] is not None else -1)
+          U, s, V = mathUtils.computeTruncatedSingularValueDecomposition(X, rank)
+        # lowrank operator from the SVD of matrices X and Y
+        self.__Atilde[target] = U.T.conj().dot(Y).dot(V) * np.reciprocal(s)
+        self._eigs[target], self._modes[target] = mathUtils.computeEigenvaluesAndVectorsFromLowRankOperator(self.__Atilde[target],
+                                                                                                            Y, U, s, V,
+                                                                                                            self.dmdParams['exactModes'])
       if imposedHODMD:
         self._modes[target] = self._modes[target][:targetVals[:,:,targetParamIndex].shape[0],:]
       self._amplitudes[target] = mathUtils.computeAmplitudeCoefficients(self._modes[target],
@@ -168,6 +189,37 @@ class DynamicModeDecomposition(supervisedLearning):
     # Default timesteps (even if the time history is not equally spaced in time, we "trick" the dmd to think it).
     self.timeScales = dict.fromkeys( ['training','dmd'],{'t0': 0, 'intervals': ts - 1, 'dt': 1})
 
+  @staticmethod
+  def _delayEmbeddedSnapshots(snaps, v, shift):
+    """
+      Builds the linear operator of the time-delay embedded snapshots, without assembling them.
+      The embedded matrix stacks by rows the v blocks snaps[:, shift+i:shift+i+width], i=0,...,v-1,
+      where width = n_time_steps - v (i.e. the X (shift = 0) or Y (shift = 1) matrix of the (HO)DMD).
+      @ In, snaps, numpy.ndarray, the snapshots, shape (n_samples, n_time_steps)
+      @ In, v, int, the number of time delays (1 for no embedding)
+      @ In, shift, int, the time shift of the first block
+      @ Out, operator, scipy.sparse.linalg.LinearOperator, the embedded snapshots, shape (v*n_samples, width)
+    """
+    numSamples = snaps.shape[0]
+    width = snaps.shape[1] - v
+    blocks = [snaps[:, shift+i:shift+i+width] for i in range(v)]
+    def matmat(M):
+      """
+        Product of the embedded snapshots with M.
+        @ In, M, numpy.ndarray, matrix, shape (width, k)
+        @ Out, product, numpy.ndarray, the product, shape (v*n_samples, k)
+      """
+      return np.concatenate([block.dot(M) for block in blocks], axis=0)
+    def rmatmat(M):
+      """
+        Product of the conjugate transpose of the embedded snapshots with M.
+        @ In, M, numpy.ndarray, matrix, shape (v*n_samples, k)
+        @ Out, product, numpy.ndarray, the product, shape (width, k)
+      """
+      return sum(block.conj().T.dot(M[i*numSamples:(i+1)*numSamples]) for i, block in enumerate(blocks))
+    return sparseLinalg.LinearOperator((v*numSamples, width), matvec=matmat, rmatvec=rmatmat,
+                                       matmat=matmat, rmatmat=rmatmat, dtype=snaps.dtype)
+
   def __evaluateLocal__(self,featureVals):
     """
       This method is used to inquire the DMD to evaluate (after normalization that in
@@ -186,9 +238,13 @@ class DynamicModeDecomposition(supervisedLearning):
         weights[weights == 0] = sys.float_info.min
         weights =1./weights
         # normalize to 1
-        weights = weights/weights.sum()
-        for point in range(len(weights)):
-          returnEvaluation[target] =  np.sum ((weights[point,:]*reconstructData[indexes[point,:]].T) , axis=1)
+        weights = weights/weights.sum(axis=1)[:,np.newaxis]
+        # reconstruct all the requested points at once, as the product of the (sparse) weighting matrix and the reconstructed data
+        numPoints, numNeighbors = weights.shape
+        weightMatrix = sparse.csr_matrix((weights.ravel(), indexes.ravel(), np.arange(0, numPoints*numNeighbors+1, numNeighbors)),
+                                         shape=(numPoints, len(reconstructData)))
+        evaluations = weightMatrix.dot(reconstructData)
+        returnEvaluation[target] = evaluations[0] if numPoints == 1 else evaluations
       else:
         returnEvaluation[target] = reconstructData[0]
 
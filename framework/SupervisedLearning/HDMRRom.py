@@ -24,10 +24,12 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 
 #External Modules------------------------------------------------------------------------------------
 import numpy as np
+from scipy import spatial
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
 from utils import mathUtils
+from Decorators.Parallelization import Parallel
 from .GaussPolynomialRom import GaussPolynomialRom
 #Internal Modules End--------------------------------------------------------------------------------
 
@@ -149,24 +151,33 @@ class HDMRRom(GaussPolynomialRom):
     self.refpt = tuple(self.__fillPointWithRef((),[]))
     for cnt, target in enumerate(self.target):
       self.refSoln[target] = ft[self.refpt][cnt]
+    #index the training points once, for the lookup of the sparse grid points
+    ftKeys = np.array(list(ft.keys()))
+    ftTree = spatial.cKDTree(ftKeys)
+    subtdicts = {}
     for combo,rom in self.ROMs.items():
       subtdict = {key:list([]) for key in self.target}
       for c in combo:
         subtdict[c]=[]
       SG = rom.sparseGrid
-      fvals=np.zeros([len(SG),len(combo)])
+      fvals=np.array(SG.points(),dtype=float).reshape(len(SG),len(combo))
       tvals=np.zeros((len(SG),len(self.target)))
       for i in range(len(SG)):
-        getpt=tuple(self.__fillPointWithRef(combo,SG[i][0]))
+        getpt=tuple(self.__fillPointWithRef(combo,fvals[i]))
         #the 1e-10 is to be consistent with RAVEN's CSV print precision
-        tvals[i,:] = ft[tuple(mathUtils.NDInArray(np.array(list(ft.keys())),getpt,tol=1e-10)[2])]
-        for fp,fpt in enumerate(SG[i][0]):
-          fvals[i][fp] = fpt
+        tvals[i,:] = ft[tuple(mathUtils.NDInArray(ftKeys,getpt,tol=1e-10,tree=ftTree)[2])]
       for i,c in enumerate(combo):
         subtdict[c] = fvals[:,i]
       for cnt, target in enumerate(self.target):
         subtdict[target] = tvals[:,cnt]
-      rom.train(subtdict)
+      subtdicts[combo] = subtdict
+    #the cut ROMs are independent, so train them in parallel if the JobHandler is available
+    jobHandler = self._getJobHandler()
+    if jobHandler is None:
+      for combo,rom in self.ROMs.items():
+        rom.train(subtdicts[combo])
+    else:
+      self._parallelTrainSubROMs(subtdicts, jobHandler)
 
     #make ordered list of combos for use later
     maxLevel = max(list(len(combo) for combo in self.ROMs.keys()))
@@ -194,6 +205,21 @@ class HDMRRom(GaussPolynomialRom):
 
     self.amITrained = True
 
+  def _parallelTrainSubROMs(self, subtdicts, jobHandler):
+    """
+      Trains the cut ROMs through the JobHandler, storing each of them under its combo.
+      If no running spot is available (e.g. this ROM is trained inside a running job), runJobs trains them serially.
+      @ In, subtdicts, dict, training data for each cut ROM, keyed by combo
+      @ In, jobHandler, JobHandler instance, the JobHandler
+      @ Out, None
+    """
+    combos = list(self.ROMs.keys())
+    self.raiseADebug('Training {} cut ROMs through the JobHandler ...'.format(len(combos)))
+    argsList = [(self.ROMs[combo], subtdicts[combo]) for combo in combos]
+    trained = jobHandler.runJobs(argsList, trainCutROM, '{}_cut_'.format(self.printTag),
+                                 '{}_{}_cuts'.format(self.printTag, id(self)))
+    self.ROMs.update(zip(combos, trained))
+
   def __fillPointWithRef(self,combo,pt):
     """
       Given a "combo" subset of the full input space and a partially-filled
@@ -235,14 +261,19 @@ class HDMRRom(GaussPolynomialRom):
     returnDict = dict.fromkeys(self.target,None)
     if not self.amITrained:
       self.raiseAnError(IOError,'Cannot evaluate, as ROM is not trained!')
+    #each cut ROM evaluates all the targets at once, so evaluate each of them only once
+    cutEvals = {}
+    for term in self.reducedTerms.keys():
+      if term != ():
+        cutVals = [list(featureVals[0][self.features.index(j)] for j in term)]
+        cutEvals[term] = self.ROMs[term].__evaluateLocal__(cutVals)
     for target in self.target:
       tot = 0
       for term,mult in self.reducedTerms.items():
         if term == ():
           tot += self.refSoln[target]*mult
         else:
-          cutVals = [list(featureVals[0][self.features.index(j)] for j in term)]
-          tot += self.ROMs[term].__evaluateLocal__(cutVals)[target]*mult
+          tot += cutEvals[term][target]*mult
       returnDict[target] = tot
     return returnDict
 
@@ -363,3 +394,17 @@ class HDMRRom(GaussPolynomialRom):
       self.sdx[target][subset] = value / totVar
     return self.sdx[target],self.partialVariances[target]
 
+#
+#
+#
+#
+@Parallel()
+def trainCutROM(rom, data):
+  """
+    Trains a single cut ROM. Module-level so it can be dispatched through the JobHandler.
+    @ In, rom, GaussPolynomialRom instance, untrained cut ROM
+    @ In, data, dict, training data for the cut
+    @ Out, rom, GaussPolynomialRom instance, trained cut ROM
+  """
+  rom.train(data)
+  return rom
@@ -412,7 +412,7 @@ class MSR(NDinterpolatorRom):
           @ In, u, float, the support
           @ Out, kernel, float, the kernel
         """
-        return math.pi/4.*math.cos(u*math.pi/2.)*indicator(u)
+        return math.pi/4.*np.cos(u*math.pi/2.)*indicator(u)
     elif self.kernel == 'logistic':
       if self.bandwidth == 'auto':
         self.bandwidth = max(distances)
@@ -462,6 +462,38 @@ class MSR(NDinterpolatorRom):
     """
     self.raiseAnError(NotImplementedError, '__confidenceLocal__ method must be implemented!')
 
+  def _kernelPartitionWeights(self,featureVals):
+    """
+      Computes, for each target, the kernel density weight of each partition at the query points.
+      The query-to-training distances are computed a block of queries at a time, and the kernel
+      values are summed per partition through the partition membership matrix.
+      @ In, featureVals, numpy.array 2-D, features
+      @ Out, weights, list, for each target, dict of the partition weights {partitionKey: numpy.array 1-D}
+    """
+    memberships = []
+    for amsc in self.__amsc:
+      partitions = amsc.Partitions(self.simplification)
+      membership = np.zeros((self.X.shape[0],len(partitions)))
+      for col,indices in enumerate(partitions.values()):
+        np.add.at(membership[:,col], np.asarray(indices,dtype=int), 1.)
+      memberships.append((list(partitions.keys()),membership))
+    # This is a variable-based bandwidth that will adjust to the density
+    # around the given query point
+    if self.bandwidth == 'variable':
+      h = self.kdTree.query(featureVals,k=self.knn)[0][:,-1:]
+    else:
+      h = np.full((featureVals.shape[0],1),float(self.bandwidth))
+    values = [np.zeros((featureVals.shape[0],membership.shape[1])) for _,membership in memberships]
+    # bound the size of the (queries, training points, features) differences
+    blockSize = max(1,int(1e7//max(1,self.X.size)))
+    for start in range(0,featureVals.shape[0],blockSize):
+      block = slice(start,start+blockSize)
+      dists = np.sqrt(((featureVals[block,None,:]-self.X)**2).sum(axis=-1))
+      kernelValues = self.__kernel(dists/h[block])
+      for value,(_,membership) in zip(values,memberships):
+        value[block] = kernelValues.dot(membership)
+    return [dict(zip(keys,value.T)) for (keys,_),value in zip(memberships,values)]
+
   def __evaluateLocal__(self,featureVals):
     """
       Perform regression on samples in featureVals.
@@ -471,56 +503,31 @@ class MSR(NDinterpolatorRom):
       @ Out, returnDict, dict, dict of predicted values for each target ({'target1':numpy.array 1-D,'target2':numpy.array 1-D}
     """
     returnDict = {}
+    if self.partitionPredictor == 'kde':
+      partitionWeights = self._kernelPartitionWeights(featureVals)
     for index, target in enumerate(self.target):
       if self.partitionPredictor == 'kde':
         partitions = self.__amsc[index].Partitions(self.simplification)
-        weights = {}
-        dists = np.zeros((featureVals.shape[0],self.X.shape[0]))
-        for i,row in enumerate(featureVals):
-          dists[i] = np.sqrt(((row-self.X)**2).sum(axis=-1))
-        # This is a variable-based bandwidth that will adjust to the density
-        # around the given query point
-        if self.bandwidth == 'variable':
-          h = sorted(dists)[self.knn-1]
-        else:
-          h = self.bandwidth
-        for key,indices in partitions.items():
-          #############
-          ## Using SciKit Learn, we have a limited number of kernel functions to
-          ## choose from.
-          # kernel = self.kernel
-          # if kernel == 'uniform':
-          #   kernel = 'tophat'
-          # if kernel == 'triangular':
-          #   kernel = 'linear'
-          # kde = KernelDensity(kernel=kernel, bandwidth=h).fit(self.X[indices,])
-          # weights[key] = np.exp(kde.score_samples(featureVals))
-          #############
-          ## OR
-          #############
-          weights[key] = 0
-          for idx in indices:
-            weights[key] += self.__kernel(dists[:,idx]/h)
-          weights[key]
-          #############
+        weights = partitionWeights[index]
 
         if self.blending:
           weightedPredictions = np.zeros(featureVals.shape[0])
           sumW = 0
           for key in partitions.keys():
-            fx = self.__amsc[index].Predict(featureVals,key)
+            fx = np.asarray(self.__amsc[index].Predict(featureVals,key))
             wx = weights[key]
             sumW += wx
             weightedPredictions += fx*wx
-          returnDict[target] = weightedPredictions if sumW == 0 else weightedPredictions / sumW
+          returnDict[target] = np.divide(weightedPredictions, sumW, out=weightedPredictions.copy(), where=np.asarray(sumW) != 0)
         else:
           predictions = np.zeros(featureVals.shape[0])
           maxWeights = np.zeros(featureVals.shape[0])
           for key in partitions.keys():
-            fx = self.__amsc[index].Predict(featureVals,key)
+            fx = np.asarray(self.__amsc[index].Predict(featureVals,key))
             wx = weights[key]
-            predictions[wx > maxWeights] = fx
-            maxWeights[wx > maxWeights] = wx
+            better = wx > maxWeights
+            predictions[better] = fx[better]
+            maxWeights[better] = wx[better]
           returnDict[target] = predictions
       elif self.partitionPredictor == 'svm':
         partitions = self.__amsc[index].Partitions(self.simplification)
@@ -539,7 +546,7 @@ class MSR(NDinterpolatorRom):
           weightedPredictions = np.zeros(len(featureVals))
           sumW = 0
           for idx,key in enumerate(partitions.keys()):
-            fx = self.__amsc[index].Predict(featureVals,key)
+            fx = np.asarray(self.__amsc[index].Predict(featureVals,key))
             # It could be that a particular partition consists of only the extrema
             # and they themselves point to cells with different opposing extrema.
             # That is, a maximum points to a different minimum than the minimum in
@@ -554,12 +561,12 @@ class MSR(NDinterpolatorRom):
             if self.blending:
               weightedPredictions = weightedPredictions + fx*wx
               sumW += wx
-          returnDict[target] = weightedPredictions if sumW == 0 else weightedPredictions / sumW
+          returnDict[target] = np.divide(weightedPredictions, sumW, out=weightedPredictions.copy(), where=np.asarray(sumW) != 0)
         else:
           predictions = np.zeros(featureVals.shape[0])
           maxWeights = np.zeros(featureVals.shape[0])
           for idx,key in enumerate(partitions.keys()):
-            fx = self.__amsc[index].Predict(featureVals,key)
+            fx = np.asarray(self.__amsc[index].Predict(featureVals,key))
             # It could be that a particular partition consists of only the extrema
             # and they themselves point to cells with different opposing extrema.
             # That is, a maximum points to a different minimum than the minimum in
@@ -571,8 +578,9 @@ class MSR(NDinterpolatorRom):
             else:
               realIdx = list(svc.classes_).index(idx)
               wx = probabilities[:,realIdx]
-            predictions[wx > maxWeights] = fx
-            maxWeights[wx > maxWeights] = wx
+            better = wx > maxWeights
+            predictions[better] = fx[better]
+            maxWeights[better] = wx[better]
           returnDict[target] = predictions
       return returnDict
 
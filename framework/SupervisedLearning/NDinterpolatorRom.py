@@ -109,14 +109,26 @@ class NDinterpolatorRom(supervisedLearning):
       @ Out, prediction, numpy.array 1-D, predicted values
     """
     prediction = {} #np.zeros((featureVals.shape[0]))
+    predictions = self._interpolateTargets(featureVals)
     for index, target in enumerate(self.target):
-      prediction[target] = np.zeros((featureVals.shape[0]))
-      for n_sample in range(featureVals.shape[0]):
-        featv = interpolationND.vectd(featureVals[n_sample][:])
-        prediction[target][n_sample] = self.interpolator[index].interpolateAt(featv)
-      self.raiseAMessage('NDinterpRom   : Prediction by ' + self.__class__.ROMtype + ' for target '+target+'. Predicted value is ' + str(prediction[target][n_sample]))
+      prediction[target] = predictions[:,index]
+      self.raiseAMessage('NDinterpRom   : Prediction by ' + self.__class__.ROMtype + ' for target '+target+'. Predicted value is ' + str(prediction[target][-1]))
     return prediction
 
+  def _interpolateTargets(self,featureVals):
+    """
+      Interpolates all the targets at all the requested points.
+      Each point is converted only once for the interpolators of all the targets.
+      @ In, featureVals, numpy.array 2-D, features, shape [n_samples, n_features]
+      @ Out, predictions, numpy.array 2-D, predicted values, shape [n_samples, n_targets]
+    """
+    predictions = np.zeros((featureVals.shape[0],len(self.target)))
+    for n_sample in range(featureVals.shape[0]):
+      featv = interpolationND.vectd(featureVals[n_sample][:])
+      for index in range(len(self.target)):
+        predictions[n_sample,index] = self.interpolator[index].interpolateAt(featv)
+    return predictions
+
   def __returnInitialParametersLocal__(self):
     """
       Returns a dictionary with the parameters and their initial values
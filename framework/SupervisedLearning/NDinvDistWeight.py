@@ -23,6 +23,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 #End compatibility block for Python 3----------------------------------------------------------------
 
 #External Modules------------------------------------------------------------------------------------
+import numpy as np
 #External Modules End--------------------------------------------------------------------------------
 
 #Internal Modules------------------------------------------------------------------------------------
@@ -66,3 +67,29 @@ class NDinvDistWeight(NDinterpolatorRom):
       @ Out, None
     """
     self.__initLocal__()
+
+  def _interpolateTargets(self,featureVals):
+    """
+      Interpolates all the targets at all the requested points at once.
+      The distances (and so the weights) from the training points are shared among the targets; the
+      interpolation is the same as the one of the crow InverseDistanceWeighting.
+      @ In, featureVals, numpy.array 2-D, features, shape [n_samples, n_features]
+      @ Out, predictions, numpy.array 2-D, predicted values, shape [n_samples, n_targets]
+    """
+    p = float(self.initOptionDict['p'])
+    trainFeatures = np.asarray(self.featv,dtype=float)
+    trainTargets = np.asarray(self.targv,dtype=float).reshape(len(trainFeatures),-1)
+    predictions = np.zeros((featureVals.shape[0],trainTargets.shape[1]))
+    # evaluate by blocks of points, to bound the size of the distance matrices
+    blockSize = max(1,int(1e7)//trainFeatures.size)
+    for start in range(0,featureVals.shape[0],blockSize):
+      block = featureVals[start:start+blockSize]
+      distances = np.sum(np.abs(block[:,np.newaxis,:]-trainFeatures[np.newaxis,:,:])**p,axis=2)**(1.0/p)
+      # a point coinciding with a training point takes its value
+      coincident = distances == 0.0
+      exact = coincident.any(axis=1)
+      weights = (1.0/distances[~exact])**(trainFeatures.shape[1]+1)
+      blockPredictions = predictions[start:start+blockSize]
+      blockPredictions[~exact] = weights.dot(trainTargets)/weights.sum(axis=1)[:,np.newaxis]
+      blockPredictions[exact] = trainTargets[np.argmax(coincident[exact],axis=1)]
+    return predictions
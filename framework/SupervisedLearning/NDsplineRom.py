@@ -65,7 +65,7 @@ class NDsplineRom(NDinterpolatorRom):
     numDiscrPerDimension = int(math.ceil(len(targetVals)**(1./len(self.features))))
     newNumberSamples     = numDiscrPerDimension**len(self.features)
     # get discretizations
-    discretizations = [ list(set(featureVals[:,d].tolist())) for d in range(len(self.features))]
+    discretizations = [np.unique(featureVals[:,d]) for d in range(len(self.features))]
     # check if it is a tensor grid or not
     tensorGrid = False if np.prod( [len(d) for d in discretizations] ) != len(targetVals) else True
     if not tensorGrid:
@@ -74,18 +74,14 @@ class NDsplineRom(NDinterpolatorRom):
       featureVals = copy.deepcopy(featureVals)
       targetVals  = copy.deepcopy(targetVals)
       # new discretization
-      newDiscretizations = [np.linspace(min(discretizations[d]), max(discretizations[d]), num=numDiscrPerDimension, dtype=float).tolist() for d in range(len(self.features))]
+      newDiscretizations = [np.linspace(discretizations[d][0], discretizations[d][-1], num=numDiscrPerDimension, dtype=float).tolist() for d in range(len(self.features))]
       # new feature values
       newFeatureVals = np.atleast_2d(np.asarray(list(product(*newDiscretizations))))
-      # new valuesContainer
-      newTargetVals = np.zeros( (newNumberSamples,len(self.target)) )
-      for index in range(len(self.target)):
-        # not a tensor grid => interpolate
-        nr = sklearn.neighbors.KNeighborsRegressor(n_neighbors= min(2**len(self.features),len(targetVals)), weights='distance')
-        nr.fit(featureVals, targetVals[:,index])
-        # new target values
-        newTargetVals[:,index] = nr.predict(newFeatureVals)
-      targetVals  = newTargetVals
+      # not a tensor grid => interpolate all the targets at once, sharing the neighbor search
+      nr = sklearn.neighbors.KNeighborsRegressor(n_neighbors= min(2**len(self.features),len(targetVals)), weights='distance')
+      nr.fit(featureVals, targetVals)
+      # new target values
+      targetVals  = nr.predict(newFeatureVals).reshape(newNumberSamples,len(self.target))
       featureVals = newFeatureVals
     # fit the model
     self.featv, self.targv = featureVals,targetVals
@@ -29,6 +29,7 @@ import numpy as np
 #Internal Modules------------------------------------------------------------------------------------
 from SupervisedLearning import supervisedLearning
 from SupervisedLearning import NDsplineRom
+from Decorators.Parallelization import Parallel
 #Internal Modules End--------------------------------------------------------------------------------
 
 
@@ -60,6 +61,7 @@ class PolyExponential(supervisedLearning):
     self.polyExpParams['polyOrder']         = int(kwargs.get('polyOrder',3))                # the polynomial order
     self.polyExpParams['tol']               = float(kwargs.get('tol',0.001))                # optimization tolerance
     self.polyExpParams['maxNumberIter']     = int(kwargs.get('maxNumberIter',5000))         # maximum number of iterations in optimization
+    self.polyExpParams['warmStart']         = bool(kwargs.get('warmStart',False))           # warm-start the optimization from the coefficients of neighbouring samples?
     self.aij                                = None                                          # a_ij coefficients of the exponential terms {'target1':ndarray(nsamples, self.polyExpParams['expTerms']),'target2',ndarray,etc}
     self.bij                                = None                                          # b_ij coefficients of the exponent of the exponential terms {'target1':ndarray(nsamples, self.polyExpParams['expTerms']),'target2',ndarray,etc}
     self.model                              = None                                          # the surrogate model itself {'target1':model,'target2':model, etc.}
@@ -78,58 +80,49 @@ class PolyExponential(supervisedLearning):
     """
     self.muAndSigmaFeatures[feat] = (0.0,1.0)
 
-  def __computeExpTerms(self, x, y, returnPredictDiff=True):
+  def _fitSamples(self, pivotValues, sampleValues, samples, guesses, jobHandler):
     """
-      Method to compute the coefficients of "n" exponential terms that minimize the
-      difference between the training data and the "predicted" data
-      y(x) = sum_{i=1}**n a_i exp ( - bi x )
-      @ In, x, numpy.ndarray, the x values
-      @ In, y, numpy.ndarray, the target values
-      @ In, storePredictDiff, bool, optional, True if the prediction differences need to be returned (default False)
-      @ Out, (fi, taui**(-1), predictionErr (optional) ), tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray (optional)),
-             ai and bi and predictionErr (if returnPredictDiff=True)
+      Fits the exponential terms of a set of samples, through the JobHandler if available.
+      The results are collected by sample index, so that they do not depend on the order in which the jobs complete.
+      @ In, pivotValues, numpy.ndarray, shape = (n_samples, n_timeStep), the pivot values of each sample
+      @ In, sampleValues, numpy.ndarray, shape = (n_samples, n_targets, n_timeStep), the target values of each sample
+      @ In, samples, list, the indexes of the samples to fit
+      @ In, guesses, list, the initial guesses of each sample in "samples" (see computeSampleExpTerms)
+      @ In, jobHandler, JobHandler instance, the JobHandler (None to fit the samples serially)
+      @ Out, fits, dict, {sampleIndex: list of (ai, bi, predictionErr) for each target}
     """
-    def _objective(s):
-      """
-        Objective function for the optimization
-        @ In, s, numpy.ndarray, the array of coefficient
-        @ Out, objective, float, the cumulative difference between the predicted and the real data
-      """
-      l = int(s.size/2)
-      return np.sum((y - np.dot(s[l:], np.exp(-np.outer(1./s[:l], x))))**2.)
-    # I import the differential_evolution here since it is available for scipy ver > 0.15 only and
-    # we do not require it yet
-    ##TODO: update library requirement
-    try:
-      from scipy.optimize import differential_evolution
-    except ImportError:
-      self.raiseAnError(ImportError, "Minimum scipy version to use this SM is 0.15")
-    numberTerms   = self.polyExpParams['expTerms']
-    predictionErr = None
-    x, y          = np.array(x), np.array(y)
-    bounds        = [[min(x), max(x)]]*numberTerms + [[min(y), max(y)]]*numberTerms
-    result        = differential_evolution(_objective, bounds,
-                                           maxiter=self.polyExpParams['maxNumberIter'],
-                                           tol=self.polyExpParams['tol'],
-                                           disp=False,
-                                           seed=200286)
-    taui, fi      = np.split(result['x'], 2)
-    sortIndexes   = np.argsort(fi)
-    fi, taui      = fi[sortIndexes], taui[sortIndexes]
-    if returnPredictDiff:
-      predictionErr = (y-self.__evaluateExpTerm(x, fi, 1./taui))/y
-    return fi, 1./taui, predictionErr
+    params = (self.polyExpParams['expTerms'], self.polyExpParams['maxNumberIter'], self.polyExpParams['tol'])
+    fits = {}
+    if jobHandler is None:
+      for smp, guess in zip(samples, guesses):
+        self.raiseADebug("Computing exponential terms for sample ID "+str(smp+1))
+        fits[smp] = computeSampleExpTerms.original_function(pivotValues[smp], sampleValues[smp], *params, guesses=guess)
+      return fits
+    self.raiseADebug('Computing exponential terms for {} samples through the JobHandler ...'.format(len(samples)))
+    argsList = [(pivotValues[smp], sampleValues[smp]) + params + (guess,) for smp, guess in zip(samples, guesses)]
+    evaluations = jobHandler.runJobs(argsList, computeSampleExpTerms, '{}_expTerms_'.format(self.printTag),
+                                     '{}_{}_expTerms'.format(self.printTag, id(self)))
+    fits = dict(zip(samples, evaluations))
+    return fits
 
-  def __evaluateExpTerm(self,x, a, b):
+  @staticmethod
+  def _warmStartSeeds(featureVals, nSeeds):
     """
-      Evaluate exponential term given x, a and b
-      y(x) = sum_{i=1}**n ai exp ( - bi x )
-      @ In, x, numpy.ndarray, the x values
-      @ In, a, numpy.ndarray, the a values
-      @ In, b, numpy.ndarray, the b values
-      @ Out, y, numpy.ndarray, the outcome y(x)
+      Selects the samples to be fitted from scratch when warm-starting, spreading them over the (standardized)
+      feature space by a farthest point selection starting from the first sample.
+      @ In, featureVals, numpy.ndarray, shape= (n_samples, n_dimensions), an array of input data
+      @ In, nSeeds, int, the number of samples to select
+      @ Out, seeds, list, the indexes of the selected samples
     """
-    return np.dot(a, np.exp(-np.outer(b, x)))
+    scale = featureVals.std(axis=0)
+    scale[scale == 0.0] = 1.0
+    points = (featureVals - featureVals.mean(axis=0))/scale
+    seeds = [0]
+    distances = np.linalg.norm(points - points[0], axis=1)
+    while len(seeds) < nSeeds and distances.max() > 0.0:
+      seeds.append(int(np.argmax(distances)))
+      distances = np.minimum(distances, np.linalg.norm(points - points[seeds[-1]], axis=1))
+    return seeds
 
   def __trainLocal__(self,featureVals,targetVals):
     """
@@ -157,11 +150,27 @@ class PolyExponential(supervisedLearning):
         self.aij[target]          = np.zeros( (nsamples, self.polyExpParams['expTerms']))
         self.bij[target]          = np.zeros((nsamples, self.polyExpParams['expTerms']))
         self.predictError[target] = np.zeros( (nsamples, len(targetVals[0,:,index]) ))
-    #TODO: this can be parallelized
+    # fit the exponential terms of each sample, in parallel if the JobHandler is available
+    jobHandler = self._getJobHandler()
+    targets = list(targetIndexes)
+    pivotValues = targetVals[:,:,pivotParamIndex]
+    sampleValues = targetVals[:,:,[targetIndexes[target] for target in targets]].transpose(0,2,1)
+    if self.polyExpParams['warmStart'] and nsamples > 1:
+      # fit a subset of samples spread over the feature space from scratch, then start each
+      # of the remaining optimizations from the coefficients of its nearest fitted sample
+      seeds = self._warmStartSeeds(featureVals, int(np.ceil(np.sqrt(nsamples))))
+      fits = self._fitSamples(pivotValues, sampleValues, seeds, [None]*len(seeds), jobHandler)
+      others = [smp for smp in range(nsamples) if smp not in fits]
+      scale = featureVals.std(axis=0)
+      scale[scale == 0.0] = 1.0
+      distances = np.linalg.norm((featureVals[others,None,:] - featureVals[None,seeds,:])/scale, axis=2)
+      nearest = [seeds[i] for i in np.argmin(distances, axis=1)]
+      guesses = [[fit[:2] for fit in fits[smp]] for smp in nearest]
+      fits.update(self._fitSamples(pivotValues, sampleValues, others, guesses, jobHandler))
+    else:
+      fits = self._fitSamples(pivotValues, sampleValues, list(range(nsamples)), [None]*nsamples, jobHandler)
     for smp in range(nsamples):
-      self.raiseADebug("Computing exponential terms for sample ID "+str(smp+1))
-      for target in targetIndexes:
-        resp = self.__computeExpTerms(targetVals[smp,:,pivotParamIndex],targetVals[smp,:,targetIndexes[target]])
+      for target, resp in zip(targets, fits[smp]):
         self.aij[target][smp,:], self.bij[target][smp,:], self.predictError[target][smp,:] = resp
     # store the pivot values
     self.pivotValues = targetVals[0,:,pivotParamIndex]
@@ -202,7 +211,8 @@ class PolyExponential(supervisedLearning):
       This method is used to inquire the PolyExponential to evaluate (after normalization that in
       this case is not performed)  a set of points contained in featureVals.
       @ In, featureVals, numpy.ndarray, shape= (n_requests, n_dimensions), an array of input data
-      @ Out, returnEvaluation , dict, dictionary of values for each target (and pivot parameter)
+      @ Out, returnEvaluation , dict, dictionary of values for each target (and pivot parameter); the targets'
+            histories are shaped (n_requests, n_timeStep), or (n_timeStep) if a single point is requested
     """
     returnEvaluation = {self.pivotParameterID:self.pivotValues}
     for target in list(set(self.target) - set([self.pivotParameterID])):
@@ -218,11 +228,10 @@ class PolyExponential(supervisedLearning):
           evalDict = self.model[target].__class__.__evaluateLocal__(self.model[target],featureVals)
           for cnt,targ in enumerate(self.model[target].target):
             evaluation[:,cnt] = evalDict[targ][:]
-      for point in range(len(evaluation)):
-        l = int(evaluation[point].size/2)
-        returnEvaluation[target] =  self.__evaluateExpTerm(self.pivotValues,
-                                                                evaluation[point][:l],
-                                                                evaluation[point][l:])
+      # evaluate the exponential terms of all the requested points at once
+      l = int(evaluation.shape[1]/2)
+      histories = np.einsum('pi,pit->pt', evaluation[:,:l], np.exp(-evaluation[:,l:,None]*self.pivotValues))
+      returnEvaluation[target] = histories[0] if len(histories) == 1 else histories
     return returnEvaluation
 
   def writeXMLPreamble(self, writeTo, targets = None):
@@ -332,3 +341,78 @@ class PolyExponential(supervisedLearning):
     """
     return self.polyExpParams
 
+#
+#
+#
+#
+def evaluateExpTerms(x, a, b):
+  """
+    Evaluate exponential terms given x, a and b
+    y(x) = sum_{i=1}**n ai exp ( - bi x )
+    @ In, x, numpy.ndarray, the x values
+    @ In, a, numpy.ndarray, the a values
+    @ In, b, numpy.ndarray, the b values
+    @ Out, y, numpy.ndarray, the outcome y(x)
+  """
+  return np.dot(a, np.exp(-np.outer(b, x)))
+
+def computeExpTerms(x, y, numberTerms, maxNumberIter, tol, guess=None):
+  """
+    Method to compute the coefficients of "n" exponential terms that minimize the
+    difference between the training data and the "predicted" data
+    y(x) = sum_{i=1}**n a_i exp ( - bi x )
+    @ In, x, numpy.ndarray, the x values
+    @ In, y, numpy.ndarray, the target values
+    @ In, numberTerms, int, the number of exponential terms
+    @ In, maxNumberIter, int, maximum number of iterations (generations) of the optimization
+    @ In, tol, float, relative tolerance of the optimization
+    @ In, guess, tuple, optional, (ai, bi) coefficients the optimization is started from (e.g. from a neighbouring sample)
+    @ Out, (fi, taui**(-1), predictionErr), tuple(numpy.ndarray, numpy.ndarray, numpy.ndarray), ai and bi and predictionErr
+  """
+  from scipy.optimize import differential_evolution
+  def _objective(s):
+    """
+      Objective function for the optimization
+      @ In, s, numpy.ndarray, the array of coefficient
+      @ Out, objective, float, the cumulative difference between the predicted and the real data
+    """
+    l = int(s.size/2)
+    return np.sum((y - np.dot(s[l:], np.exp(-np.outer(1./s[:l], x))))**2.)
+  x, y   = np.array(x), np.array(y)
+  bounds = [[min(x), max(x)]]*numberTerms + [[min(y), max(y)]]*numberTerms
+  init   = 'latinhypercube'
+  if guess is not None:
+    # population (same size as the default one) clustered around the guess, which is included as is
+    lower, upper = np.array(bounds, dtype=float).T
+    start   = np.clip(np.concatenate((1./np.asarray(guess[1]), guess[0])), lower, upper)
+    spread  = 0.05*(upper - lower)
+    init    = np.clip(start + np.random.RandomState(200286).normal(size=(15*len(bounds), len(bounds)))*spread, lower, upper)
+    init[0] = start
+  result = differential_evolution(_objective, bounds,
+                                  maxiter=maxNumberIter,
+                                  tol=tol,
+                                  init=init,
+                                  disp=False,
+                                  seed=200286)
+  taui, fi    = np.split(result['x'], 2)
+  sortIndexes = np.argsort(fi)
+  fi, taui    = fi[sortIndexes], taui[sortIndexes]
+  predictionErr = (y-evaluateExpTerms(x, fi, 1./taui))/y
+  return fi, 1./taui, predictionErr
+
+@Parallel()
+def computeSampleExpTerms(x, ys, numberTerms, maxNumberIter, tol, guesses=None):
+  """
+    Computes the exponential terms of all the targets of a single sample.
+    Module-level so it can be dispatched through the JobHandler.
+    @ In, x, numpy.ndarray, the pivot values of the sample
+    @ In, ys, numpy.ndarray, shape = (n_targets, n_timeStep), the target values of the sample
+    @ In, numberTerms, int, the number of exponential terms
+    @ In, maxNumberIter, int, maximum number of iterations (generations) of the optimization
+    @ In, tol, float, relative tolerance of the optimization
+    @ In, guesses, list, optional, (ai, bi) initial guesses for each target (None for no guess)
+    @ Out, fits, list, (ai, bi, predictionErr) for each target
+  """
+  if guesses is None:
+    guesses = [None]*len(ys)
+  return [computeExpTerms(x, y, numberTerms, maxNumberIter, tol, guess) for y, guess in zip(ys, guesses)]
@@ -20,6 +20,7 @@
 # standard libraries
 from __future__ import division, print_function, absolute_import
 import copy
+import pickle
 import warnings
 from collections import defaultdict, OrderedDict
 import pprint
@@ -28,9 +29,11 @@ import pprint
 import abc
 import numpy as np
 import pandas as pd
+import cloudpickle
 from scipy.interpolate import interp1d
 # internal libraries
 from utils import utils, mathUtils, xmlUtils, randomUtils
+from Decorators.Parallelization import Parallel
 from .SupervisedLearning import supervisedLearning
 # import pickle as pk # TODO remove me!
 import os
@@ -73,6 +76,9 @@ class Collection(supervisedLearning):
     # additional
     for n in nope:
       d.pop(n, None)
+    # the JobHandler is only used during training, and is not serializable
+    if '_jobHandler' in d:
+      d['_jobHandler'] = None
     return d
 
   @abc.abstractmethod
@@ -175,6 +181,7 @@ class Segments(Collection):
     # allow some ROM training to happen globally, seperate from individual segment training
     ## see design note for Clusters
     self._romGlobalAdjustments = None  # global ROM settings, provided by the templateROM before clustering
+    self._jobHandler = None            # JobHandler to train segment ROMs in parallel, if provided by the Assembler
 
     # set up segmentation
     # get input specifications from inputParams
@@ -221,6 +228,15 @@ class Segments(Collection):
   ###############
   # RUN METHODS #
   ###############
+  def readAssembledObjects(self):
+    """
+      Collects the entities from the Assembler as needed.
+      Segments use the JobHandler, if available, to train the segment ROMs in parallel.
+      @ In, None
+      @ Out, None
+    """
+    self._jobHandler = self._getJobHandler()
+
   def setAdditionalParams(self, params):
     """
       Stores (and later passes through) additional parameters to the sub-roms
@@ -510,13 +526,18 @@ class Segments(Collection):
     # TODO assumes only pivot param
     if pivotID not in self._indexValues:
       self._indexValues[pivotID] = trainingSet[pivotID][0]
-    # loop over clusters and train data
+    # serialize the template once; restoring it for each segment is much cheaper than a deepcopy
+    template = cloudpickle.dumps(templateROM)
+    # loop over clusters and set up the data and ROM for each
     roms = []
+    segmentData = []
     for i, subdiv in enumerate(counter):
       # slicer for data selection
       picker = slice(subdiv[0], subdiv[-1] + 1)
       ## TODO we need to be slicing all the data, not just one realization, once we support non-ARMA segmentation.
-      data = dict((var, [copy.deepcopy(trainingSet[var][0][picker])]) for var in trainingSet)
+      # segments are views on the training arrays, in containers of their own: entries can be replaced
+      # (e.g. by the global ROM settings), but the arrays themselves must not be modified in place
+      data = dict((var, [trainingSet[var][0][picker]]) for var in trainingSet)
       # renormalize the pivot if requested, e.g. by shifting values
       norm = self._divisionPivotShift[pivotID]
       if norm:
@@ -526,18 +547,38 @@ class Segments(Collection):
         elif norm == 'first':
           # left-shift so that first entry is equal to pivot's first value (maybe not zero)
           delta = data[pivotID][0][0] - trainingSet[pivotID][0][0]
-        data[pivotID][0] -= delta
-      # create a new ROM and train it!
-      newROM = copy.deepcopy(templateROM)
+        # not in place, since the pivot values are shared with the full training set
+        data[pivotID][0] = data[pivotID][0] - delta
+      # create a new ROM
+      newROM = pickle.loads(template)
       newROM.name = '{}_seg{}'.format(self._romName, i)
       newROM.adjustLocalRomSegment(self._romGlobalAdjustments, picker)
-      self.raiseADebug('Training segment', i, picker)
-      newROM.train(data)
       roms.append(newROM)
+      segmentData.append(data)
+    # train them!
+    if self._jobHandler is None:
+      for i, (newROM, data) in enumerate(zip(roms, segmentData)):
+        self.raiseADebug('Training segment', i, counter[i])
+        newROM.train(data)
+    else:
+      roms = self._parallelTrainSubdomainROMs(roms, segmentData)
     # format array for future use
     roms = np.array(roms)
     return roms
 
+  def _parallelTrainSubdomainROMs(self, roms, segmentData):
+    """
+      Trains the segment ROMs through the JobHandler, collecting them in segment order.
+      If no running spot is available (e.g. this ROM is trained inside a running job), runJobs trains them serially.
+      @ In, roms, list(supervisedLearning), untrained ROMs for each subdomain
+      @ In, segmentData, list(dict), training data for each subdomain
+      @ Out, trained, list(supervisedLearning), trained ROMs for each subdomain
+    """
+    self.raiseADebug('Training {} segments through the JobHandler ...'.format(len(roms)))
+    trained = self._jobHandler.runJobs(list(zip(roms, segmentData)), trainSegmentROM,
+                                       '{}_segment_'.format(self._romName), '{}_segments'.format(self._romName))
+    return trained
+
   def _writeSegmentsRealization(self, writeTo):
     """
       Writes pointwise data about segmentation to a realization.
@@ -671,6 +712,7 @@ class Clusters(Segments):
       @ In, None
       @ Out, None
     """
+    Segments.readAssembledObjects(self)
     # get the classifier to use, if any, from the Assembler
     ## this is used to cluster the ROM segments
     classifier = self._assembledObjects.get('Classifier', [[None]*4])[0][3]
@@ -1598,3 +1640,18 @@ class Interpolated(supervisedLearning):
         associated with the corresponding points in featureVals
     """
     pass
+
+#
+#
+#
+#
+@Parallel()
+def trainSegmentROM(rom, data):
+  """
+    Trains a single segment ROM. Module-level so it can be dispatched through the JobHandler.
+    @ In, rom, supervisedLearning instance, untrained segment ROM
+    @ In, data, dict, training data for the segment
+    @ Out, rom, supervisedLearning instance, trained segment ROM
+  """
+  rom.train(data)
+  return rom
@@ -128,6 +128,8 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta), MessageUser):
     """
     state = copy.copy(self.__dict__)
     state['initOptionDict'].pop('paramInput', None)
+    # the assembled objects (e.g. the JobHandler) are only used during training, and are not serializable
+    state['_assembledObjects'] = None
     ## capture what is normally pickled
     if not self.amITrained:
       supervisedEngineObj = state.pop("supervisedContainer", None)
@@ -198,6 +200,15 @@ class supervisedLearning(utils.metaclass_insert(abc.ABCMeta), MessageUser):
     """
     pass
 
+  def _getJobHandler(self):
+    """
+      Retrieves the JobHandler, if it was provided by the Assembler (e.g. to train sub-ROMs in parallel).
+      @ In, None
+      @ Out, jobHandler, JobHandler instance, the JobHandler (None if not available)
+    """
+    assembled = self._assembledObjects if self._assembledObjects is not None else {}
+    return assembled.get('jobHandler', [[None]*4])[0][3]
+
   def train(self, tdict, indexMap=None):
     """
       Method to perform the training of the supervisedLearning algorithm
@@ -119,20 +119,26 @@ class SyntheticHistory(supervisedLearning):
 
   def __evaluateLocal__(self, featureVals):
     """
-      @ In, featureVals, float, a scalar feature value is passed as scaling factor
-      @ Out, rlz, dict, realization dictionary of values for each target
+      Generates one synthetic history for each requested point.
+      @ In, featureVals, np.array, requested points with dims [n_requests, n_features]
+      @ Out, rlz, dict, realization dictionary of values for each target; histories are shaped
+                        [n_requests, n_timeStep], or [n_timeStep] if a single point is requested
     """
     pivots = self.pivotParameterValues
-    result = np.zeros((self.pivotParameterValues.size, len(self.target) - 1)) # -1 is pivot
+    numSamples = max(1, len(featureVals))
+    result = np.zeros((numSamples, self.pivotParameterValues.size, len(self.target) - 1)) # -1 is pivot
     for algo in self.tsaAlgorithms[::-1]:
       settings = self.algoSettings[algo]
       targets = settings['target']
       indices = tuple(self.target.index(t) for t in targets)
       params = self.trainedParams[algo]
-      signal = algo.generate(params, pivots, settings)
-      result[:, indices] += signal
+      # all the histories are generated at once; stochastic algorithms provide a new realization for each
+      signals = algo.generateBatch([params] * numSamples, pivots, settings)
+      result[:, :, indices] += signals
+    if numSamples == 1:
+      result = result[0]
     # RAVEN realization construction
-    rlz = dict((target, result[:, t]) for t, target in enumerate(self.target) if target != self.pivotParameterID)
+    rlz = dict((target, result[..., t]) for t, target in enumerate(self.target) if target != self.pivotParameterID)
     rlz[self.pivotParameterID] = self.pivotParameterValues
     return rlz
 
@@ -15,10 +15,7 @@
   Fourier time series analysis
   Note this determines the fit of desired bases, not a fast fourier transform
 """
-import copy
-import collections
 import numpy as np
-import sklearn.linear_model
 
 from utils import InputData, InputTypes, randomUtils, xmlUtils, mathUtils, utils
 from .TimeSeriesAnalyzer import TimeSeriesAnalyzer
@@ -88,6 +85,19 @@ class Fourier(TimeSeriesAnalyzer):
       @ In, simultFit, bool, optional, if False then fit Fourier individually
       @ Out, params, dict, characteristic parameters
     """
+    return self.characterizeBatch(signal[np.newaxis, :, :], pivot, targets, settings, simultFit=simultFit)[0]
+
+  def characterizeBatch(self, signals, pivot, targets, settings, simultFit=True):
+    """
+      Determines the charactistics of many signals sharing the same pivot based on this algorithm.
+      All the signals share the same Fourier bases, so they are fit together.
+      @ In, signals, np.ndarray, time series with dims [segment, time, target]
+      @ In, pivot, np.1darray, time-like parameter values
+      @ In, targets, list(str), names of targets in same order as signals
+      @ In, settings, dict, additional settings specific to this algorithm
+      @ In, simultFit, bool, optional, if False then fit Fourier individually
+      @ Out, params, list(dict), characteristic parameters of each segment
+    """
     periods = settings['periods']
     fourierSignals = self._generateBaseFourier(pivot, periods)
     # fourierSignals dimensions, for each key (base):
@@ -99,63 +109,57 @@ class Fourier(TimeSeriesAnalyzer):
     #                 3:   cos(2pi*t/period[1]), ...
     # check collinearity
     cond = np.linalg.cond(fourierSignals) if simultFit else 30
+    # stack the histories of all segments and targets as columns, ordered as [segment, target]
+    S, H, T = signals.shape
+    histories = np.asarray(signals, dtype=float).transpose(1, 0, 2).reshape(H, S * T)
+    targetNames = ', '.join(targets)
     # fit
-    params = {}
-    for tg, target in enumerate(targets):
-      history = signal[:, tg] # TODO need to keep in sync with SyntheticSignal ROM!
-      if simultFit and cond < 30:
-        print(f'Fourier fitting condition number is {cond:1.1e} for "{target}". ',
-                        ' Calculating all Fourier coefficients at once.')
-        fourierEngine = sklearn.linear_model.LinearRegression(normalize=False)
-        fourierEngine.fit(fourierSignals, history)
-        intercept = fourierEngine.intercept_
-        coeffs = fourierEngine.coef_
-      else:
-        print(f'Fourier fitting condition number is {cond:1.1e} for "{target}"! ',
-                        'Calculating iteratively instead of all at once.')
-        # fourierSignals has shape (H, 2F) where H is history len and F is number of Fourier periods
-        ## Fourier periods are in order from largest period to smallest, with sin then cos for each:
-        ## [S0, C0, S1, C1, ..., SN, CN]
-        H, F2 = fourierSignals.shape
-        signalToFit = copy.deepcopy(history) # will be modified during analysis
-        intercept = 0
-        coeffs = np.zeros(F2) # amplitude coeffs for sine, cosine
-        for fn in range(F2):
-          fSignal = fourierSignals[:,fn] # Fourier base signal for this waveform
-          eng = sklearn.linear_model.LinearRegression(normalize=False) # regressor
-          eng.fit(fSignal.reshape(H,1), signalToFit)
-          thisIntercept = eng.intercept_
-          thisCoeff = eng.coef_[0]
-          coeffs[fn] = thisCoeff
-          intercept += thisIntercept
-          # remove this signal from the signal to fit
-          thisSignal = thisIntercept + thisCoeff * fSignal
-          signalToFit -= thisSignal
+    if simultFit and cond < 30:
+      print(f'Fourier fitting condition number is {cond:1.1e} for "{targetNames}". ',
+                      ' Calculating all Fourier coefficients at once.')
+      # single least squares solve (with intercept) shared by all the histories
+      baseMean = fourierSignals.mean(axis=0)
+      histMean = histories.mean(axis=0)
+      coeffs = np.linalg.lstsq(fourierSignals - baseMean, histories - histMean, rcond=None)[0]
+      intercepts = histMean - baseMean.dot(coeffs)
+    else:
+      print(f'Fourier fitting condition number is {cond:1.1e} for "{targetNames}"! ',
+                      'Calculating iteratively instead of all at once.')
+      # fourierSignals has shape (H, 2F) where H is history len and F is number of Fourier periods
+      ## Fourier periods are in order from largest period to smallest, with sin then cos for each:
+      ## [S0, C0, S1, C1, ..., SN, CN]
+      F2 = fourierSignals.shape[1]
+      signalToFit = histories.copy() # will be modified during analysis
+      intercepts = np.zeros(S * T)
+      coeffs = np.zeros((F2, S * T)) # amplitude coeffs for sine, cosine
+      for fn in range(F2):
+        fSignal = fourierSignals[:, fn] # Fourier base signal for this waveform
+        fCentered = fSignal - fSignal.mean()
+        fitMean = signalToFit.mean(axis=0)
+        # single-base regression of every history
+        thisCoeff = fCentered.dot(signalToFit - fitMean) / fCentered.dot(fCentered)
+        thisIntercept = fitMean - thisCoeff * fSignal.mean()
+        coeffs[fn] = thisCoeff
+        intercepts += thisIntercept
+        # remove this signal from the signal to fit
+        signalToFit -= thisIntercept + np.outer(fSignal, thisCoeff)
 
-      # get coefficient map for A*sin(ft) + B*cos(ft)
-      waveCoefMap = collections.defaultdict(dict) # {period: {sin:#, cos:#}}
-      for c, coef in enumerate(coeffs):
-        period = periods[c//2]
-        waveform = 'sin' if c % 2 == 0 else 'cos'
-        waveCoefMap[period][waveform] = coef
-      # convert to C*sin(ft + s)
-      ## since we use fitting to get A and B, the magnitudes can be deceiving.
-      ## this conversion makes "C" a useful value to know the contribution from a period
-      coefMap = {}
-      # TODO can we put off making and storing the signal until called on?
-      # signal = np.ones(len(pivot)) * intercept
-      for period, coefs in waveCoefMap.items():
-        A = coefs['sin']
-        B = coefs['cos']
-        C, s = mathUtils.convertSinCosToSinPhase(A, B)
-        coefMap[period] = {'amplitude': C, 'phase': s}
-      #   signal += mathUtils.evalFourier(period, C, s, pivot)
-
-      # store results
-      params[target] = {'intercept': intercept,
-                        'coeffs'   : coefMap} #,
-                        # 'periods'  : self._periods}
-      # END for target in targets
+    # convert A*sin(ft) + B*cos(ft) to C*sin(ft + s)
+    ## since we use fitting to get A and B, the magnitudes can be deceiving.
+    ## this conversion makes "C" a useful value to know the contribution from a period
+    amplitudes, phases = mathUtils.convertSinCosToSinPhase(coeffs[0::2], coeffs[1::2])
+    # store results
+    params = []
+    for seg in range(S):
+      segParams = {}
+      for tg, target in enumerate(targets):
+        col = seg * T + tg
+        coefMap = {}
+        for p, period in enumerate(periods):
+          coefMap[period] = {'amplitude': amplitudes[p, col], 'phase': phases[p, col]}
+        segParams[target] = {'intercept': intercepts[col],
+                             'coeffs'   : coefMap}
+      params.append(segParams)
     return params
 
   # getResidual -> use base implementation
@@ -168,13 +172,23 @@ class Fourier(TimeSeriesAnalyzer):
       @ In, settings, dict, additional settings specific to algorithm
       @ Out, synthetic, np.array(float), synthetic ARMA signal
     """
-    synthetic = np.zeros((len(pivot), len(params)))
-    for t, (target, data) in enumerate(params.items()):
-      synthetic[:, t] += data['intercept']
-      for period, coeffs in data['coeffs'].items():
-        C = coeffs['amplitude']
-        s = coeffs['phase']
-        synthetic[:, t] += mathUtils.evalFourier(period, C, s, pivot)
+    return self.generateBatch([params], pivot, settings)[0]
+
+  def generateBatch(self, params, pivot, settings):
+    """
+      Generates many synthetic histories at once, one for each set of fitted parameters.
+      @ In, params, list(dict), characterizations such as otained from self.characterizeBatch()
+      @ In, pivot, np.array(float), pivot parameter values
+      @ In, settings, dict, additional settings specific to algorithm
+      @ Out, synthetic, np.array(float), synthetic signals with dims [realization, time, target]
+    """
+    targets = list(params[0].keys())
+    synthetic = np.zeros((len(params), len(pivot), len(targets)))
+    synthetic += np.array([[entry[target]['intercept'] for target in targets] for entry in params])[:, np.newaxis, :]
+    for period in params[0][targets[0]]['coeffs']:
+      C = np.array([[entry[target]['coeffs'][period]['amplitude'] for target in targets] for entry in params])
+      s = np.array([[entry[target]['coeffs'][period]['phase'] for target in targets] for entry in params])
+      synthetic += mathUtils.evalFourier(period, C[:, np.newaxis, :], s[:, np.newaxis, :], pivot[np.newaxis, :, np.newaxis])
     return synthetic
 
   def writeXML(self, writeTo, params):
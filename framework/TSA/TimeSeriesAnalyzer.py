@@ -16,6 +16,7 @@
   checking time histories.
 """
 import abc
+import numpy as np
 
 from utils import utils, InputData, InputTypes
 
@@ -119,6 +120,33 @@ class TimeSeriesAnalyzer(utils.metaclass_insert(abc.ABCMeta, object)):
       @ Out, synthetic, np.array(float), synthetic signal
     """
 
+  def characterizeBatch(self, signals, pivot, targets, settings):
+    """
+      Characterizes many time series sharing the same pivot (e.g. the segments of a clustered history).
+      @ In, signals, np.array, time series with dims [segment, time, target]
+      @ In, pivot, np.array, time-like parameter
+      @ In, targets, list(str), names of targets
+      @ In, settings, dict, additional settings specific to algorithm
+      @ Out, params, list(dict), characterization of each segment, as from self.characterize
+    """
+    # DEFAULT IMPLEMENTATION, characterize one segment at a time
+    # -> overload in inheritors that can share work among segments
+    return [self.characterize(signal, pivot, targets, settings) for signal in signals]
+
+  def generateBatch(self, params, pivot, settings):
+    """
+      Generates many synthetic histories at once, one for each set of fitted parameters.
+      Note that stochastic algorithms produce a new realization for each entry, so that several
+      realizations of the same model are obtained providing the same parameters several times.
+      @ In, params, list(dict), training parameters as from self.characterize (or self.characterizeBatch)
+      @ In, pivot, np.array, time-like array values
+      @ In, settings, dict, additional settings specific to algorithm
+      @ Out, synthetic, np.array(float), synthetic signals with dims [realization, time, target]
+    """
+    # DEFAULT IMPLEMENTATION, generate one signal at a time
+    # -> overload in inheritors that can generate several signals at once
+    return np.asarray([self.generate(entry, pivot, settings) for entry in params])
+
   def writeXML(self, writeTo, params):
     """
       Allows the engine to put whatever it wants into an XML to print to file.
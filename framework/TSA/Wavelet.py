@@ -103,28 +103,40 @@ class Wavelet(TimeSeriesAnalyzer):
       @ Out, params, dict, characteristic parameters
     """
     # TODO extend to continuous wavelet transform
+    return self.characterizeBatch(signal[np.newaxis, :, :], pivot, targets, settings)[0]
+
+  def characterizeBatch(self, signals, pivot, targets, settings):
+    """
+      Transforms many time-dependent series sharing the same pivot at once,
+      through the Discrete Wavelet Transform along the time axis.
+      @ In, signals, np.ndarray, time series with dims [segment, time, target]
+      @ In, pivot, np.1darray, time-like parameter values
+      @ In, targets, list(str), names of targets in same order as signals
+      @ In, settings, dict, additional settings specific to this algorithm
+      @ Out, params, list(dict), characteristic parameters of each segment
+    """
     try:
       import pywt
     except ModuleNotFoundError:
       print("This RAVEN TSA Module requires the PYWAVELETS library to be installed in the current python environment")
       raise ModuleNotFoundError
 
-
     ## The pivot input parameter isn't used explicity in the
     ## transformation as it assumed/required that each element in the
     ## time-dependent series is independent, uniquely indexed and
     ## sorted in time.
     family = settings['family']
-    params = {target: {'results': {}} for target in targets}
-
-    for i, target in enumerate(targets):
-      results = params[target]['results']
-      results['coeff_a'], results['coeff_d'] = pywt.dwt(signal[:, i], family)
-
+    coeffA, coeffD = pywt.dwt(signals, family, axis=1)
+    params = []
+    for seg in range(len(signals)):
+      segParams = {target: {'results': {}} for target in targets}
+      for i, target in enumerate(targets):
+        results = segParams[target]['results']
+        results['coeff_a'], results['coeff_d'] = coeffA[seg, :, i], coeffD[seg, :, i]
+      params.append(segParams)
     return params
 
 
-
   def generate(self, params, pivot, settings):
     """
       Generates a synthetic history from fitted parameters.
@@ -133,19 +145,29 @@ class Wavelet(TimeSeriesAnalyzer):
       @ In, settings, dict, additional settings specific to algorithm
       @ Out, synthetic, np.array(float), synthetic ARMA signal
     """
+    return self.generateBatch([params], pivot, settings)[0]
+
+  def generateBatch(self, params, pivot, settings):
+    """
+      Generates many synthetic histories at once, through the inverse Discrete Wavelet
+      Transform along the time axis.
+      @ In, params, list(dict), characterizations such as otained from self.characterizeBatch()
+      @ In, pivot, np.array(float), pivot parameter values
+      @ In, settings, dict, additional settings specific to algorithm
+      @ Out, synthetic, np.array(float), synthetic signals with dims [realization, time, target]
+    """
     try:
       import pywt
     except ModuleNotFoundError:
       print("This RAVEN TSA Module requires the PYWAVELETS library to be installed in the current python environment")
       raise ModuleNotFoundError
 
-    synthetic = np.zeros((len(pivot), len(params)))
+    targets = list(params[0].keys())
+    synthetic = np.zeros((len(params), len(pivot), len(targets)))
     family = settings['family']
-    for t, (target, _) in enumerate(params.items()):
-      results = params[target]['results']
-      cA = results['coeff_a']
-      cD = results['coeff_d']
-      synthetic[:, t] = pywt.idwt(cA, cD, family)
+    cA = np.stack([np.stack([entry[target]['results']['coeff_a'] for target in targets], axis=-1) for entry in params])
+    cD = np.stack([np.stack([entry[target]['results']['coeff_d'] for target in targets], axis=-1) for entry in params])
+    synthetic[:] = pywt.idwt(cA, cD, family, axis=1)
     return synthetic
 
 
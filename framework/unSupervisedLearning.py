@@ -28,6 +28,7 @@ from __future__ import division, print_function, unicode_literals, absolute_impo
 
 #External Modules---------------------------------------------------------------
 import scipy.cluster as hier
+from scipy.optimize import linear_sum_assignment
 import numpy as np
 import abc
 import ast
@@ -772,6 +773,8 @@ class temporalSciKitLearn(unSupervisedLearning):
 
     #Pop necessary to keep from confusing SciKitLearn with extra option
     self.reOrderStep = int(self.initOptionDict.pop('reOrderStep', 5))
+    # if True, each time step is initialized from the clustering found at the previous time step
+    self.warmStart = utils.stringIsTrue(self.initOptionDict.pop('warmStart', False))
 
     # return a SciKitLearn instance as engine for SKL data mining
     self.SKLEngine = factory.returnInstance('SciKitLearn', **self.initOptionDict)
@@ -905,11 +908,16 @@ class temporalSciKitLearn(unSupervisedLearning):
     ## around and maybe never be used
     self.metaDict = {}
 
+    # keep the user initialization so that warm starts always begin from it
+    coldStart = self.__warmStartParams__()
+
     for t in range(self.numberOfHistoryStep):
       sklInput = {}
       for feat in self.features:
         sklInput[feat] = self.inputDict[feat][:,t]
 
+      if self.warmStart and t > 0:
+        self.__warmStart__(sklInput)
       self.SKLEngine.features = sklInput
       self.SKLEngine.train(sklInput)
       self.SKLEngine.confidence()
@@ -968,11 +976,9 @@ class temporalSciKitLearn(unSupervisedLearning):
         # re-order clusters
         if t > 0:
           remap = self.__reMapCluster__(t, self.metaDict['clusterCenters'], self.metaDict['clusterCentersIndices'])
-          for n in range(len(self.metaDict['clusterCentersIndices'][t])):
-            self.metaDict['clusterCentersIndices'][t][n] = remap[self.metaDict['clusterCentersIndices'][t][n]]
-          for n in range(len(self.outputDict['outputs']['labels'][t])):
-            if self.outputDict['outputs']['labels'][t][n] >=0:
-              self.outputDict['outputs']['labels'][t][n] = remap[self.SKLEngine.Method.labels_[n]]
+          self.metaDict['clusterCentersIndices'][t] = [remap[n] for n in self.metaDict['clusterCentersIndices'][t]]
+          self.outputDict['outputs']['labels'][t] = self.__reMapLabels__(self.outputDict['outputs']['labels'][t],
+                                                                         self.SKLEngine.Method.labels_, remap)
           ## TODO: Remap the cluster centers now...
       elif self.SKLtype in ['mixture']:
         if 'means' not in self.metaDict.keys():
@@ -1026,12 +1032,9 @@ class temporalSciKitLearn(unSupervisedLearning):
         # re-order components
         if t > 0:
           remap = self.__reMapCluster__(t, self.metaDict['means'], self.metaDict['componentMeanIndices'])
-          for n in range(len(self.metaDict['componentMeanIndices'][t])):
-            self.metaDict['componentMeanIndices'][t][n] = remap[self.metaDict['componentMeanIndices'][t][n]]
-
-          for n in range(len(self.outputDict['outputs']['labels'][t])):
-            if self.outputDict['outputs']['labels'][t][n] >=0:
-              self.outputDict['outputs']['labels'][t][n] = remap[self.outputDict['outputs']['labels'][t][n]]
+          self.metaDict['componentMeanIndices'][t] = [remap[n] for n in self.metaDict['componentMeanIndices'][t]]
+          self.outputDict['outputs']['labels'][t] = self.__reMapLabels__(self.outputDict['outputs']['labels'][t],
+                                                                         self.outputDict['outputs']['labels'][t], remap)
       elif 'manifold' == self.SKLtype:
         # if 'noComponents' not in self.outputDict.keys():
         #   self.outputDict['noComponents'] = {}
@@ -1082,6 +1085,48 @@ class temporalSciKitLearn(unSupervisedLearning):
 
       else:
         self.raiseAnError(IOError, 'Unknown type: ' + str(self.SKLtype))
+    if coldStart:
+      self.SKLEngine.Method.set_params(**coldStart)
+
+  def __warmStartParams__(self):
+    """
+      Collects the initialization parameters of the engine that are overwritten by warm starting.
+      @ In, None
+      @ Out, params, dict, original initialization parameters (empty if warm starting is not in use)
+    """
+    params = {}
+    if self.warmStart:
+      engineParams = self.SKLEngine.Method.get_params()
+      params = dict((key, engineParams[key]) for key in ['init', 'n_init', 'means_init'] if key in engineParams)
+      if not params:
+        self.raiseAWarning('Warm starting is not available for "{}", every time step will be fit from scratch!'.format(self.SKLsubType))
+      else:
+        self.SKLEngine.Method.set_params(**params)
+    return params
+
+  def __warmStart__(self, sklInput):
+    """
+      Initializes the engine from the clusters (or component means) found at the previous time step,
+      which usually converges in very few iterations since the clusters move smoothly in time.
+      @ In, sklInput, dict, the (not normalized) feature values at the current time step
+      @ Out, None
+    """
+    method = self.SKLEngine.Method
+    params = method.get_params()
+    if hasattr(method, 'cluster_centers_') and 'init' in params:
+      centers, key, extra = method.cluster_centers_, 'init', {'n_init': 1}
+    elif hasattr(method, 'means_') and 'means_init' in params:
+      centers, key, extra = method.means_, 'means_init', {}
+    else:
+      return
+    # the engine normalizes each time step on its own, so move the centers into the new normalization
+    newCenters = np.empty(centers.shape)
+    for cnt, feat in enumerate(self.features):
+      oldMu, oldSigma = self.SKLEngine.muAndSigmaFeatures[feat]
+      mu, sigma = mathUtils.normalizationFactors(sklInput[feat])
+      newCenters[:, cnt] = (centers[:, cnt] * oldSigma + oldMu - mu) / sigma
+    extra[key] = newCenters
+    method.set_params(**extra)
 
   def __computeCenter__(self, data, labels):
     """
@@ -1183,6 +1228,45 @@ class temporalSciKitLearn(unSupervisedLearning):
 
       return dist
 
+  def __computeDistMatrix__(self,t,dataCenter):
+    """
+      Computes the "DistanceWithDecay" distance (see __computeDist__) between all the cluster centers
+      of the previous time step and all the cluster centers of the current time step at once.
+      @In, t, float, current time
+      @In, dataCenter, dict, each value contains the center coordinate at each time step
+      @Out, dMatrix, np.array, shape = (no_clusterAtPreviousTimeStep, no_clusterAtCurrentTimeStep), distances
+    """
+    N1 = dataCenter[t-1].shape[0]
+    x2 = dataCenter[t]
+    dMatrix = np.zeros(shape=(N1,x2.shape[0]))
+    decR = 1
+    for k in range(1,min(self.reOrderStep,t)+1):
+      # only the centers that existed that far back contribute
+      x1 = dataCenter[t-k][:N1]
+      dist = np.sqrt(((x1[:,np.newaxis,:] - x2[np.newaxis,:,:])**2).sum(axis=-1))
+      dMatrix[:x1.shape[0]] += dist*np.exp(-(k-1)*decR)
+    return dMatrix
+
+  def __reMapLabels__(self, labels, originalLabels, remap):
+    """
+      Applies a cluster remapping to the labels of all the samples at once; outliers (negative labels) are kept.
+      Every other label must be remapped, an error is raised otherwise.
+      @In, labels, np.array, labels of each sample at the current time step
+      @In, originalLabels, np.array, labels of each sample as assigned by the engine, before any remapping
+      @In, remap, dict, remapping relation between the current time step cluster and the previous time step
+      @Out, labels, np.array, remapped labels
+    """
+    labels = np.asarray(labels)
+    originalLabels = np.asarray(originalLabels)
+    mask = labels >= 0
+    missing = np.setdiff1d(originalLabels[mask], list(remap.keys()))
+    if len(missing):
+      self.raiseAnError(ValueError, 'No remapping found for the cluster labels {}!'.format(missing.tolist()))
+    lookup = np.zeros(max(remap.keys())+1, dtype=labels.dtype)
+    lookup[list(remap.keys())] = list(remap.values())
+    labels[mask] = lookup[originalLabels[mask]]
+    return labels
+
   def __reMapCluster__(self,t,dataCenter,dataCenterIndex):
     """
       Computes the remapping relationship between the current time step cluster and the previous time step
@@ -1197,10 +1281,7 @@ class temporalSciKitLearn(unSupervisedLearning):
     N1 = dataCenter[t-1].shape[0]
     N2 = dataCenter[t].shape[0]
 
-    dMatrix = np.zeros(shape=(N1,N2))
-    for n1 in range(N1):
-      for n2 in range(N2):
-        dMatrix[n1,n2] = self.__computeDist__(t,n1,n2,dataCenter,'DistanceWithDecay')
+    dMatrix = self.__computeDistMatrix__(t,dataCenter)
     _, mapping = self.__localReMap__(dMatrix, (list(range(N1)), list(range(N2))))
 
     remap = {}
@@ -1226,42 +1307,18 @@ class temporalSciKitLearn(unSupervisedLearning):
   def __localReMap__(self, dMatrix,loc):
     """
       Method to return the mapping based on distance stored in dMatrix, the returned mapping shall minimize the global sum of distance
-      This function is recursively called to find the global minimum, so is computationally expensive --- FIXME
+      This is a linear assignment problem, solved with the Hungarian algorithm
       @In, dMatrix, array, shape = (no_clusterAtPreviousTimeStep, no_clusterAtCurrentTimeStep)
       @In, loc, tuple, the first element is the cluster indeces for previous time step and the second one is for the current time step
       @Out, sumDist, float, global sum of distance
       @Out, localReMap, list, remapping relation between the row and column identifier of dMatrix
     """
-    if len(loc[0]) == 1:
-      sumDist, localReMap = np.inf, -1
-      n1 = loc[0][0]
-      for n2 in loc[1]:
-        if dMatrix[n1,n2] < sumDist:
-          sumDist = dMatrix[n1,n2]
-          localReMap = n2
-      return sumDist, [(n1,localReMap)]
-    elif len(loc[1]) == 1:
-      sumDist, localReMap = np.inf, -1
-      n2 = loc[1][0]
-      for n1 in loc[0]:
-        if dMatrix[n1,n2] < sumDist:
-          sumDist = dMatrix[n1,n2]
-          localReMap = n1
-      return sumDist, [(localReMap,n2)]
-    else:
-      sumDist, i1, i2, localReMap = np.inf, -1, -1, []
-      n1 = loc[0][0]
-      temp1 = copy.deepcopy(loc[0])
-      temp1.remove(n1)
-      for n2 in loc[1]:
-        temp2 = copy.deepcopy(loc[1])
-        temp2.remove(n2)
-        d_temp, l = self.__localReMap__(dMatrix, (temp1,temp2))
-        if dMatrix[n1,n2] + d_temp < sumDist:
-          sumDist = dMatrix[n1,n2] + d_temp
-          i1, i2, localReMap = n1, n2, l
-      localReMap.append((i1,i2))
-      return sumDist, localReMap
+    rows, cols = np.asarray(loc[0]), np.asarray(loc[1])
+    subMatrix = dMatrix[np.ix_(rows, cols)]
+    i1, i2 = linear_sum_assignment(subMatrix)
+    sumDist = subMatrix[i1, i2].sum()
+    localReMap = list(zip(rows[i1], cols[i2]))
+    return sumDist, localReMap
 
   def __evaluateLocal__(self, featureVals):
     """
@@ -0,0 +1,181 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Persistent on-disk memoization of model evaluations.
+  Evaluations are keyed by the identity and state of the model and the values of the sampled variables,
+  so that identical points are never evaluated twice, across steps and across runs.
+"""
+#External Modules------------------------------------------------------------------------------------
+import os
+import hashlib
+import shelve
+import numpy as np
+#External Modules End--------------------------------------------------------------------------------
+
+# ROM initialization options that do not affect the evaluations
+_IGNOREDOPTIONS = ('paramInput', 'NumThreads', 'name')
+
+def _hashValue(digest, value):
+  """
+    Adds a (possibly nested) value to a hash.
+    Objects that are not containers, arrays or scalars only contribute their type.
+    @ In, digest, hashlib hash object, the hash to update
+    @ In, value, object, the value to add
+    @ Out, None
+  """
+  if isinstance(value, dict):
+    digest.update('dict{}'.format(len(value)).encode())
+    for key in sorted(value, key=str):
+      digest.update(repr(key).encode())
+      _hashValue(digest, value[key])
+  elif isinstance(value, (list, tuple)):
+    digest.update('list{}'.format(len(value)).encode())
+    for item in value:
+      _hashValue(digest, item)
+  elif isinstance(value, (np.ndarray, np.generic, int, float, complex)):
+    value = np.atleast_1d(value)
+    digest.update(str(value.shape).encode())
+    if value.dtype.kind in 'biufc':
+      # numeric values: hash the exact binary representation (float64, so 1 and 1.0 agree)
+      value = value.astype(np.complex128 if value.dtype.kind == 'c' else np.float64)
+      digest.update(np.ascontiguousarray(value).tobytes())
+    else:
+      _hashValue(digest, value.tolist())
+  elif isinstance(value, (str, bytes, bool)) or value is None:
+    digest.update(repr(value).encode())
+  else:
+    digest.update(type(value).__name__.encode())
+
+def _hashFile(digest, fileName, content=True):
+  """
+    Adds a file to a hash.
+    @ In, digest, hashlib hash object, the hash to update
+    @ In, fileName, str, path of the file
+    @ In, content, bool, optional, if True the content of the file is hashed, otherwise its size and modification time
+    @ Out, None
+  """
+  digest.update(fileName.encode())
+  if not os.path.isfile(fileName):
+    return
+  if not content:
+    stat = os.stat(fileName)
+    digest.update('{}|{}'.format(stat.st_size, stat.st_mtime_ns).encode())
+    return
+  with open(fileName, 'rb') as f:
+    for block in iter(lambda: f.read(1 << 20), b''):
+      digest.update(block)
+
+class EvaluationCache(object):
+  """
+    On-disk dictionary of model evaluations, keyed by model identity and state and sampled variables.
+  """
+  def __init__(self, fileName):
+    """
+      Constructor; opens (or creates) the cache on disk.
+      @ In, fileName, str, path of the cache file
+      @ Out, None
+    """
+    directory = os.path.dirname(fileName)
+    if directory and not os.path.isdir(directory):
+      os.makedirs(directory)
+    self.fileName = fileName
+    self._shelf = shelve.open(fileName, flag='c')
+    self.hits = 0     # number of evaluations served from the cache
+    self.stored = 0   # number of evaluations added to the cache
+
+  def __len__(self):
+    """
+      Number of evaluations in the cache.
+      @ In, None
+      @ Out, len, int, number of entries
+    """
+    return len(self._shelf)
+
+  @staticmethod
+  def makeKey(model, sampledVars, fingerprint=''):
+    """
+      Builds the hash identifying an evaluation.
+      @ In, model, Models.Model, model performing the evaluation
+      @ In, sampledVars, dict, values of the sampled variables {var: value}
+      @ In, fingerprint, str, optional, hash of the model state, as obtained from modelFingerprint
+      @ Out, key, str, hexadecimal digest
+    """
+    digest = hashlib.sha1()
+    digest.update('{}|{}|{}|{}'.format(model.type, getattr(model, 'subType', ''), model.name, fingerprint).encode())
+    for var in sorted(sampledVars):
+      digest.update(var.encode())
+      _hashValue(digest, np.atleast_1d(sampledVars[var]))
+    return digest.hexdigest()
+
+  @staticmethod
+  def modelFingerprint(model, inputs=()):
+    """
+      Builds the hash of the state of a model its evaluations depend on, besides the sampled variables:
+      the training data and settings of a ROM, the module of an ExternalModel, the executable of a Code,
+      and the input files of the step. Evaluations of a model whose state changed are then not reused.
+      @ In, model, Models.Model, model performing the evaluations
+      @ In, inputs, list, optional, inputs of the step (only the Files are considered)
+      @ Out, fingerprint, str, hexadecimal digest
+    """
+    digest = hashlib.sha1()
+    trainingSet = getattr(model, 'trainingSet', None)
+    if trainingSet is not None:
+      _hashValue(digest, trainingSet)
+    options = getattr(model, 'initializationOptionDict', None)
+    if options is not None:
+      _hashValue(digest, dict((key, val) for key, val in options.items() if key not in _IGNOREDOPTIONS))
+    module = getattr(getattr(model, 'sim', None), '__file__', None)
+    if module is not None:
+      _hashFile(digest, module)
+    executable = getattr(model, 'executable', '')
+    if executable:
+      # executables can be large, their modification time is enough
+      _hashFile(digest, executable, content=False)
+    for inp in inputs:
+      if hasattr(inp, 'getAbsFile'):
+        _hashFile(digest, inp.getAbsFile())
+    return digest.hexdigest()
+
+  def fetch(self, key):
+    """
+      Retrieves the outputs of an evaluation, if stored.
+      @ In, key, str, evaluation hash as obtained from makeKey
+      @ Out, outputs, dict, outputs of the stored evaluation {var: np.array} (or None if not in cache)
+    """
+    outputs = self._shelf.get(key, None)
+    if outputs is not None:
+      self.hits += 1
+    return outputs
+
+  def store(self, key, outputs):
+    """
+      Adds the outputs of an evaluation to the cache.
+      @ In, key, str, evaluation hash as obtained from makeKey
+      @ In, outputs, dict, outputs of the evaluation {var: value}
+      @ Out, None
+    """
+    if key in self._shelf:
+      return
+    self._shelf[key] = dict((var, np.atleast_1d(value)) for var, value in outputs.items())
+    self.stored += 1
+
+  def close(self):
+    """
+      Flushes the cache to disk and closes it.
+      @ In, None
+      @ Out, None
+    """
+    if self._shelf is not None:
+      self._shelf.close()
+      self._shelf = None
@@ -23,6 +23,7 @@ import functools
 import copy
 import scipy
 from scipy import interpolate, stats, integrate
+from scipy.sparse import linalg as sparseLinalg
 import numpy as np
 import six
 
@@ -125,15 +126,9 @@ def countBins(sortedData, binBoundaries):
     @ In, binBoundaries, list or np.array, the bin boundaries
     @ Out, ret, list, the list containing the number of bins
   """
-  binIndex = 0
-  sortedIndex = 0
-  ret = [0]*(len(binBoundaries)+1)
-  while sortedIndex < len(sortedData):
-    while not binIndex >= len(binBoundaries) and \
-          sortedData[sortedIndex] > binBoundaries[binIndex]:
-      binIndex += 1
-    ret[binIndex] += 1
-    sortedIndex += 1
+  # each item falls in the bin of the first boundary it does not exceed
+  binIndices = np.searchsorted(np.asarray(binBoundaries), np.asarray(sortedData), side='left')
+  ret = np.bincount(binIndices, minlength=len(binBoundaries)+1).tolist()
   return ret
 
 def log2(x):
@@ -482,16 +477,33 @@ def compareFloats(f1,f2,tol=1e-6):
   diff = relativeDiff(f1,f2)
   return diff < tol
 
-def NDInArray(findIn,val,tol=1e-12):
+def NDInArray(findIn,val,tol=1e-12,tree=None):
   """
     checks a numpy array of numpy arrays for a near match, then returns info.
     @ In, findIn, np.array, numpy array of numpy arrays (both arrays can be any length)
     @ In, val, tuple/list/numpy array, entry to look for in findIn
     @ In, tol, float, optional, tolerance to check match within
+    @ In, tree, scipy.spatial.cKDTree, optional, tree built on findIn (i.e. spatial.cKDTree(findIn)), to be
+                provided when searching repeatedly in the same array: only the entries close to val are checked
     @ Out, (bool,idx,looking) -> (found/not found, index where found or None, findIn entry or None)
   """
   if len(findIn)<1:
     return False,None,None
+  if tree is not None and tol < 1.0:
+    val = np.asarray(val, dtype=float)
+    # a match differs from val by less than tol*|val_i| in each (nonzero) component, and exactly
+    # matches the zero components, hence it lies within the infinity-norm ball of radius tol*max|val|
+    candidates = sorted(tree.query_ball_point(val, tol*np.max(np.abs(val)), p=np.inf))
+    if len(candidates) < 1:
+      return False,None,None
+    looking = np.asarray(findIn)[candidates]
+    #div 0 error
+    den = np.where(val != 0.0, val, np.where(looking != 0.0, looking, 1.0))
+    matches = np.all(abs((looking - val) / den)<tol, axis=1)
+    if not matches.any():
+      return False,None,None
+    idx = candidates[int(np.argmax(matches))]
+    return True,idx,findIn[idx]
   targ = []
   found = False
   for idx,looking in enumerate(findIn):
@@ -614,6 +626,35 @@ def computeTruncatedSingularValueDecomposition(X, truncationRank):
   s = s[:rank]
   return U, s, V
 
+def computeRandomizedSingularValueDecomposition(X, truncationRank, oversampling=10, powerIterations=2, seed=0):
+  """
+    Compute a truncated Singular Value Decomposition with a randomized range finder
+    (Halko, Martinsson, Tropp, SIAM Review 53.2 (2011), 217-288). Only products of X with thin
+    matrices are needed, so X can also be a linear operator that is never assembled.
+    @ In, X, numpy.ndarray or scipy.sparse.linalg.LinearOperator, the 2D matrix on which the SVD needs to be performed
+    @ In, truncationRank, int, the truncation rank (>= 1)
+    @ In, oversampling, int, optional, number of additional random directions used to sample the range of X
+    @ In, powerIterations, int, optional, number of power iterations, improving the accuracy for slowly decaying singular values
+    @ In, seed, int, optional, seed of the random directions
+    @ Out, (U, s, V), tuple of numpy.ndarray, (left-singular vectors matrix, singular values, right-singular vectors matrix)
+  """
+  operator = sparseLinalg.aslinearoperator(X)
+  rows, cols = operator.shape
+  rank = min(int(truncationRank), rows, cols)
+  samples = min(rank + oversampling, rows, cols)
+  randomDirections = np.random.RandomState(seed).standard_normal((cols, samples))
+  # orthonormal basis of the range of X
+  Q = np.linalg.qr(operator.matmat(randomDirections))[0]
+  for _ in range(powerIterations):
+    Q = np.linalg.qr(operator.H.matmat(Q))[0]
+    Q = np.linalg.qr(operator.matmat(Q))[0]
+  # SVD of the projection of X on the basis
+  Ub, s, V = np.linalg.svd(operator.H.matmat(Q).conj().T, full_matrices=False)
+  U = Q.dot(Ub[:, :rank])
+  V = V[:rank, :].conj().T
+  s = s[:rank]
+  return U, s, V
+
 def computeEigenvaluesAndVectorsFromLowRankOperator(lowOperator, Y, U, s, V, exactModes=True):
   """
     Compute the eigenvalues and eigenvectors of the high-dim operator
@@ -670,6 +711,48 @@ def trainEmpiricalFunction(signal, bins=None, minBins=None, weights=None):
   dist = stats.rv_histogram((counts, edges))
   return dist, (counts, edges)
 
+def evalEmpiricalCDF(signals, minBins=None):
+  """
+    Evaluates the empirical CDF of each signal (along the last axis) at its own values, as the
+    histogram distribution of trainEmpiricalFunction would, but for all the signals at once.
+    @ In, signals, np.array(float), signals to evaluate, shape (numPoints,) or (numSignals, numPoints)
+    @ In, minBins, int, optional, minimum number of bins to use
+    @ Out, cdf, np.array(float), CDF of each signal at each of its values, same shape as signals
+  """
+  data = np.atleast_2d(signals)
+  numSignals, numPoints = data.shape
+  rows = np.arange(numSignals)[:, np.newaxis]
+  # number of bins from the Freedman Diaconis rule, or the square root rule when the IQR vanishes
+  iqr = np.percentile(data, 75, axis=1) - np.percentile(data, 25, axis=1)
+  low = data.min(axis=1)
+  high = data.max(axis=1)
+  with np.errstate(divide='ignore', invalid='ignore'):
+    numBins = np.ceil((high - low) / (2.0 * iqr / np.cbrt(numPoints)))
+  numBins = np.where(iqr > 0.0, numBins, np.ceil(np.sqrt(numPoints))).astype(int)
+  if minBins is not None:
+    numBins = np.maximum(numBins, minBins)
+  # as in np.histogram, constant signals get a unit-wide range
+  flat = low == high
+  low = np.where(flat, low - 0.5, low)
+  high = np.where(flat, high + 0.5, high)
+  # uniform bin edges, padded with the upper limit past the last bin of each signal
+  steps = np.arange(numBins.max() + 1)
+  edges = low[:, np.newaxis] + steps * ((high - low) / numBins)[:, np.newaxis]
+  edges = np.where(steps >= numBins[:, np.newaxis], high[:, np.newaxis], edges)
+  # bin of each value, with the last bin closed on the right
+  bins = ((data - low[:, np.newaxis]) / (high - low)[:, np.newaxis] * numBins[:, np.newaxis]).astype(int)
+  bins = np.minimum(bins, numBins[:, np.newaxis] - 1)
+  bins -= data < edges[rows, bins]
+  bins += (data >= edges[rows, bins + 1]) & (bins != numBins[:, np.newaxis] - 1)
+  counts = np.bincount((rows * len(steps) + bins).ravel(), minlength=numSignals * len(steps))
+  counts = counts.reshape(numSignals, len(steps))
+  # piecewise linear CDF through the bin edges
+  cdfEdges = np.zeros((numSignals, len(steps)))
+  cdfEdges[:, 1:] = np.cumsum(counts[:, :-1], axis=1) / float(numPoints)
+  fraction = (data - edges[rows, bins]) / (edges[rows, bins + 1] - edges[rows, bins])
+  cdf = cdfEdges[rows, bins] + fraction * (cdfEdges[rows, bins + 1] - cdfEdges[rows, bins])
+  return cdf.reshape(np.shape(signals))
+
 def convertSinCosToSinPhase(A, B):
   """
     Given coefficients A, B for the equation A*sin(kt) = B*cos(kt), returns
@@ -59,6 +59,34 @@ class BoxMullerGenerator:
       val = self.queue[engine].pop()
     return val
 
+  def generateMany(self, size, engine=None):
+    """
+      Yields many normally-distributed pseudorandom values at once, in the same sequence as repeated calls to generate
+      @ In, size, int, number of values to generate
+      @ In, engine, instance, optional, random number generator
+      @ Out, vals, np.array(float), random values
+    """
+    vals = np.empty(size)
+    with self.__queueLock:
+      queue = self.queue[engine]
+      # first use up the values left over from previous calls
+      numQueued = min(len(queue), size)
+      for i in range(numQueued):
+        vals[i] = queue.pop()
+      remaining = size - numQueued
+      if remaining > 0:
+        # draw the uniforms for all the pairs at once, (u1, u2) for each pair
+        numPairs = (remaining + 1) // 2
+        uniform = random(2, numPairs, keepMatrix=True, engine=engine)
+        radius = np.sqrt(-2.*np.log(uniform[:, 0]))
+        angle = 2.*np.pi*uniform[:, 1]
+        # generate pops (z1, z2) from the end of the queue, so z2 comes first
+        pairs = np.column_stack((radius*np.sin(angle), radius*np.cos(angle))).ravel()
+        vals[numQueued:] = pairs[:remaining]
+        if remaining % 2:
+          queue.append(pairs[-1])
+    return vals
+
   def createSamples(self,engine=None):
     """
       Sample calculator.  Because Box Muller does batches of 2, add them to a queue.
@@ -144,10 +172,9 @@ def random(dim=1, samples=1, keepMatrix=False, engine=None):
   if isinstance(engine, np.random.RandomState):
     vals = engine.rand(samples,dim)
   elif isinstance(engine, findCrowModule('randomENG').RandomClass):
-    vals = np.zeros([samples, dim])
-    for i in range(len(vals)):
-      for j in range(len(vals[0])):
-        vals[i][j] = engine.random()
+    # crow only provides one value per call, so fill the matrix row by row in a single pass
+    vals = np.fromiter((engine.random() for _ in range(samples*dim)), dtype=float, count=samples*dim)
+    vals.shape = (samples, dim)
   # regardless of stoch env
   if keepMatrix:
     return vals
@@ -169,9 +196,7 @@ def randomNormal(size=(1,), keepMatrix=False, engine=None):
   if isinstance(engine, np.random.RandomState):
     vals = engine.randn(*size)
   elif isinstance(engine, findCrowModule('randomENG').RandomClass):
-    vals = np.zeros(np.prod(size))
-    for i in range(len(vals)):
-      vals[i] = boxMullerGen.generate(engine=engine)
+    vals = boxMullerGen.generateMany(int(np.prod(size)), engine=engine)
     vals.shape = size
   if keepMatrix:
     return vals
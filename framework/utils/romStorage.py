@@ -0,0 +1,429 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  Memory-mappable serialization of trained ROMs.
+  The object is pickled (protocol 5) with its large contiguous arrays kept out-of-band; these are
+  written to an aligned section of the file and loaded back through a (copy-on-write) memory map,
+  so that loading does not read the numeric payload and processes loading the same file share pages.
+  Collections (e.g. ROMCollection) are pickled separately, and so are the sub-objects they hold
+  (e.g. the segment ROMs), which are only unpickled the first time they are used.
+
+  File layout:
+    header, MAGIC + (version, metadata offset, metadata size) as uint64
+    buffers, each one aligned to ALIGNMENT bytes (both the array payloads and the sub-object pickles)
+    metadata, pickled dict with the position of the buffers and the description of the pickles
+"""
+#External Modules------------------------------------------------------------------------------------
+import os
+import io
+import mmap
+import copy
+import struct
+import pickle
+import contextlib
+import cloudpickle
+#External Modules End--------------------------------------------------------------------------------
+
+# file extension selecting this format when a ROM is written by an IOStep
+EXTENSION = 'mmrom'
+MAGIC = b'RAVENROM'
+VERSION = 1
+ALIGNMENT = 64
+_HEADER = struct.Struct('<8sQQQ')
+# buffers smaller than this are kept in the pickle stream rather than in the mapped section
+_MINOUTOFBAND = 4096
+
+# storages opened in this process {(path, mtime, size): _Storage}
+_storages = {}
+# if True, unloaded sub-objects are pickled by value instead of by reference to their file
+_selfContained = False
+# special names looked up on instances by Python protocols (copy, pickle, numpy, ...); these are not
+# forwarded by LazyObject, so that such a lookup does not trigger the loading
+_PROTOCOLNAMES = frozenset(['__deepcopy__', '__copy__', '__reduce__', '__reduce_ex__', '__getstate__',
+                            '__setstate__', '__getnewargs__', '__getnewargs_ex__', '__getinitargs__',
+                            '__dict__', '__class__', '__slots__', '__weakref__', '__len__', '__iter__',
+                            '__length_hint__', '__array__', '__array_interface__', '__array_struct__',
+                            '__array_priority__', '__array_ufunc__', '__array_function__', '__fspath__'])
+
+def isRomStorage(fileName):
+  """
+    Checks if a file has been written by this module.
+    @ In, fileName, str, path of the file
+    @ Out, isRomStorage, bool, True if the file is a memory-mappable ROM file
+  """
+  with open(fileName, 'rb') as f:
+    return f.read(len(MAGIC)) == MAGIC
+
+def dump(obj, fileName, collectionTypes=(), subObjectTypes=()):
+  """
+    Serializes an object to file.
+    @ In, obj, object, object to serialize (e.g. a trained ROM)
+    @ In, fileName, str, path of the file to write
+    @ In, collectionTypes, tuple(type), optional, instances of these types are pickled separately
+    @ In, subObjectTypes, tuple(type), optional, instances of these types held by an instance of
+      collectionTypes are pickled separately and loaded lazily
+    @ Out, None
+  """
+  # written aside and then moved, since processes may still be mapping the file being replaced
+  tmpName = fileName + '.tmp'
+  with open(tmpName, 'wb') as f, selfContained():
+    writer = _Writer(f, tuple(collectionTypes), tuple(subObjectTypes))
+    writer.write(obj)
+  os.replace(tmpName, fileName)
+
+def load(fileName):
+  """
+    Deserializes an object from a file written by "dump". The numeric payloads are memory mapped.
+    @ In, fileName, str, path of the file to read
+    @ Out, obj, object, deserialized object
+  """
+  return _openStorage(fileName).loadPickle(0, {})
+
+@contextlib.contextmanager
+def selfContained():
+  """
+    Context in which the lazily loaded sub-objects are pickled by value (e.g. to write them in a
+    regular pickle file), instead of by reference to the file they are loaded from.
+    @ In, None
+    @ Out, None
+  """
+  global _selfContained
+  previous = _selfContained
+  _selfContained = True
+  try:
+    yield
+  finally:
+    _selfContained = previous
+
+class LazyObject(object):
+  """
+    Stand-in for a sub-object of a memory-mappable ROM file, unpickled the first time it is used.
+  """
+  def __init__(self, storage, index, loaded):
+    """
+      Constructor.
+      @ In, storage, _Storage, opened file
+      @ In, index, int, index of the pickle of the sub-object in the file
+      @ In, loaded, dict, sub-objects already resolved in the same loading of the file
+      @ Out, None
+    """
+    object.__setattr__(self, '_lazyStorage', storage)
+    object.__setattr__(self, '_lazyIndex', index)
+    object.__setattr__(self, '_lazyLoaded', loaded)
+    object.__setattr__(self, '_lazyObject', None)
+    object.__setattr__(self, '_lazyParams', [])
+
+  def _load(self):
+    """
+      Unpickles the sub-object, if not done yet.
+      @ In, None
+      @ Out, obj, object, the sub-object
+    """
+    obj = object.__getattribute__(self, '_lazyObject')
+    if obj is None:
+      obj = self._lazyStorage.loadPickle(self._lazyIndex, self._lazyLoaded)
+      object.__setattr__(self, '_lazyObject', obj)
+      for params in self._lazyParams:
+        obj.setAdditionalParams(params)
+      object.__setattr__(self, '_lazyParams', [])
+    return obj
+
+  def setAdditionalParams(self, params):
+    """
+      Sets additional parameters (e.g. when deserializing); these are stored until the sub-object is
+      actually loaded, so that it is not loaded just to receive them.
+      @ In, params, dict, parameters to set
+      @ Out, None
+    """
+    obj = object.__getattribute__(self, '_lazyObject')
+    if obj is None:
+      self._lazyParams.append(copy.copy(params))
+    else:
+      obj.setAdditionalParams(params)
+
+  def __getattr__(self, name):
+    """
+      Forwards the attribute access to the sub-object.
+      @ In, name, str, attribute name
+      @ Out, attr, object, attribute of the sub-object
+    """
+    if name.startswith('_lazy') or name in _PROTOCOLNAMES:
+      raise AttributeError(name)
+    return getattr(self._load(), name)
+
+  def __setattr__(self, name, value):
+    """
+      Forwards the attribute setting to the sub-object.
+      @ In, name, str, attribute name
+      @ In, value, object, attribute value
+      @ Out, None
+    """
+    setattr(self._load(), name, value)
+
+  def __reduce__(self):
+    """
+      Pickles (or deep copies) the sub-object: by reference to its file if not loaded yet, so that
+      e.g. parallel workers map the same file rather than receiving its content; by value otherwise.
+      @ In, None
+      @ Out, reduce, tuple, pickling instructions
+    """
+    obj = object.__getattribute__(self, '_lazyObject')
+    if obj is None and not _selfContained:
+      storage = self._lazyStorage
+      return _openLazy, (storage.fileName, self._lazyIndex, self._lazyParams)
+    return _identity, (self._load(),)
+
+def _identity(obj):
+  """
+    Returns its argument (used to unpickle a LazyObject as the object it stands for).
+    @ In, obj, object, any object
+    @ Out, obj, object, the same object
+  """
+  return obj
+
+def _openLazy(fileName, index, params):
+  """
+    Recreates a LazyObject from the file it belongs to (used to unpickle a LazyObject).
+    @ In, fileName, str, path of the file
+    @ In, index, int, index of the pickle of the sub-object in the file
+    @ In, params, list(dict), additional parameters to set once loaded
+    @ Out, lazy, LazyObject, the sub-object stand-in
+  """
+  lazy = LazyObject(_openStorage(fileName), index, {})
+  for p in params:
+    lazy.setAdditionalParams(p)
+  return lazy
+
+def _openStorage(fileName):
+  """
+    Opens (or retrieves, if already opened in this process) a memory-mappable ROM file.
+    @ In, fileName, str, path of the file
+    @ Out, storage, _Storage, opened file
+  """
+  fileName = os.path.abspath(fileName)
+  stat = os.stat(fileName)
+  key = (fileName, stat.st_mtime_ns, stat.st_size)
+  storage = _storages.get(key)
+  if storage is None:
+    storage = _Storage(fileName)
+    _storages[key] = storage
+  return storage
+
+class _Storage(object):
+  """
+    Opened memory-mappable ROM file.
+  """
+  def __init__(self, fileName):
+    """
+      Constructor; maps the file and reads its metadata.
+      @ In, fileName, str, path of the file
+      @ Out, None
+    """
+    self.fileName = fileName
+    with open(fileName, 'rb') as f:
+      magic, version, metaOffset, metaSize = _HEADER.unpack(f.read(_HEADER.size))
+      if magic != MAGIC:
+        raise IOError('File "{}" is not a memory-mappable ROM file!'.format(fileName))
+      if version > VERSION:
+        raise IOError('File "{}" was written by a newer version of RAVEN (format {})!'.format(fileName, version))
+      # copy-on-write: pages are shared among processes until (if ever) written
+      self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+    self._view = memoryview(self._map)
+    meta = pickle.loads(self._view[metaOffset:metaOffset + metaSize])
+    self._buffers = meta['buffers']
+    self._pickles = meta['pickles']
+
+  def _buffer(self, index):
+    """
+      Returns a view on one of the buffers of the file.
+      @ In, index, int, index of the buffer
+      @ Out, buffer, memoryview, buffer content
+    """
+    offset, size = self._buffers[index]
+    return self._view[offset:offset + size]
+
+  def loadPickle(self, index, loaded):
+    """
+      Unpickles one of the pickles in the file.
+      @ In, index, int, index of the pickle
+      @ In, loaded, dict, sub-objects already resolved in the same loading of the file, so that
+        objects referenced several times are only created once {pickle index: object}
+      @ Out, obj, object, unpickled object
+    """
+    blob, buffers = self._pickles[index][1:]
+    unpickler = _Unpickler(self, loaded, io.BytesIO(self._buffer(blob)), buffers=[self._buffer(b) for b in buffers])
+    return unpickler.load()
+
+  def subObject(self, pid, loaded):
+    """
+      Resolves a reference to a sub-object.
+      @ In, pid, int, index of the pickle of the sub-object
+      @ In, loaded, dict, sub-objects already resolved in the same loading of the file
+      @ Out, obj, object, sub-object (or its stand-in if it is loaded lazily)
+    """
+    obj = loaded.get(pid)
+    if obj is None:
+      if self._pickles[pid][0] == 'lazy':
+        obj = LazyObject(self, pid, loaded)
+      else:
+        obj = self.loadPickle(pid, loaded)
+      loaded[pid] = obj
+    return obj
+
+class _Unpickler(pickle.Unpickler):
+  """
+    Unpickler resolving the references to sub-objects.
+  """
+  def __init__(self, storage, loaded, *args, **kwargs):
+    """
+      Constructor.
+      @ In, storage, _Storage, opened file
+      @ In, loaded, dict, sub-objects already resolved in the same loading of the file
+      @ In, args, list, arguments of pickle.Unpickler
+      @ In, kwargs, dict, keyword arguments of pickle.Unpickler
+      @ Out, None
+    """
+    super().__init__(*args, **kwargs)
+    self._storage = storage
+    self._loaded = loaded
+
+  def persistent_load(self, pid):
+    """
+      Resolves a reference to a sub-object.
+      @ In, pid, int, index of the pickle of the sub-object
+      @ Out, obj, object, sub-object
+    """
+    return self._storage.subObject(pid, self._loaded)
+
+class _Writer(object):
+  """
+    Writes an object to a memory-mappable ROM file.
+  """
+  def __init__(self, fileObj, collectionTypes, subObjectTypes):
+    """
+      Constructor.
+      @ In, fileObj, file, file opened for binary writing
+      @ In, collectionTypes, tuple(type), types of the objects to pickle separately
+      @ In, subObjectTypes, tuple(type), types of the objects held by collections to load lazily
+      @ Out, None
+    """
+    self._file = fileObj
+    self.collectionTypes = collectionTypes
+    self.subObjectTypes = subObjectTypes
+    self._buffers = []  # (offset, size) of each buffer
+    self._pickles = []  # (kind, blob buffer index, [payload buffer indices]) of each pickle
+    self._memo = {}     # id(obj) -> index of its pickle
+
+  def write(self, obj):
+    """
+      Writes the object and the metadata to file.
+      @ In, obj, object, object to serialize
+      @ Out, None
+    """
+    self._file.write(_HEADER.pack(MAGIC, VERSION, 0, 0))
+    self._pickles.append(None)
+    self._pickles[0] = self._dumpPickle('root', obj)
+    meta = pickle.dumps({'buffers': self._buffers, 'pickles': self._pickles}, protocol=pickle.HIGHEST_PROTOCOL)
+    metaOffset = self._file.tell()
+    self._file.write(meta)
+    self._file.seek(0)
+    self._file.write(_HEADER.pack(MAGIC, VERSION, metaOffset, len(meta)))
+
+  def addBuffer(self, data):
+    """
+      Appends a buffer, aligned, to the file.
+      @ In, data, bytes-like, buffer content
+      @ Out, index, int, index of the buffer
+    """
+    offset = self._file.tell()
+    padding = -offset % ALIGNMENT
+    if padding:
+      self._file.write(b'\0' * padding)
+      offset += padding
+    self._file.write(data)
+    self._buffers.append((offset, memoryview(data).nbytes))
+    return len(self._buffers) - 1
+
+  def addSubObject(self, obj, lazy):
+    """
+      Pickles a sub-object separately (once, even if referenced several times).
+      @ In, obj, object, sub-object
+      @ In, lazy, bool, if True the sub-object is loaded the first time it is used
+      @ Out, index, int, index of the pickle of the sub-object
+    """
+    index = self._memo.get(id(obj))
+    if index is None:
+      index = len(self._pickles)
+      self._memo[id(obj)] = index
+      self._pickles.append(None)
+      self._pickles[index] = self._dumpPickle('lazy' if lazy else 'eager', obj)
+    return index
+
+  def _dumpPickle(self, kind, obj):
+    """
+      Pickles an object, with its large buffers out-of-band.
+      @ In, kind, str, how the pickle is loaded (root, eager or lazy)
+      @ In, obj, object, object to pickle
+      @ Out, entry, tuple, (kind, blob buffer index, [payload buffer indices])
+    """
+    buffers = []
+    def bufferCallback(pickleBuffer):
+      """
+        Stores the large buffers out-of-band.
+        @ In, pickleBuffer, pickle.PickleBuffer, buffer to store
+        @ Out, inBand, bool, True if the buffer should rather be kept in the pickle stream
+      """
+      raw = pickleBuffer.raw()
+      if raw.nbytes < _MINOUTOFBAND:
+        return True
+      buffers.append(self.addBuffer(raw))
+      return False
+    stream = io.BytesIO()
+    _Pickler(self, obj, stream, protocol=5, buffer_callback=bufferCallback).dump(obj)
+    blob = self.addBuffer(stream.getbuffer())
+    return kind, blob, buffers
+
+class _Pickler(cloudpickle.Pickler):
+  """
+    Pickler storing the sub-objects separately.
+  """
+  def __init__(self, writer, root, *args, **kwargs):
+    """
+      Constructor.
+      @ In, writer, _Writer, file writer
+      @ In, root, object, object being pickled
+      @ In, args, list, arguments of cloudpickle.Pickler
+      @ In, kwargs, dict, keyword arguments of cloudpickle.Pickler
+      @ Out, None
+    """
+    super().__init__(*args, **kwargs)
+    self._writer = writer
+    self._root = root
+    self._inCollection = isinstance(root, writer.collectionTypes)
+
+  def persistent_id(self, obj):
+    """
+      Identifies the sub-objects to pickle separately.
+      @ In, obj, object, object being pickled
+      @ Out, pid, int, index of the pickle of the sub-object (None to pickle obj as usual)
+    """
+    if isinstance(obj, LazyObject):
+      obj = obj._load()
+    if obj is self._root:
+      return None
+    if self._inCollection and isinstance(obj, self._writer.subObjectTypes):
+      return self._writer.addSubObject(obj, True)
+    if isinstance(obj, self._writer.collectionTypes):
+      return self._writer.addSubObject(obj, False)
+    return None
@@ -86,7 +86,11 @@ class ravenROMexternal(object):
     serializedROMlocation = os.path.abspath(binaryFileName)
     if not os.path.exists(serializedROMlocation):
       raise IOError('The serialized (binary) file has not been found in location "' + str(serializedROMlocation)+'" !')
-    self.rom = pickle.load(open(serializedROMlocation, mode='rb'))
+    from utils import romStorage
+    if romStorage.isRomStorage(serializedROMlocation):
+      self.rom = romStorage.load(serializedROMlocation)
+    else:
+      self.rom = pickle.load(open(serializedROMlocation, mode='rb'))
 
   def evaluate(self,request):
     """
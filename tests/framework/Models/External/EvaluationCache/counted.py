@@ -0,0 +1,34 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#***************************************
+#* Simple analytic test ExternalModule *
+#***************************************
+#
+# Linear model that also reports how many times it has been evaluated in this RAVEN run,
+# so that evaluations taken from an evaluation cache can be told apart.
+#
+import os
+import shutil
+
+# this module is loaded once per RAVEN run, before any step: start from an empty evaluation cache,
+# so that a previous run of the test does not serve the evaluations of the first step
+shutil.rmtree(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache'), ignore_errors=True)
+
+evaluations = 0
+
+def run(self,Input):
+  global evaluations
+  evaluations += 1
+  self.calls = evaluations
+  self.ans = self.y1 + 2.0 * self.y2
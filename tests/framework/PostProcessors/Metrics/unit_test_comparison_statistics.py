@@ -100,6 +100,40 @@ pdfCommonArea = Metrics.MetricUtilities._getPDFCommonArea(dist1, dist2)
 print("pdfCommonArea different",pdfCommonArea)
 assert 0.60 < pdfCommonArea < 0.62
 
+#Test exact integration of data against quadrature
+data1 = [float(i) for i in range(64)]
+data2 = ([float(i)*1.5 - 8.0 for i in range(64)], [1.0/64.0]*64)
+cdfAreaDifferenceExact = Metrics.MetricUtilities._getCDFAreaDifference(data1, data1, exact=True)
+print("cdfAreaDifference data same",cdfAreaDifferenceExact)
+assert -1e-8 < cdfAreaDifferenceExact < 1e-8
+
+pdfCommonArea = Metrics.MetricUtilities._getPDFCommonArea(data1, data1)
+pdfCommonAreaExact = Metrics.MetricUtilities._getPDFCommonArea(data1, data1, exact=True)
+print("pdfCommonArea data same",pdfCommonArea,pdfCommonAreaExact)
+assert abs(pdfCommonArea - pdfCommonAreaExact) < 1e-6 * pdfCommonArea
+
+cdfAreaDifference = Metrics.MetricUtilities._getCDFAreaDifference(data1, data2)
+cdfAreaDifferenceExact = Metrics.MetricUtilities._getCDFAreaDifference(data1, data2, exact=True)
+print("cdfAreaDifference data different",cdfAreaDifference,cdfAreaDifferenceExact)
+assert abs(cdfAreaDifference - cdfAreaDifferenceExact) < 1e-6 * cdfAreaDifference
+
+pdfCommonArea = Metrics.MetricUtilities._getPDFCommonArea(data1, data2)
+pdfCommonAreaExact = Metrics.MetricUtilities._getPDFCommonArea(data1, data2, exact=True)
+print("pdfCommonArea data different",pdfCommonArea,pdfCommonAreaExact)
+assert abs(pdfCommonArea - pdfCommonAreaExact) < 1e-6 * pdfCommonArea
+
+#Test several pairs at once
+pairs = [(data1, data1), (data1, data2), (dist1, dist2)]
+cdfAreaDifferences = Metrics.MetricUtilities._getCDFAreaDifferences(pairs, exact=True)
+print("cdfAreaDifferences",cdfAreaDifferences)
+assert len(cdfAreaDifferences) == 3
+assert cdfAreaDifferences[1] == cdfAreaDifferenceExact
+assert 0.99 < cdfAreaDifferences[2] < 1.01
+pdfCommonAreas = Metrics.MetricUtilities._getPDFCommonAreas(pairs)
+print("pdfCommonAreas",pdfCommonAreas)
+assert pdfCommonAreas[1] == pdfCommonArea
+assert 0.60 < pdfCommonAreas[2] < 0.62
+
 """
   <TestInfo>
     <name>framework.test_distributions</name>
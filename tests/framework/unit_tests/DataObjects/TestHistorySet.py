@@ -599,6 +599,29 @@ os.remove(csvname+'_1.csv')
 os.remove(csvname+'_2.csv')
 os.remove(csvname+'_3.csv')
 
+# to columnar
+## test writing to file
+colname = 'HistorySetUnitTest'
+data.write(colname,style='columnar')
+checkTrue('Wrote to columnar',os.path.isfile(colname+'.h5'))
+## read from columnar
+dataCol = DataObjects.HistorySet()
+dataCol.messageHandler = mh
+dataCol._readMoreXML(xml)
+dataCol.load(colname,style='columnar')
+for var in data.getVars():
+  if isinstance(data.getVarValues(var).item(0),(float,int)):
+    checkTrue('Columnar var {}'.format(var),(dataCol._data[var] - data._data[var]).sum()<1e-20) #necessary due to roundoff
+  else:
+    checkTrue('Columnar var {}'.format(var),bool((dataCol._data[var] == data._data[var]).prod()))
+## append realizations to the existing file
+data.write(colname,style='columnar',firstIndex=2)
+dataCol.reset()
+dataCol.load(colname,style='columnar')
+checkSame('Columnar appended size',len(dataCol),len(data)+2)
+checkRlz('Columnar appended rlz',dataCol.realization(index=len(data)),rlz2,skip=['Timelike','_indexMap'])
+os.remove(colname+'.h5')
+
 
 ######################################
 #        ACCESS USING GETTERS        #
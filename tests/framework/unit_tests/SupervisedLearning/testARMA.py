@@ -477,6 +477,16 @@ sig7=[0.39975177, -0.14531468,  0.13138866, -0.56565224,  0.06020252,
 for n in range(10):
   checkFloat('signal 7, evaluation ind{}'.format(n), signal7[n], sig7[n], tol=1e-7)
 
+# Test batched generation of many realizations at once
+## each realization takes the next block of random numbers, so the rows match successive single histories
+arma.setEngine(eng,seed=901017,count=0)
+batch=arma._generateARMASignal(testVal,numRealizations=3)
+checkSame('batch signal shape',batch.shape,(3,len(data)))
+arma.setEngine(eng,seed=901017,count=0)
+for r in range(3):
+  single=arma._generateARMASignal(testVal)
+  checkArray('batch signal realization {}'.format(r),batch[r],single,float,tol=1e-12)
+
 #################
 # TODO UNTESTED #
 #################
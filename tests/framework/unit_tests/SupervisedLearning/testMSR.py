@@ -0,0 +1,124 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the MSR class.
+  It can not be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import sys, os
+import copy
+import numpy as np
+
+frameworkDir = os.path.abspath(os.path.join(*([os.path.dirname(__file__)]+[os.pardir]*4+['framework'])))
+
+sys.path.append(frameworkDir)
+
+from utils.utils import find_crow
+find_crow(frameworkDir)
+
+import MessageHandler
+
+# message handler
+mh = MessageHandler.MessageHandler()
+mh.initialize({'verbosity':'debug', 'callerLength':10, 'tagLength':10})
+
+from SupervisedLearning import MSR
+
+print('Module undergoing testing:')
+print(MSR)
+print('')
+
+results = {"pass":0,"fail":0}
+
+def checkFloat(comment,value,expected,tol=1e-10,update=True):
+  """
+    This method is aimed to compare two floats given a certain tolerance
+    @ In, comment, string, a comment printed out if it fails
+    @ In, value, float, the value to compare
+    @ In, expected, float, the expected value
+    @ In, tol, float, optional, the tolerance
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if same
+  """
+  res = abs(value - expected) <= tol
+  if update:
+    if not res:
+      print("checking float",comment,'|',value,"!=",expected)
+      results["fail"] += 1
+    else:
+      results["pass"] += 1
+  return res
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+# two gaussian bumps, so that the Morse-Smale complex has several partitions
+np.random.seed(42)
+x = np.random.rand(200)
+y = np.random.rand(200)
+z = np.exp(-((x-0.25)**2+(y-0.25)**2)/0.02) + np.exp(-((x-0.75)**2+(y-0.75)**2)/0.02)
+trainingSet = {'x':x, 'y':y, 'z':z}
+points = np.array([[0.2, 0.3], [0.5, 0.5], [0.8, 0.7], [0.1, 0.9]])
+
+# the non-blended predictors (no <smooth/>) use the local model of the most likely partition only
+for predictor in ['kde', 'svm']:
+  msr = MSR.MSR(Features=['x','y'], Target=['z'], partitionPredictor=predictor, kernel='gaussian',
+                bandwidth='0.2', simplification='0.04')
+  msr.train(copy.deepcopy(trainingSet))
+  batch = msr.evaluate({'x':points[:,0], 'y':points[:,1]})['z']
+  checkTrue('{} batch size'.format(predictor), len(batch) == len(points))
+  # each point evaluated on its own gives the same result as in the batch
+  for i, point in enumerate(points):
+    single = msr.evaluate({'x':point[:1], 'y':point[1:]})['z']
+    checkFloat('{} single point {}'.format(predictor, i), single[0], batch[i])
+  # each prediction is the one of a single partition model
+  amsc = msr._MSR__amsc[0]
+  predictions = msr.__evaluateLocal__(points)['z']
+  local = np.array([amsc.Predict(points, key) for key in amsc.Partitions(msr.simplification).keys()])
+  for i in range(len(points)):
+    checkTrue('{} local model of point {}'.format(predictor, i), np.isclose(local[:,i], predictions[i], rtol=0., atol=1e-12).any())
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.test_MSR</name>
+    <author>agent</author>
+    <created>2026-10-19</created>
+    <classesTested>SupervisedLearning.MSR</classesTested>
+    <description>
+       This test performs Unit Tests for the MSR class, without blending of the partition predictions
+       It can not be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -338,6 +338,31 @@ for tg, target in enumerate(targets):
   checkArray(f'Signal {target} residual', res[:, tg], r[:, tg], float)
 
 
+###################
+#  Batch          #
+###################
+# segments of the same targets, fit together
+batchSignals = np.zeros((3, len(pivot), len(targets)))
+batchSignals[0] = signals
+batchSignals[1] = signals[:, ::-1]
+batchSignals[2] = 2 * signals - 1
+batchParams = fourier.characterizeBatch(batchSignals, pivot, targets, settings)
+checkSame('Batch number of segments', len(batchParams), 3)
+for s, segment in enumerate(batchSignals):
+  single = fourier.characterize(segment, pivot, targets, settings)
+  for target in targets:
+    checkFloat(f'Batch segment {s} signal {target} intercept', batchParams[s][target]['intercept'], single[target]['intercept'])
+    for period in periods:
+      checkFloat(f'Batch segment {s} signal {target} period {period} amplitude',
+                 batchParams[s][target]['coeffs'][period]['amplitude'], single[target]['coeffs'][period]['amplitude'])
+# recreate all the segments at once
+res = fourier.generateBatch(batchParams, pivot, None)
+checkSame('Batch generate shape', res.shape, batchSignals.shape)
+for s, segment in enumerate(batchSignals):
+  for tg, target in enumerate(targets):
+    checkArray(f'Batch segment {s} signal {target} replication', res[s, :, tg], segment[:, tg], float)
+
+
 
 
 print(results)
@@ -0,0 +1,154 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the evaluationCache module
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import shutil
+import tempfile
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils.evaluationCache import EvaluationCache
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+class FakeModel(object):
+  """
+    Stand-in for a Model, only the identity matters to the cache
+  """
+  def __init__(self, name):
+    """
+      Constructor
+      @ In, name, str, model name
+      @ Out, None
+    """
+    self.type = 'ExternalModel'
+    self.subType = ''
+    self.name = name
+
+class FakeFile(object):
+  """
+    Stand-in for an input File of the step
+  """
+  def __init__(self, fileName):
+    """
+      Constructor
+      @ In, fileName, str, path of the file
+      @ Out, None
+    """
+    self.fileName = fileName
+
+  def getAbsFile(self):
+    """
+      Path of the file
+      @ In, None
+      @ Out, fileName, str, path of the file
+    """
+    return self.fileName
+
+cacheDir = tempfile.mkdtemp()
+cacheFile = os.path.join(cacheDir, 'cache')
+
+model = FakeModel('model')
+point = {'x': 1.0, 'y': np.array([2.0])}
+
+# keys
+key = EvaluationCache.makeKey(model, point)
+checkTrue('key independent of variable order', key == EvaluationCache.makeKey(model, {'y': 2.0, 'x': 1.0}))
+checkTrue('key independent of integer or float', key == EvaluationCache.makeKey(model, {'x': 1, 'y': 2}))
+checkTrue('key depends on values', key != EvaluationCache.makeKey(model, {'x': 1.0, 'y': 2.0 + 1e-12}))
+checkTrue('key depends on model', key != EvaluationCache.makeKey(FakeModel('other'), point))
+checkTrue('key depends on model state', key != EvaluationCache.makeKey(model, point, 'state'))
+
+# model state
+rom = FakeModel('rom')
+rom.trainingSet = {'x': np.arange(5.0), 'y': [np.ones(3), np.zeros(3)]}
+rom.initializationOptionDict = {'name': 'rom', 'Target': 'y', 'paramInput': object()}
+state = EvaluationCache.modelFingerprint(rom)
+checkTrue('state reproducible', state == EvaluationCache.modelFingerprint(rom))
+rom.initializationOptionDict['paramInput'] = object()
+checkTrue('state independent of input nodes', state == EvaluationCache.modelFingerprint(rom))
+rom.trainingSet['y'][1][0] = 1.0
+checkTrue('state depends on training data', state != EvaluationCache.modelFingerprint(rom))
+rom.trainingSet['y'][1][0] = 0.0
+rom.initializationOptionDict['Target'] = 'z'
+checkTrue('state depends on settings', state != EvaluationCache.modelFingerprint(rom))
+inputFile = FakeFile(os.path.join(cacheDir, 'input.i'))
+with open(inputFile.getAbsFile(), 'w') as f:
+  f.write('a = 1')
+state = EvaluationCache.modelFingerprint(model, [inputFile])
+checkTrue('state depends on input files', state != EvaluationCache.modelFingerprint(model))
+with open(inputFile.getAbsFile(), 'w') as f:
+  f.write('a = 2')
+checkTrue('state depends on input file content', state != EvaluationCache.modelFingerprint(model, [inputFile]))
+
+# store and fetch
+cache = EvaluationCache(cacheFile)
+checkTrue('new cache is empty', len(cache) == 0)
+checkTrue('missing entry', cache.fetch(key) is None)
+cache.store(key, {'ans': 3.0, 'hist': np.arange(3)})
+checkTrue('stored count', cache.stored == 1)
+cache.close()
+
+# persistence across instances
+cache = EvaluationCache(cacheFile)
+checkTrue('reopened cache length', len(cache) == 1)
+outputs = cache.fetch(key)
+checkTrue('fetched scalar', outputs is not None and np.allclose(outputs['ans'], [3.0]))
+checkTrue('fetched history', outputs is not None and np.allclose(outputs['hist'], [0, 1, 2]))
+checkTrue('hit count', cache.hits == 1)
+cache.close()
+
+shutil.rmtree(cacheDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.evaluationCache</name>
+    <author>agent</author>
+    <created>2026-10-19</created>
+    <classesTested>utils.evaluationCache.EvaluationCache</classesTested>
+    <description>
+       This test performs Unit Tests for the evaluationCache module
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""
@@ -23,6 +23,7 @@ warnings.simplefilter('default',DeprecationWarning)
 
 import os,sys
 import numpy as np
+from scipy import spatial
 import xml.etree.ElementTree as ET
 frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
 sys.path.append(frameworkDir)
@@ -297,6 +298,31 @@ found,idx,entry = mathUtils.NDInArray(points,findLarge,tol=1e-8)
 checkAnswer('NDInArray %s found' %str(findLarge),int(found),1)
 checkAnswer('NDInArray %s idx' %str(findLarge),idx,0)
 checkArray('NDInArray %s entry' %str(findLarge),entry,points[0])
+# same searches through a prebuilt tree
+pointTree = spatial.cKDTree(points)
+found,idx,entry = mathUtils.NDInArray(points,findSmall,tol=1e-2,tree=pointTree)
+checkAnswer('NDInArray tree %s found' %str(findSmall),int(found),1)
+checkAnswer('NDInArray tree %s idx' %str(findSmall),idx,1)
+checkArray('NDInArray tree %s entry' %str(findSmall),entry,points[1])
+found,idx,entry = mathUtils.NDInArray(points,findSmall,tol=1e-3,tree=pointTree)
+checkAnswer('NDInArray tree %s not found' %str(findSmall),int(found),0)
+checkType('NDInArray tree %s no idx' %str(findSmall),idx,None)
+found,idx,entry = mathUtils.NDInArray(points,findLarge,tol=1e-8,tree=pointTree)
+checkAnswer('NDInArray tree %s found' %str(findLarge),int(found),1)
+checkAnswer('NDInArray tree %s idx' %str(findLarge),idx,0)
+checkArray('NDInArray tree %s entry' %str(findLarge),entry,points[0])
+
+### check "computeRandomizedSingularValueDecomposition"
+# rank-3 matrix with known singular values
+leftVectors = np.linalg.qr(np.arange(1.0,61.0).reshape(20,3)**np.array([0.5,1.0,2.0]))[0]
+rightVectors = np.linalg.qr(np.cos(np.outer(np.arange(15),[1.0,2.0,3.0])))[0]
+lowRank = (leftVectors*np.array([10.0,5.0,1.0])).dot(rightVectors.T)
+U, s, V = mathUtils.computeRandomizedSingularValueDecomposition(lowRank, 3)
+checkArray('Randomized SVD singular values', s, [10.0,5.0,1.0], tol=1e-10)
+checkArray('Randomized SVD reconstruction', (U*s).dot(V.T).ravel(), lowRank.ravel(), tol=1e-10)
+U, s, V = mathUtils.computeRandomizedSingularValueDecomposition(lowRank, 2)
+checkArray('Randomized SVD truncated singular values', s, [10.0,5.0], tol=1e-10)
+checkArray('Randomized SVD truncated shapes', U.shape+V.shape, (20,2,15,2))
 
 ### check "normalizationFactors"
 zeroList       = [0,0,0,0,0]
@@ -480,6 +506,17 @@ testVarGroup(groups,'intersect','a1')           # intersect is AND for a, d
 testVarGroup(groups,'symmdiff','a2,a3,b1')      # symdiff is XOR for a, d
 testVarGroup(groups,'symmrev','b1,a2,a3')       # symmrev shows order depends on how variables are put in
 
+### check "evalEmpiricalCDF"
+# each row should match the histogram distribution trained on that row alone, including constant signals
+np.random.seed(42)
+signals = np.vstack([np.random.randn(200), np.random.exponential(size=200), np.round(np.random.randn(200)), np.full(200, 3.0)])
+cdfs = mathUtils.evalEmpiricalCDF(signals, minBins=20)
+for s, signal in enumerate(signals):
+  dist, _ = mathUtils.trainEmpiricalFunction(signal, minBins=20)
+  checkArray('evalEmpiricalCDF row {}'.format(s), cdfs[s], dist.cdf(signal), tol=1e-12)
+dist, _ = mathUtils.trainEmpiricalFunction(signals[0])
+checkArray('evalEmpiricalCDF 1d', mathUtils.evalEmpiricalCDF(signals[0]), dist.cdf(signals[0]), tol=1e-12)
+
 
 print(results)
 
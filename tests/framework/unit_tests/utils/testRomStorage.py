@@ -0,0 +1,183 @@
+# Copyright 2017 Battelle Energy Alliance, LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+  This Module performs Unit Tests for the romStorage module
+  It cannot be considered part of the active code but of the regression test system
+"""
+
+#For future compatibility with Python 3
+from __future__ import division, print_function, unicode_literals, absolute_import
+import warnings
+warnings.simplefilter('default',DeprecationWarning)
+
+import os,sys
+import copy
+import pickle
+import shutil
+import tempfile
+import numpy as np
+
+frameworkDir = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(sys.argv[0])),os.pardir,os.pardir,os.pardir,os.pardir,'framework'))
+sys.path.append(frameworkDir)
+from utils import romStorage
+
+results = {"pass":0,"fail":0}
+
+def checkTrue(comment,res,update=True):
+  """
+    This method is a pass-through for consistency and updating
+    @ In, comment, string, a comment printed out if it fails
+    @ In, res, bool, the tested value
+    @ In, update, bool, optional, if False then don't update results counter
+    @ Out, res, bool, True if test
+  """
+  if update:
+    if res:
+      results["pass"] += 1
+    else:
+      print("checking bool",comment,'|',res,'is not True!')
+      results["fail"] += 1
+  return res
+
+def isLoaded(obj):
+  """
+    Checks if a lazily loaded sub-object has been loaded.
+    @ In, obj, object, sub-object (or its stand-in)
+    @ Out, isLoaded, bool, True if loaded
+  """
+  return not isinstance(obj, romStorage.LazyObject) or object.__getattribute__(obj, '_lazyObject') is not None
+
+class FakeROM(object):
+  """
+    Stand-in for a supervisedLearning object, possibly made of sub-ROMs
+  """
+  def __init__(self, size, subRoms=()):
+    """
+      Constructor
+      @ In, size, int, size of the coefficients array
+      @ In, subRoms, list, optional, sub-ROMs
+      @ Out, None
+    """
+    self.coeffs = np.arange(size, dtype=float)
+    self.subRoms = list(subRoms)
+    self.params = []
+
+  def evaluate(self, x):
+    """
+      Evaluates the ROM
+      @ In, x, float, evaluation point
+      @ Out, value, float, evaluation
+    """
+    return self.__evaluateLocal__(x)
+
+  def __evaluateLocal__(self, x):
+    """
+      Evaluates the ROM, called the way the supervisedLearning objects call their sub-ROMs
+      @ In, x, float, evaluation point
+      @ Out, value, float, evaluation
+    """
+    return self.coeffs.sum() * x + sum(rom.__evaluateLocal__(x) for rom in self.subRoms)
+
+  def setAdditionalParams(self, params):
+    """
+      Stores additional parameters, and passes them to the sub-ROMs
+      @ In, params, dict, parameters
+      @ Out, None
+    """
+    self.params.append(params)
+    for rom in self.subRoms:
+      rom.setAdditionalParams(params)
+
+class FakeCollection(FakeROM):
+  """
+    Stand-in for a ROMCollection, whose sub-ROMs are loaded lazily
+  """
+
+class FakeModel(object):
+  """
+    Stand-in for the ROM Model holding the supervisedLearning object
+  """
+  def __init__(self, engine):
+    """
+      Constructor
+      @ In, engine, FakeROM, the trained engine
+      @ Out, None
+    """
+    self.engine = engine
+    self.trainingSet = {'x': np.linspace(0, 1, 10000)}
+
+testDir = tempfile.mkdtemp()
+fileName = os.path.join(testDir, 'romStorage.mmrom')
+# segments made of sub-ROMs themselves, which are not collections and then not loaded lazily
+segments = [FakeROM(2000 + i, [FakeROM(3000 + i)]) for i in range(3)]
+collection = FakeCollection(5, segments)
+collection.repeated = segments[1]
+model = FakeModel(collection)
+expected = collection.evaluate(2.0)
+storageTypes = (FakeCollection,), (FakeROM,)
+
+romStorage.dump(model, fileName, *storageTypes)
+checkTrue('format detected', romStorage.isRomStorage(fileName))
+checkTrue('regular file not detected', not romStorage.isRomStorage(os.path.abspath(__file__)))
+
+loaded = romStorage.load(fileName)
+engine = loaded.engine
+checkTrue('outermost sub-object loaded', isLoaded(engine))
+checkTrue('nested sub-objects not loaded', not any(isLoaded(rom) for rom in engine.subRoms))
+checkTrue('identity preserved', engine.repeated is engine.subRoms[1])
+checkTrue('training set', np.array_equal(loaded.trainingSet['x'], model.trainingSet['x']))
+engine.setAdditionalParams({'seed': 42})
+checkTrue('params do not load sub-objects', not any(isLoaded(rom) for rom in engine.subRoms))
+checkTrue('evaluation', engine.evaluate(2.0) == expected)
+checkTrue('sub-objects loaded on use', all(isLoaded(rom) for rom in engine.subRoms))
+checkTrue('sub-objects of non-collections not lazy', not any(isinstance(rom.subRoms[0], romStorage.LazyObject) for rom in engine.subRoms))
+checkTrue('special-named methods forwarded', engine.subRoms[0].__evaluateLocal__(1.0) == segments[0].evaluate(1.0))
+checkTrue('params set once loaded', all(rom.params == [{'seed': 42}] for rom in engine.subRoms))
+checkTrue('mapped arrays are writable', engine.subRoms[0].coeffs.flags.writeable)
+
+# copies and pickles of unloaded sub-objects
+loaded = romStorage.load(fileName)
+checkTrue('separate loads', loaded.engine is not engine)
+segment = loaded.engine.subRoms[2]
+copied = copy.deepcopy(segment)
+checkTrue('deepcopy does not load', not isLoaded(segment))
+checkTrue('deepcopy evaluation', copied.evaluate(1.0) == segments[2].evaluate(1.0))
+byReference = pickle.dumps(loaded.engine)
+with romStorage.selfContained():
+  byValue = pickle.dumps(loaded.engine)
+checkTrue('pickled by reference', len(byReference) < len(byValue))
+checkTrue('unpickled by reference', pickle.loads(byReference).evaluate(2.0) == expected)
+checkTrue('unpickled by value', pickle.loads(byValue).evaluate(2.0) == expected)
+
+# writing again a lazily loaded object
+romStorage.dump(romStorage.load(fileName), fileName, *storageTypes)
+checkTrue('rewritten', romStorage.load(fileName).engine.evaluate(2.0) == expected)
+
+shutil.rmtree(testDir)
+
+print(results)
+
+sys.exit(results["fail"])
+"""
+  <TestInfo>
+    <name>framework.romStorage</name>
+    <author>agent</author>
+    <created>2026-10-19</created>
+    <classesTested>utils.romStorage</classesTested>
+    <description>
+       This test performs Unit Tests for the romStorage module
+       It cannot be considered part of the active code but of the regression test system
+    </description>
+  </TestInfo>
+"""